@@ -5,6 +5,7 @@ import os
 import re
 
 from oxygent import MAS, oxy
+from oxygent.utils.blob_utils import load_blobs
 
 sft_prompt = """
     **Your Task**
@@ -83,7 +84,8 @@ async def get_llm_node_data(mas):
     if es_response["hits"]["hits"]:
         for data in es_response["hits"]["hits"]:
             item = data["_source"]
-            llm_input = json.loads(item["input"])
+            # Large strings of node inputs are stored as blob references
+            llm_input = await load_blobs(mas.es_client, json.loads(item["input"]))
             app_node_data.append(f"""{{
                 "node_id": "{item["node_id"]}",
                 "input": {llm_input["arguments"]},
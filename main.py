@@ -2,6 +2,7 @@ import argparse
 import asyncio
 import json
 import base64
+import hashlib
 import os, sys
 from pathlib import Path
 
@@ -13,6 +14,7 @@ from prompts_config import get_agent_prompt, MASTER_AGENT_PROMPT, MULTIMODAL_AGE
 
 # OxyGent 入口
 from oxygent import MAS, Config, oxy, preset_tools, OxyRequest
+from oxygent.batch_runner import BatchRunner
 
 DEFAULT_QUERY = "https://item.jd.com/5760789.html 中的商品是否有透明窗，用是或否来回答"
 
@@ -250,12 +252,22 @@ async def run_single_query(mas: MAS, oxy_space: list, query: str | None, file_pa
 		return ""
 
 
-async def run_batch(mas, oxy_space: list, data_dir: str) -> None:
+async def run_batch(
+	mas,
+	oxy_space: list,
+	data_dir: str,
+	concurrency: int = None,
+	checkpoint_path: str = None,
+	resume: bool = False,
+) -> None:
 	"""
 	批处理模式：从 JSONL 或 JSON 加载一组完整的查询对象，执行并保存结果到result.jsonl。
 	输入格式支持：
 	- JSONL: 每行一个对象，包含 task_id, query, level, file_name 等字段
 	- JSON : 列表形式的对象数组
+	最多 concurrency 条查询并发执行，每条结果完成后立即追加到 checkpoint_path。
+	检查点缺省按输入文件内容命名；仅在 resume=True 时复用其中已成功的 task_id，
+	否则重新开始，避免修改提示词、模型或代码后误用旧答案。
 	"""
 	def load_query_objects(path: str) -> list[dict]:
 		p = Path(path)
@@ -281,23 +293,41 @@ async def run_batch(mas, oxy_space: list, data_dir: str) -> None:
 
 	data_path = Path(data_dir) / "data-cut.jsonl"
 	query_objects = load_query_objects(data_path)
+	if checkpoint_path is None:
+		# 检查点与输入文件内容绑定，输入变化时不会复用旧答案
+		input_md5 = hashlib.md5(data_path.read_bytes()).hexdigest()[:8]
+		checkpoint_path = f"result.{data_path.stem}.{input_md5}.checkpoint.jsonl"
+
+	async def handle_task(json_content: dict) -> dict:
+		# 复制一份，避免断点续跑时重复拼接文件路径
+		item = dict(json_content)
+		if item.get("file_name"):
+			item["query"] = f"请读取{data_dir}/{item['file_name']}中的内容，然后回答问题：{item['query']}"
+		# 调用mas处理当前查询
+		result = await mas.chat_with_agent(payload={"query": item["query"]})
+		# 将结果存储回json对象
+		item["answer"] = result.output.strip()
+		return item
+
+	# 有限并发执行；每完成一条就追加到检查点文件，--resume 时跳过已完成的 task_id
+	runner = BatchRunner(
+		handle_task,
+		concurrency=concurrency or Config.get_batch_concurrency(),
+		checkpoint_path=checkpoint_path,
+		is_resume=resume,
+	)
+	outputs = await runner.run(query_objects)
+	if runner.stats.skipped:
+		print(f"⚠️ 从检查点 {checkpoint_path} 复用了 {runner.stats.skipped} 条已有答案")
 	results = []
-	# 逐条处理查询
-	for json_content in query_objects:
-		try:
-			# 调用mas处理当前查询
-			if json_content["file_name"]:
-				json_content["query"] = f"请读取{data_dir}/{json_content['file_name']}中的内容，然后回答问题：{json_content['query']}"
-			result = await mas.chat_with_agent(payload={"query": json_content["query"]})
-			# 将结果存储回json对象
-			json_content["answer"] = result.output.strip()
-			results.append(json_content)
-		except Exception as e:
+	for json_content, output in zip(query_objects, outputs):
+		if "error" in output:
 			# 处理可能的错误
-			json_content["answer"] = f"处理失败: {str(e)}"
-			results.append(json_content)
+			results.append({**json_content, "answer": f"处理失败: {output['error']}"})
+		else:
+			results.append(output)
 
-	# 保存结果到result.jsonl文件
+	# 保存结果到result.jsonl文件（按输入顺序）
 	output_path = Path("result.jsonl")
 	with output_path.open("w", encoding="utf-8") as f:
 		for item in results:
@@ -306,6 +336,8 @@ async def run_batch(mas, oxy_space: list, data_dir: str) -> None:
 	# 同时在控制台输出结果（便于流水线抓取）
 	for item in results:
 		print(json.dumps(item, ensure_ascii=False))
+	# 吞吐、延迟分位数与失败数
+	print(json.dumps(runner.stats.summary(), ensure_ascii=False))
 
 
 # -----------------------------
@@ -351,6 +383,23 @@ def build_parser() -> argparse.ArgumentParser:
 		default=None,
 		help="批处理输入数据路径（.jsonl 或 .json）",
 	)
+	parser.add_argument(
+		"--concurrency",
+		type=int,
+		default=None,
+		help="批处理最大并发数（缺省使用配置 batch.concurrency）",
+	)
+	parser.add_argument(
+		"--checkpoint",
+		type=str,
+		default=None,
+		help="批处理检查点文件，每完成一条即追加写入（缺省按输入文件内容命名）",
+	)
+	parser.add_argument(
+		"--resume",
+		action="store_true",
+		help="从检查点续跑，跳过已成功的 task_id（缺省重新开始）",
+	)
 	parser.add_argument(
 		"--file_path",
 		type=str,
@@ -377,7 +426,14 @@ async def async_main() -> None:
 		elif args.mode == "batch":
 			if not args.data_dir:
 				raise SystemExit("batch 模式需要提供 --data_dir 路径（.jsonl 或 .json）")
-			await run_batch(mas, oxy_space, args.data_dir)
+			await run_batch(
+				mas,
+				oxy_space,
+				args.data_dir,
+				args.concurrency,
+				args.checkpoint,
+				args.resume,
+			)
 		else:
 			# demo
 			await run_demo(mas, oxy_space)
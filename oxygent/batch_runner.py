@@ -0,0 +1,176 @@
+"""Resumable batch execution with bounded concurrency.
+
+The :class:`BatchRunner` runs a coroutine over a list of tasks with at most
+``concurrency`` of them in flight. When a ``checkpoint_path`` is given, every
+result is appended to that JSONL file as soon as it completes, so a crash loses
+only the tasks that were running. With ``is_resume`` the tasks whose id already
+has a successful line in the checkpoint are skipped and their saved result is
+reused, with a warning; otherwise the checkpoint is started over.
+
+Each checkpoint line is the result dict with the task id under ``id_key``; a
+failed task is saved with an ``error`` field and run again on the next start.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import time
+from typing import Any, Awaitable, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class BatchStats:
+    """Counters and latencies of one batch run."""
+
+    def __init__(self, total: int):
+        self.total = total
+        self.skipped = 0
+        self.succeeded = 0
+        self.failed = 0
+        self.latencies: list = []
+        self.start_time = time.perf_counter()
+        self.end_time = None
+
+    @property
+    def elapsed(self) -> float:
+        end_time = self.end_time or time.perf_counter()
+        return end_time - self.start_time
+
+    def get_percentile(self, percentile: float) -> float:
+        if not self.latencies:
+            return 0.0
+        latencies = sorted(self.latencies)
+        index = min(len(latencies) - 1, int(len(latencies) * percentile / 100))
+        return latencies[index]
+
+    def summary(self) -> dict:
+        completed = self.succeeded + self.failed
+        return {
+            "total": self.total,
+            "skipped": self.skipped,
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+            "elapsed": round(self.elapsed, 3),
+            "throughput": round(completed / self.elapsed, 3) if self.elapsed else 0.0,
+            "latency_p50": round(self.get_percentile(50), 3),
+            "latency_p90": round(self.get_percentile(90), 3),
+            "latency_p99": round(self.get_percentile(99), 3),
+        }
+
+
+class BatchRunner:
+    """Run *handler* over tasks with a concurrency limit and a JSONL checkpoint.
+
+    Args:
+        handler (Callable): ``async handler(task) -> dict`` producing the result
+            of one task; exceptions mark the task as failed.
+        concurrency (int): Maximum number of tasks in flight.
+        checkpoint_path (str, optional): JSONL file the results are appended to.
+        id_key (str): Key of the task id in tasks and results.
+        is_resume (bool): Whether to reuse the results of the checkpoint.
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[Any], Awaitable[dict]],
+        concurrency: int = 8,
+        checkpoint_path: Optional[str] = None,
+        id_key: str = "task_id",
+        is_resume: bool = False,
+    ):
+        self.handler = handler
+        self.concurrency = max(1, concurrency)
+        self.checkpoint_path = checkpoint_path
+        self.id_key = id_key
+        self.is_resume = is_resume
+        self.stats: Optional[BatchStats] = None
+
+    def load_checkpoint(self) -> dict:
+        """Return the successful results of the checkpoint, keyed by task id."""
+        completed = {}
+        if not self.checkpoint_path or not os.path.exists(self.checkpoint_path):
+            return completed
+        with open(self.checkpoint_path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    result = json.loads(line)
+                except json.JSONDecodeError:
+                    # A line cut short by a crash
+                    continue
+                if isinstance(result, dict) and "error" not in result:
+                    completed[str(result.get(self.id_key))] = result
+        return completed
+
+    def _ends_with_newline(self) -> bool:
+        with open(self.checkpoint_path, "rb") as f:
+            f.seek(0, os.SEEK_END)
+            if f.tell() == 0:
+                return True
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) == b"\n"
+
+    async def run(self, tasks: list, get_task_id: Optional[Callable] = None) -> list:
+        """Run every task not completed yet.
+
+        Args:
+            tasks: Tasks passed to the handler.
+            get_task_id: Function returning the id of a task, defaults to
+                ``task[id_key]``.
+
+        Returns:
+            list: Results in the order of *tasks*, including the reused ones.
+        """
+        get_task_id = get_task_id or (lambda task: task[self.id_key])
+        task_ids = [str(get_task_id(task)) for task in tasks]
+        completed = self.load_checkpoint() if self.is_resume else {}
+        self.stats = stats = BatchStats(len(tasks))
+        results = [completed.get(task_id) for task_id in task_ids]
+        stats.skipped = sum(result is not None for result in results)
+        if stats.skipped:
+            logger.warning(
+                f"Reusing {stats.skipped} results of checkpoint {self.checkpoint_path}"
+            )
+
+        checkpoint = None
+        if self.checkpoint_path:
+            os.makedirs(
+                os.path.dirname(os.path.abspath(self.checkpoint_path)), exist_ok=True
+            )
+            if self.is_resume:
+                checkpoint = open(self.checkpoint_path, "a", encoding="utf-8")
+                # Start on a new line after a record cut short by a crash
+                if not self._ends_with_newline():
+                    checkpoint.write("\n")
+            else:
+                checkpoint = open(self.checkpoint_path, "w", encoding="utf-8")
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def run_one(index: int):
+            async with semaphore:
+                start_time = time.perf_counter()
+                try:
+                    result = dict(await self.handler(tasks[index]))
+                    stats.succeeded += 1
+                except Exception as e:
+                    logger.error(f"Batch task {task_ids[index]} failed: {e}")
+                    result = {"error": str(e)}
+                    stats.failed += 1
+                stats.latencies.append(time.perf_counter() - start_time)
+            result.setdefault(self.id_key, get_task_id(tasks[index]))
+            results[index] = result
+            if checkpoint is not None:
+                checkpoint.write(json.dumps(result, ensure_ascii=False) + "\n")
+                checkpoint.flush()
+
+        try:
+            await asyncio.gather(
+                *(run_one(i) for i, result in enumerate(results) if result is None)
+            )
+        finally:
+            stats.end_time = time.perf_counter()
+            if checkpoint is not None:
+                checkpoint.close()
+        logger.info(f"Batch finished: {stats.summary()}")
+        return results
@@ -70,6 +70,14 @@ class Config:
             "is_stored": False,
             "is_show_in_terminal": False,
             "is_send_full_arguments": False,
+            "stream_flush_ms": 30,
+            "stream_flush_bytes": 256,
+            "store_flush_size": 100,
+            # > 0 buffers stored messages and writes them in bulk: a message
+            # reaches ES up to this late, and buffered ones are lost on a crash
+            "store_flush_interval_ms": 0,
+            "store_max_pending": 10000,
+            "store_overflow_policy": "block",
         },
         "vearch": {},
         "es": {},
@@ -106,6 +114,72 @@ class Config:
         "tool": {
             "mcp_is_keep_alive": True,
             "is_concurrent_init": True,
+            "mcp_pool_size": 0,
+            "mcp_pool_min_size": 1,
+            "mcp_pool_session_concurrency": 1,
+            "mcp_pool_idle_timeout": 300,
+            "mcp_pool_health_check_interval": 60,
+            "mcp_pool_max_header_sets": 64,
+            "mcp_pool_max_in_flight": 0,
+            "mcp_is_manifest_cached": False,
+            "mcp_is_read_only_cached": True,
+            "mcp_result_cache_ttl": 60,
+            "mcp_result_cache_max_size": 1024,
+            "function_execution_mode": "thread",
+            "function_thread_pool_size": 8,
+            "function_process_pool_size": 2,
+            "document_max_workers": 4,
+            "document_pages_per_task": 2,
+        },
+        "blob": {
+            "is_enabled": True,
+            "min_length": 512,
+        },
+        "history_cache": {
+            "is_enabled": True,
+            "max_sessions": 1024,
+            "max_records_per_session": 256,
+            "ttl": 3600,
+        },
+        "python_sandbox": {
+            "is_enabled": True,
+            "pool_size": 2,
+            "preload_modules": ["numpy", "pandas"],
+            "timeout": 60,
+            "cpu_time_limit": 30,
+            "memory_limit": 4096,
+            "max_tasks_per_worker": 100,
+            "max_output_length": 10000,
+            "is_kernel_enabled": False,
+            "kernel_scope": "session",
+            "max_kernels": 8,
+            "kernel_ttl": 600,
+            "kernel_memory_limit": 2048,
+        },
+        "content_cache": {
+            "is_enabled": True,
+            "max_size_mb": 1024,
+        },
+        "tool_retrieval": {
+            "is_hybrid": True,
+            "lexical_confidence": 0.8,
+            "lexical_min_coverage": 0.3,
+            "vector_weight": 1.0,
+            "lexical_weight": 1.0,
+        },
+        "embedding": {
+            "batch_window_ms": 5,
+            "max_batch_size": 64,
+            "max_concurrency": 4,
+            "timeout": 60,
+        },
+        "vector_db": {
+            "max_concurrency": 8,
+            "bulk_chunk_size": 500,
+            "timeout": 30,
+        },
+        "batch": {
+            "concurrency": 8,
         },
     }
 
@@ -376,6 +450,56 @@ class Config:
     def get_message_is_send_full_arguments(cls):
         return cls.get_module_config("message", "is_send_full_arguments")
 
+    @classmethod
+    def set_message_stream_flush_ms(cls, stream_flush_ms):
+        cls.set_module_config("message", "stream_flush_ms", stream_flush_ms)
+
+    @classmethod
+    def get_message_stream_flush_ms(cls):
+        return cls.get_module_config("message", "stream_flush_ms", 30)
+
+    @classmethod
+    def set_message_stream_flush_bytes(cls, stream_flush_bytes):
+        cls.set_module_config("message", "stream_flush_bytes", stream_flush_bytes)
+
+    @classmethod
+    def get_message_stream_flush_bytes(cls):
+        return cls.get_module_config("message", "stream_flush_bytes", 256)
+
+    @classmethod
+    def set_message_store_flush_size(cls, store_flush_size):
+        cls.set_module_config("message", "store_flush_size", store_flush_size)
+
+    @classmethod
+    def get_message_store_flush_size(cls):
+        return cls.get_module_config("message", "store_flush_size", 100)
+
+    @classmethod
+    def set_message_store_flush_interval_ms(cls, store_flush_interval_ms):
+        cls.set_module_config(
+            "message", "store_flush_interval_ms", store_flush_interval_ms
+        )
+
+    @classmethod
+    def get_message_store_flush_interval_ms(cls):
+        return cls.get_module_config("message", "store_flush_interval_ms", 0)
+
+    @classmethod
+    def set_message_store_max_pending(cls, store_max_pending):
+        cls.set_module_config("message", "store_max_pending", store_max_pending)
+
+    @classmethod
+    def get_message_store_max_pending(cls):
+        return cls.get_module_config("message", "store_max_pending", 10000)
+
+    @classmethod
+    def set_message_store_overflow_policy(cls, store_overflow_policy):
+        cls.set_module_config("message", "store_overflow_policy", store_overflow_policy)
+
+    @classmethod
+    def get_message_store_overflow_policy(cls):
+        return cls.get_module_config("message", "store_overflow_policy", "block")
+
     """ es """
 
     @classmethod
@@ -603,3 +727,505 @@ class Config:
     @classmethod
     def get_tool_is_concurrent_init(cls):
         return cls.get_module_config("tool", "is_concurrent_init")
+
+    @classmethod
+    def set_tool_mcp_pool_size(cls, mcp_pool_size):
+        cls.set_module_config("tool", "mcp_pool_size", mcp_pool_size)
+
+    @classmethod
+    def get_tool_mcp_pool_size(cls):
+        return cls.get_module_config("tool", "mcp_pool_size", 0)
+
+    @classmethod
+    def set_tool_mcp_pool_min_size(cls, mcp_pool_min_size):
+        cls.set_module_config("tool", "mcp_pool_min_size", mcp_pool_min_size)
+
+    @classmethod
+    def get_tool_mcp_pool_min_size(cls):
+        return cls.get_module_config("tool", "mcp_pool_min_size", 1)
+
+    @classmethod
+    def set_tool_mcp_pool_session_concurrency(cls, mcp_pool_session_concurrency):
+        cls.set_module_config(
+            "tool", "mcp_pool_session_concurrency", mcp_pool_session_concurrency
+        )
+
+    @classmethod
+    def get_tool_mcp_pool_session_concurrency(cls):
+        return cls.get_module_config("tool", "mcp_pool_session_concurrency", 1)
+
+    @classmethod
+    def set_tool_mcp_pool_idle_timeout(cls, mcp_pool_idle_timeout):
+        cls.set_module_config("tool", "mcp_pool_idle_timeout", mcp_pool_idle_timeout)
+
+    @classmethod
+    def get_tool_mcp_pool_idle_timeout(cls):
+        return cls.get_module_config("tool", "mcp_pool_idle_timeout", 300)
+
+    @classmethod
+    def set_tool_mcp_pool_health_check_interval(cls, mcp_pool_health_check_interval):
+        cls.set_module_config(
+            "tool", "mcp_pool_health_check_interval", mcp_pool_health_check_interval
+        )
+
+    @classmethod
+    def get_tool_mcp_pool_health_check_interval(cls):
+        return cls.get_module_config("tool", "mcp_pool_health_check_interval", 60)
+
+    @classmethod
+    def set_tool_mcp_pool_max_header_sets(cls, mcp_pool_max_header_sets):
+        cls.set_module_config("tool", "mcp_pool_max_header_sets", mcp_pool_max_header_sets)
+
+    @classmethod
+    def get_tool_mcp_pool_max_header_sets(cls):
+        return cls.get_module_config("tool", "mcp_pool_max_header_sets", 64)
+
+    @classmethod
+    def set_tool_mcp_pool_max_in_flight(cls, mcp_pool_max_in_flight):
+        cls.set_module_config("tool", "mcp_pool_max_in_flight", mcp_pool_max_in_flight)
+
+    @classmethod
+    def get_tool_mcp_pool_max_in_flight(cls):
+        return cls.get_module_config("tool", "mcp_pool_max_in_flight", 0)
+
+    @classmethod
+    def set_tool_mcp_is_manifest_cached(cls, mcp_is_manifest_cached=True):
+        cls.set_module_config("tool", "mcp_is_manifest_cached", mcp_is_manifest_cached)
+
+    @classmethod
+    def get_tool_mcp_is_manifest_cached(cls):
+        return cls.get_module_config("tool", "mcp_is_manifest_cached", False)
+
+    @classmethod
+    def set_tool_mcp_is_read_only_cached(cls, mcp_is_read_only_cached):
+        cls.set_module_config("tool", "mcp_is_read_only_cached", mcp_is_read_only_cached)
+
+    @classmethod
+    def get_tool_mcp_is_read_only_cached(cls):
+        return cls.get_module_config("tool", "mcp_is_read_only_cached", True)
+
+    @classmethod
+    def set_tool_mcp_result_cache_ttl(cls, mcp_result_cache_ttl):
+        cls.set_module_config("tool", "mcp_result_cache_ttl", mcp_result_cache_ttl)
+
+    @classmethod
+    def get_tool_mcp_result_cache_ttl(cls):
+        return cls.get_module_config("tool", "mcp_result_cache_ttl", 60)
+
+    @classmethod
+    def set_tool_mcp_result_cache_max_size(cls, mcp_result_cache_max_size):
+        cls.set_module_config(
+            "tool", "mcp_result_cache_max_size", mcp_result_cache_max_size
+        )
+
+    @classmethod
+    def get_tool_mcp_result_cache_max_size(cls):
+        return cls.get_module_config("tool", "mcp_result_cache_max_size", 1024)
+
+    @classmethod
+    def set_tool_function_execution_mode(cls, function_execution_mode):
+        cls.set_module_config("tool", "function_execution_mode", function_execution_mode)
+
+    @classmethod
+    def get_tool_function_execution_mode(cls):
+        return cls.get_module_config("tool", "function_execution_mode", "thread")
+
+    @classmethod
+    def set_tool_function_thread_pool_size(cls, function_thread_pool_size):
+        cls.set_module_config(
+            "tool", "function_thread_pool_size", function_thread_pool_size
+        )
+
+    @classmethod
+    def get_tool_function_thread_pool_size(cls):
+        return cls.get_module_config("tool", "function_thread_pool_size", 8)
+
+    @classmethod
+    def set_tool_function_process_pool_size(cls, function_process_pool_size):
+        cls.set_module_config(
+            "tool", "function_process_pool_size", function_process_pool_size
+        )
+
+    @classmethod
+    def get_tool_function_process_pool_size(cls):
+        return cls.get_module_config("tool", "function_process_pool_size", 2)
+
+    @classmethod
+    def set_tool_document_max_workers(cls, document_max_workers):
+        cls.set_module_config("tool", "document_max_workers", document_max_workers)
+
+    @classmethod
+    def get_tool_document_max_workers(cls):
+        return cls.get_module_config("tool", "document_max_workers", 4)
+
+    @classmethod
+    def set_tool_document_pages_per_task(cls, document_pages_per_task):
+        cls.set_module_config(
+            "tool", "document_pages_per_task", document_pages_per_task
+        )
+
+    @classmethod
+    def get_tool_document_pages_per_task(cls):
+        return cls.get_module_config("tool", "document_pages_per_task", 2)
+
+    """ blob """
+
+    @classmethod
+    def set_blob_config(cls, blob_config):
+        cls.set_module_config("blob", blob_config)
+
+    @classmethod
+    def get_blob_config(cls):
+        return cls.get_module_config("blob")
+
+    @classmethod
+    def set_blob_is_enabled(cls, is_enabled=True):
+        cls.set_module_config("blob", "is_enabled", is_enabled)
+
+    @classmethod
+    def get_blob_is_enabled(cls):
+        return cls.get_module_config("blob", "is_enabled", True)
+
+    @classmethod
+    def set_blob_min_length(cls, min_length):
+        cls.set_module_config("blob", "min_length", min_length)
+
+    @classmethod
+    def get_blob_min_length(cls):
+        return cls.get_module_config("blob", "min_length", 512)
+
+    """ history_cache """
+
+    @classmethod
+    def set_history_cache_config(cls, history_cache_config):
+        cls.set_module_config("history_cache", history_cache_config)
+
+    @classmethod
+    def get_history_cache_config(cls):
+        return cls.get_module_config("history_cache")
+
+    @classmethod
+    def set_history_cache_is_enabled(cls, is_enabled=True):
+        cls.set_module_config("history_cache", "is_enabled", is_enabled)
+
+    @classmethod
+    def get_history_cache_is_enabled(cls):
+        return cls.get_module_config("history_cache", "is_enabled", True)
+
+    @classmethod
+    def set_history_cache_max_sessions(cls, max_sessions):
+        cls.set_module_config("history_cache", "max_sessions", max_sessions)
+
+    @classmethod
+    def get_history_cache_max_sessions(cls):
+        return cls.get_module_config("history_cache", "max_sessions", 1024)
+
+    @classmethod
+    def set_history_cache_max_records_per_session(cls, max_records_per_session):
+        cls.set_module_config(
+            "history_cache", "max_records_per_session", max_records_per_session
+        )
+
+    @classmethod
+    def get_history_cache_max_records_per_session(cls):
+        return cls.get_module_config("history_cache", "max_records_per_session", 256)
+
+    @classmethod
+    def set_history_cache_ttl(cls, ttl):
+        cls.set_module_config("history_cache", "ttl", ttl)
+
+    @classmethod
+    def get_history_cache_ttl(cls):
+        return cls.get_module_config("history_cache", "ttl", 3600)
+
+    """ python_sandbox """
+
+    @classmethod
+    def set_python_sandbox_config(cls, python_sandbox_config):
+        cls.set_module_config("python_sandbox", python_sandbox_config)
+
+    @classmethod
+    def get_python_sandbox_config(cls):
+        return cls.get_module_config("python_sandbox")
+
+    @classmethod
+    def set_python_sandbox_is_enabled(cls, is_enabled=True):
+        cls.set_module_config("python_sandbox", "is_enabled", is_enabled)
+
+    @classmethod
+    def get_python_sandbox_is_enabled(cls):
+        return cls.get_module_config("python_sandbox", "is_enabled", True)
+
+    @classmethod
+    def set_python_sandbox_pool_size(cls, pool_size):
+        cls.set_module_config("python_sandbox", "pool_size", pool_size)
+
+    @classmethod
+    def get_python_sandbox_pool_size(cls):
+        return cls.get_module_config("python_sandbox", "pool_size", 2)
+
+    @classmethod
+    def set_python_sandbox_preload_modules(cls, preload_modules):
+        cls.set_module_config("python_sandbox", "preload_modules", preload_modules)
+
+    @classmethod
+    def get_python_sandbox_preload_modules(cls):
+        return cls.get_module_config("python_sandbox", "preload_modules", [])
+
+    @classmethod
+    def set_python_sandbox_timeout(cls, timeout):
+        cls.set_module_config("python_sandbox", "timeout", timeout)
+
+    @classmethod
+    def get_python_sandbox_timeout(cls):
+        return cls.get_module_config("python_sandbox", "timeout", 60)
+
+    @classmethod
+    def set_python_sandbox_cpu_time_limit(cls, cpu_time_limit):
+        cls.set_module_config("python_sandbox", "cpu_time_limit", cpu_time_limit)
+
+    @classmethod
+    def get_python_sandbox_cpu_time_limit(cls):
+        return cls.get_module_config("python_sandbox", "cpu_time_limit", 30)
+
+    @classmethod
+    def set_python_sandbox_memory_limit(cls, memory_limit):
+        cls.set_module_config("python_sandbox", "memory_limit", memory_limit)
+
+    @classmethod
+    def get_python_sandbox_memory_limit(cls):
+        return cls.get_module_config("python_sandbox", "memory_limit", 4096)
+
+    @classmethod
+    def set_python_sandbox_max_tasks_per_worker(cls, max_tasks_per_worker):
+        cls.set_module_config(
+            "python_sandbox", "max_tasks_per_worker", max_tasks_per_worker
+        )
+
+    @classmethod
+    def get_python_sandbox_max_tasks_per_worker(cls):
+        return cls.get_module_config("python_sandbox", "max_tasks_per_worker", 100)
+
+    @classmethod
+    def set_python_sandbox_max_output_length(cls, max_output_length):
+        cls.set_module_config(
+            "python_sandbox", "max_output_length", max_output_length
+        )
+
+    @classmethod
+    def get_python_sandbox_max_output_length(cls):
+        return cls.get_module_config("python_sandbox", "max_output_length", 10000)
+
+    @classmethod
+    def set_python_sandbox_is_kernel_enabled(cls, is_kernel_enabled=True):
+        cls.set_module_config("python_sandbox", "is_kernel_enabled", is_kernel_enabled)
+
+    @classmethod
+    def get_python_sandbox_is_kernel_enabled(cls):
+        return cls.get_module_config("python_sandbox", "is_kernel_enabled", False)
+
+    @classmethod
+    def set_python_sandbox_kernel_scope(cls, kernel_scope):
+        cls.set_module_config("python_sandbox", "kernel_scope", kernel_scope)
+
+    @classmethod
+    def get_python_sandbox_kernel_scope(cls):
+        return cls.get_module_config("python_sandbox", "kernel_scope", "session")
+
+    @classmethod
+    def set_python_sandbox_max_kernels(cls, max_kernels):
+        cls.set_module_config("python_sandbox", "max_kernels", max_kernels)
+
+    @classmethod
+    def get_python_sandbox_max_kernels(cls):
+        return cls.get_module_config("python_sandbox", "max_kernels", 8)
+
+    @classmethod
+    def set_python_sandbox_kernel_ttl(cls, kernel_ttl):
+        cls.set_module_config("python_sandbox", "kernel_ttl", kernel_ttl)
+
+    @classmethod
+    def get_python_sandbox_kernel_ttl(cls):
+        return cls.get_module_config("python_sandbox", "kernel_ttl", 600)
+
+    @classmethod
+    def set_python_sandbox_kernel_memory_limit(cls, kernel_memory_limit):
+        cls.set_module_config(
+            "python_sandbox", "kernel_memory_limit", kernel_memory_limit
+        )
+
+    @classmethod
+    def get_python_sandbox_kernel_memory_limit(cls):
+        return cls.get_module_config("python_sandbox", "kernel_memory_limit", 2048)
+
+    """ content_cache """
+
+    @classmethod
+    def set_content_cache_config(cls, content_cache_config):
+        cls.set_module_config("content_cache", content_cache_config)
+
+    @classmethod
+    def get_content_cache_config(cls):
+        return cls.get_module_config("content_cache")
+
+    @classmethod
+    def set_content_cache_is_enabled(cls, is_enabled=True):
+        cls.set_module_config("content_cache", "is_enabled", is_enabled)
+
+    @classmethod
+    def get_content_cache_is_enabled(cls):
+        return cls.get_module_config("content_cache", "is_enabled", True)
+
+    @classmethod
+    def set_content_cache_max_size_mb(cls, max_size_mb):
+        cls.set_module_config("content_cache", "max_size_mb", max_size_mb)
+
+    @classmethod
+    def get_content_cache_max_size_mb(cls):
+        return cls.get_module_config("content_cache", "max_size_mb", 1024)
+
+    """ tool_retrieval """
+
+    @classmethod
+    def set_tool_retrieval_config(cls, tool_retrieval_config):
+        cls.set_module_config("tool_retrieval", tool_retrieval_config)
+
+    @classmethod
+    def get_tool_retrieval_config(cls):
+        return cls.get_module_config("tool_retrieval")
+
+    @classmethod
+    def set_tool_retrieval_is_hybrid(cls, is_hybrid=True):
+        cls.set_module_config("tool_retrieval", "is_hybrid", is_hybrid)
+
+    @classmethod
+    def get_tool_retrieval_is_hybrid(cls):
+        return cls.get_module_config("tool_retrieval", "is_hybrid", True)
+
+    @classmethod
+    def set_tool_retrieval_lexical_confidence(cls, lexical_confidence):
+        cls.set_module_config("tool_retrieval", "lexical_confidence", lexical_confidence)
+
+    @classmethod
+    def get_tool_retrieval_lexical_confidence(cls):
+        return cls.get_module_config("tool_retrieval", "lexical_confidence", 0.8)
+
+    @classmethod
+    def set_tool_retrieval_lexical_min_coverage(cls, lexical_min_coverage):
+        cls.set_module_config(
+            "tool_retrieval", "lexical_min_coverage", lexical_min_coverage
+        )
+
+    @classmethod
+    def get_tool_retrieval_lexical_min_coverage(cls):
+        return cls.get_module_config("tool_retrieval", "lexical_min_coverage", 0.3)
+
+    @classmethod
+    def set_tool_retrieval_vector_weight(cls, vector_weight):
+        cls.set_module_config("tool_retrieval", "vector_weight", vector_weight)
+
+    @classmethod
+    def get_tool_retrieval_vector_weight(cls):
+        return cls.get_module_config("tool_retrieval", "vector_weight", 1.0)
+
+    @classmethod
+    def set_tool_retrieval_lexical_weight(cls, lexical_weight):
+        cls.set_module_config("tool_retrieval", "lexical_weight", lexical_weight)
+
+    @classmethod
+    def get_tool_retrieval_lexical_weight(cls):
+        return cls.get_module_config("tool_retrieval", "lexical_weight", 1.0)
+
+    """ embedding """
+
+    @classmethod
+    def set_embedding_config(cls, embedding_config):
+        cls.set_module_config("embedding", embedding_config)
+
+    @classmethod
+    def get_embedding_config(cls):
+        return cls.get_module_config("embedding")
+
+    @classmethod
+    def set_embedding_batch_window_ms(cls, batch_window_ms):
+        cls.set_module_config("embedding", "batch_window_ms", batch_window_ms)
+
+    @classmethod
+    def get_embedding_batch_window_ms(cls):
+        return cls.get_module_config("embedding", "batch_window_ms", 5)
+
+    @classmethod
+    def set_embedding_max_batch_size(cls, max_batch_size):
+        cls.set_module_config("embedding", "max_batch_size", max_batch_size)
+
+    @classmethod
+    def get_embedding_max_batch_size(cls):
+        return cls.get_module_config("embedding", "max_batch_size", 64)
+
+    @classmethod
+    def set_embedding_max_concurrency(cls, max_concurrency):
+        cls.set_module_config("embedding", "max_concurrency", max_concurrency)
+
+    @classmethod
+    def get_embedding_max_concurrency(cls):
+        return cls.get_module_config("embedding", "max_concurrency", 4)
+
+    @classmethod
+    def set_embedding_timeout(cls, timeout):
+        cls.set_module_config("embedding", "timeout", timeout)
+
+    @classmethod
+    def get_embedding_timeout(cls):
+        return cls.get_module_config("embedding", "timeout", 60)
+
+    """ vector_db """
+
+    @classmethod
+    def set_vector_db_config(cls, vector_db_config):
+        cls.set_module_config("vector_db", vector_db_config)
+
+    @classmethod
+    def get_vector_db_config(cls):
+        return cls.get_module_config("vector_db")
+
+    @classmethod
+    def set_vector_db_max_concurrency(cls, max_concurrency):
+        cls.set_module_config("vector_db", "max_concurrency", max_concurrency)
+
+    @classmethod
+    def get_vector_db_max_concurrency(cls):
+        return cls.get_module_config("vector_db", "max_concurrency", 8)
+
+    @classmethod
+    def set_vector_db_bulk_chunk_size(cls, bulk_chunk_size):
+        cls.set_module_config("vector_db", "bulk_chunk_size", bulk_chunk_size)
+
+    @classmethod
+    def get_vector_db_bulk_chunk_size(cls):
+        return cls.get_module_config("vector_db", "bulk_chunk_size", 500)
+
+    @classmethod
+    def set_vector_db_timeout(cls, timeout):
+        cls.set_module_config("vector_db", "timeout", timeout)
+
+    @classmethod
+    def get_vector_db_timeout(cls):
+        return cls.get_module_config("vector_db", "timeout", 30)
+
+    """ batch """
+
+    @classmethod
+    def set_batch_config(cls, batch_config):
+        cls.set_module_config("batch", batch_config)
+
+    @classmethod
+    def get_batch_config(cls):
+        return cls.get_module_config("batch")
+
+    @classmethod
+    def set_batch_concurrency(cls, concurrency):
+        cls.set_module_config("batch", "concurrency", concurrency)
+
+    @classmethod
+    def get_batch_concurrency(cls):
+        return cls.get_module_config("batch", "concurrency", 8)
@@ -1,7 +1,9 @@
+from .bulk_writer import BulkWriter
 from .jes_es import JesEs
 from .local_es import LocalEs
 
 __all__ = [
+    "BulkWriter",
     "JesEs",
     "LocalEs",
 ]
@@ -52,6 +52,22 @@ class BaseEs(BaseDB, ABC):
         """
         pass
 
+    async def bulk_index(self, index_name, docs):
+        """Index several documents in one operation.
+
+        Backends without a bulk API fall back to one :meth:`index` per document.
+
+        Args:
+            index_name: Name of the index to store the documents
+            docs: List of ``(doc_id, body)`` pairs
+
+        Returns:
+            Number of indexed documents
+        """
+        for doc_id, body in docs:
+            await self.index(index_name, doc_id, body)
+        return len(docs)
+
     @abstractmethod
     async def update(self, index_name, doc_id, body):
         pass
@@ -0,0 +1,144 @@
+"""bulk_writer.py Buffered Elasticsearch Writer Module.
+
+This file implements an in-process write buffer in front of an Elasticsearch client.
+Documents are queued without touching storage and written by a background task
+with one bulk request per batch, once ``flush_size`` documents are queued or
+``flush_interval_ms`` has passed.
+
+The buffer is bounded. When it is full, the ``overflow_policy`` decides:
+
+* ``block``: the caller waits until the next flush frees room (backpressure).
+* ``drop_oldest``: the oldest queued document is discarded.
+* ``drop_newest``: the new document is discarded.
+
+Queued documents only live in memory: they become visible up to
+``flush_interval_ms`` after being added and are lost if the process crashes.
+"""
+
+import asyncio
+import logging
+from collections import deque
+
+logger = logging.getLogger(__name__)
+
+OVERFLOW_POLICIES = ("block", "drop_oldest", "drop_newest")
+
+
+class BulkWriter:
+    """Buffer documents and write them to Elasticsearch in bulk.
+
+    Args:
+        es_client: Client providing ``bulk_index(index_name, docs)``
+        flush_size (int): Number of queued documents that triggers a flush.
+        flush_interval_ms (float): Longest time a document waits in the buffer.
+        max_pending (int): Maximum number of queued documents.
+        overflow_policy (str): One of ``block``, ``drop_oldest``, ``drop_newest``.
+    """
+
+    def __init__(
+        self,
+        es_client,
+        flush_size: int = 100,
+        flush_interval_ms: float = 200,
+        max_pending: int = 10000,
+        overflow_policy: str = "block",
+    ):
+        if overflow_policy not in OVERFLOW_POLICIES:
+            raise ValueError(
+                f"overflow_policy must be one of {OVERFLOW_POLICIES}, "
+                f"got {overflow_policy!r}"
+            )
+        self.es_client = es_client
+        self.flush_size = flush_size
+        self.flush_interval = flush_interval_ms / 1000
+        self.max_pending = max(max_pending, flush_size)
+        self.overflow_policy = overflow_policy
+        self._pending = deque()  # (index_name, doc_id, body)
+        self._has_work = None
+        self._has_room = None
+        self._task = None
+        self._is_closed = False
+        self.written_count = 0
+        self.dropped_count = 0
+        self.failed_count = 0
+        self.flush_count = 0
+
+    @property
+    def pending_count(self):
+        return len(self._pending)
+
+    def _start(self):
+        # Created on first use, so the writer binds to the loop that uses it
+        if self._task is None:
+            self._has_work = asyncio.Event()
+            self._has_room = asyncio.Event()
+            self._task = asyncio.create_task(self._run())
+
+    async def add(self, index_name, doc_id, body):
+        """Queue a document; only waits when the buffer is full under ``block``.
+
+        Returns:
+            bool: False if the document was dropped
+        """
+        if self._is_closed:
+            # Nothing flushes anymore, so write through
+            await self.es_client.index(index_name, doc_id=doc_id, body=body)
+            return True
+        self._start()
+        while len(self._pending) >= self.max_pending:
+            if self.overflow_policy == "drop_newest":
+                self.dropped_count += 1
+                return False
+            if self.overflow_policy == "drop_oldest":
+                self._pending.popleft()
+                self.dropped_count += 1
+                break
+            self._has_work.set()
+            self._has_room.clear()
+            await self._has_room.wait()
+        self._pending.append((index_name, doc_id, body))
+        if len(self._pending) >= self.flush_size:
+            self._has_work.set()
+        return True
+
+    async def flush(self):
+        """Write every queued document now."""
+        while self._pending:
+            batch = [
+                self._pending.popleft()
+                for _ in range(min(self.flush_size, len(self._pending)))
+            ]
+            if self._has_room is not None:
+                self._has_room.set()
+            by_index = {}
+            for index_name, doc_id, body in batch:
+                by_index.setdefault(index_name, []).append((doc_id, body))
+            for index_name, docs in by_index.items():
+                try:
+                    written = await self.es_client.bulk_index(index_name, docs)
+                except Exception as e:
+                    logger.error(f"Bulk write of {len(docs)} docs to {index_name}: {e}")
+                    written = None
+                # The retry wrapper of the clients returns None on failure
+                written = written or 0
+                self.written_count += written
+                self.failed_count += len(docs) - written
+            self.flush_count += 1
+
+    async def close(self):
+        """Stop the background task and write what is left."""
+        self._is_closed = True
+        if self._task is not None:
+            self._has_work.set()
+            await self._task
+            self._task = None
+        await self.flush()
+
+    async def _run(self):
+        while not self._is_closed:
+            try:
+                await asyncio.wait_for(self._has_work.wait(), self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._has_work.clear()
+            await self.flush()
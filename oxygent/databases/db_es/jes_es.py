@@ -71,6 +71,18 @@ class JesEs(BaseEs):
     async def index(self, index_name, doc_id, body):
         return await self.client.index(index=index_name, id=doc_id, body=body)
 
+    async def bulk_index(self, index_name, docs):
+        operations = []
+        for doc_id, body in docs:
+            operations.append({"index": {"_index": index_name, "_id": doc_id}})
+            operations.append(body)
+        response = await self.client.bulk(body=operations)
+        if response.get("errors"):
+            failed = sum("error" in item["index"] for item in response["items"])
+            logger.error(f"Bulk index into {index_name} failed for {failed} docs")
+            return len(docs) - failed
+        return len(docs)
+
     async def update(self, index_name, doc_id, body):
         return await self.client.update(index=index_name, id=doc_id, body={"doc": body})
 
@@ -126,6 +126,17 @@ class LocalEs(BaseEs):
         *,
         update_mode: bool,
     ) -> dict[str, str]:
+        await self._insert_many(index_name, [(doc_id, body)], update_mode=update_mode)
+        return {"_id": doc_id, "result": "updated" if update_mode else "created"}
+
+    async def _insert_many(
+        self,
+        index_name: str,
+        docs: list[tuple[str, dict[str, Any]]],
+        *,
+        update_mode: bool,
+    ) -> None:
+        """Apply all *docs* with a single read and a single atomic write."""
         data_path = self._index_path(index_name)
         backup_path = f"{data_path}.bak"
 
@@ -149,23 +160,28 @@ class LocalEs(BaseEs):
                 data = {}
 
             # --- apply mutation ---
-            if update_mode:
-                merged = data.get(doc_id, {})
-                merged.update(body)
-                data[doc_id] = merged
-            else:
-                data[doc_id] = body
+            for doc_id, body in docs:
+                if update_mode:
+                    merged = data.get(doc_id, {})
+                    merged.update(body)
+                    data[doc_id] = merged
+                else:
+                    data[doc_id] = body
 
             # --- backup & persist ---
             if await aiofiles.os.path.exists(data_path):
                 await aiofiles.os.replace(data_path, backup_path)
             await self._write_json_atomic(data_path, data)
 
-        return {"_id": doc_id, "result": "updated" if update_mode else "created"}
-
     async def index(self, index_name: str, doc_id: str, body: dict[str, Any]):
         return await self.insert(index_name, doc_id, body, update_mode=False)
 
+    async def bulk_index(
+        self, index_name: str, docs: list[tuple[str, dict[str, Any]]]
+    ) -> int:
+        await self._insert_many(index_name, list(docs), update_mode=False)
+        return len(docs)
+
     async def update(self, index_name: str, doc_id: str, body: dict[str, Any]):
         return await self.insert(index_name, doc_id, body, update_mode=True)
 
@@ -16,6 +16,7 @@ from aioredis import Redis
 from aioredis.exceptions import ConnectionError, TimeoutError
 
 from ...config import Config
+from .key_notifier import KeyNotifier
 
 logger = logging.getLogger(__name__)
 
@@ -75,6 +76,7 @@ class JimdbApRedis:
         self.default_expire_time = Config.get_redis_expire_time()
         self.default_list_max_size = Config.get_redis_max_size()
         self.default_list_max_length = Config.get_redis_max_length() * 1024
+        self._notifier = KeyNotifier()
 
         # Initialize Redis connection pool
         try:
@@ -257,6 +259,7 @@ class JimdbApRedis:
             pipe.expire(key, ex)
 
             results = await pipe.execute()
+            self._notifier.notify(key)
             return results[0]
 
     async def rpop(self, key: str):  # Waiting for 1 sec for default
@@ -271,26 +274,37 @@ class JimdbApRedis:
         return await self.redis_pool.rpop(key)
 
     # @retry_decorator
-    async def brpop(self, key: str, timeout=1):  # Waiting for 1 sec for default
+    async def brpop(self, key: str, timeout=1, poll_interval=0.1):
         """Blocking pop operation that removes and returns the last element of a list.
 
-        NOTE: Since JimDB doesn't support brpop, this implementation simulates
-        blocking behavior using rpop with sleep fallback.
+        NOTE: Since JimDB doesn't support brpop, and a blocking command per waiting
+        consumer would pin one pooled connection each, this implementation pops
+        with rpop and sleeps until a push from this process wakes it up. Pushes
+        from other processes are picked up by retrying rpop every *poll_interval*.
 
         Args:
             key: The list key to pop from
-            timeout: Maximum time to wait in seconds (default: 1)
+            timeout: Maximum time to wait in seconds, 0 to wait forever (default: 1)
+            poll_interval: Maximum time between two rpop attempts in seconds
+                (default: 0.1)
 
         Returns:
             Optional[bytes]: The response of the simulated brpop operation
         """
-        # Simulating brpop
-        value = await self.redis_pool.rpop(key)
-        if value is not None:
-            return value
-        else:  # Simulating blocking by sleeping and trying again
-            await asyncio.sleep(timeout)
-            return await self.redis_pool.rpop(key)
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout if timeout else None
+        with self._notifier.watch(key):
+            while True:
+                version = self._notifier.get_version(key)
+                value = await self.redis_pool.rpop(key)
+                if value is not None:
+                    return value
+                remaining = None if deadline is None else deadline - loop.time()
+                if remaining is not None and remaining <= 0:
+                    return None
+                if remaining is not None:
+                    poll_interval = min(poll_interval, remaining)
+                await self._notifier.wait(key, version, poll_interval)
 
     @retry_decorator
     async def lrange(self, key: str, start: int = 0, end: int = -1):
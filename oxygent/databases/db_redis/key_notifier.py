@@ -0,0 +1,79 @@
+"""key_notifier.py List Push Notification Module.
+
+This file implements the in-process wake-ups behind the blocking pops of the
+Key-value clients: a push to a list notifies the tasks waiting on that key, so
+consumers neither poll nor sleep while the list is empty.
+"""
+
+import asyncio
+from contextlib import contextmanager
+from typing import Dict, Optional, Set
+
+
+class KeyNotifier:
+    """Wake up the tasks waiting for a push on a key.
+
+    Each watched key has a version counter bumped by :meth:`notify`. A consumer
+    reads the version before trying to pop and passes it to :meth:`wait`, which
+    returns at once if a push happened in between, so no wake-up is lost.
+
+    Keys are only tracked while a consumer is inside :meth:`watch`, so the state
+    does not grow with the number of keys ever pushed.
+    """
+
+    def __init__(self):
+        self._versions: Dict[str, int] = {}
+        self._watchers: Dict[str, int] = {}
+        self._waiters: Dict[str, Set[asyncio.Future]] = {}
+
+    @contextmanager
+    def watch(self, key: str):
+        """Track pushes on *key* while the caller is consuming it."""
+        self._watchers[key] = self._watchers.get(key, 0) + 1
+        try:
+            yield
+        finally:
+            self._watchers[key] -= 1
+            if not self._watchers[key]:
+                del self._watchers[key]
+                self._versions.pop(key, None)
+
+    def get_version(self, key: str) -> int:
+        return self._versions.get(key, 0)
+
+    def notify(self, key: str):
+        """Record a push on *key* and wake up all of its waiters."""
+        if key not in self._watchers:
+            return
+        self._versions[key] = self._versions.get(key, 0) + 1
+        for waiter in self._waiters.pop(key, ()):
+            if not waiter.done():
+                waiter.set_result(None)
+
+    async def wait(self, key: str, version: int, timeout: Optional[float]) -> bool:
+        """Wait until *key* is pushed after *version* was read.
+
+        Args:
+            key: The list key to watch
+            version: Value of :meth:`get_version` read before the empty pop, within
+                :meth:`watch`
+            timeout: Maximum time to wait in seconds, None to wait forever
+
+        Returns:
+            bool: True if a push happened, False on timeout
+        """
+        if self.get_version(key) != version:
+            return True
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.setdefault(key, set()).add(waiter)
+        try:
+            await asyncio.wait_for(waiter, timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            waiters = self._waiters.get(key)
+            if waiters is not None:
+                waiters.discard(waiter)
+                if not waiters:
+                    del self._waiters[key]
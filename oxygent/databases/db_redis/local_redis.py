@@ -12,6 +12,7 @@ from collections import deque
 from typing import Dict, Optional, Union
 
 from ...config import Config
+from .key_notifier import KeyNotifier
 
 
 class LocalRedis:
@@ -25,6 +26,7 @@ class LocalRedis:
     - In-memory key-value storage using deques for list operations
     - Automatic expiration handling with TTL support
     - List operations with configurable size limits
+    - Blocking pops woken up by pushes instead of polling
     - Value type validation and conversion
     """
 
@@ -36,6 +38,7 @@ class LocalRedis:
         self.default_list_max_length = Config.get_redis_max_length() * 1024
         # When True, each mutating/read pop yields the event loop once for fairness.
         self._yield_on_ops = yield_on_ops
+        self._notifier = KeyNotifier()
 
     async def lpush(
         self,
@@ -99,6 +102,7 @@ class LocalRedis:
             reversed(new_values)
         )  # Use reserved to ensure proper order
         self.expiry[key] = time.time() + ex
+        self._notifier.notify(key)
 
         if self._yield_on_ops:
             await asyncio.sleep(0)
@@ -136,6 +140,34 @@ class LocalRedis:
             await asyncio.sleep(0)
         return None
 
+    async def brpop(
+        self, key: str, timeout: float = 1
+    ) -> Union[str, bytes, int, float, None]:
+        """Blocking pop that removes and returns the last element of a list.
+
+        Unlike polling with :meth:`rpop`, the caller sleeps until a push on *key*
+        wakes it up, so an element is returned as soon as it is pushed.
+
+        Args:
+            key: The list key to pop from
+            timeout: Maximum time to wait in seconds, 0 to wait forever (default: 1)
+
+        Returns:
+            The removed element, or None if the timeout was reached
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout if timeout else None
+        with self._notifier.watch(key):
+            while True:
+                version = self._notifier.get_version(key)
+                item = await self.rpop(key)
+                if item is not None:
+                    return item
+                remaining = None if deadline is None else deadline - loop.time()
+                if remaining is not None and remaining <= 0:
+                    return None
+                await self._notifier.wait(key, version, remaining)
+
     def _check_expiry(self, key: str):
         """Check if a key has expired and remove it if necessary.
 
@@ -1,7 +1,9 @@
 from .base_vector_db import BaseVectorDB
+from .local_vector_db import LocalVectorDB
 from .vearch_db import VearchDB
 
 __all__ = [
     "BaseVectorDB",
+    "LocalVectorDB",
     "VearchDB",
 ]
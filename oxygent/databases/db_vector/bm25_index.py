@@ -0,0 +1,142 @@
+"""bm25_index.py Lexical Index Module.
+
+This file implements a small in-memory inverted index scored with Okapi BM25, used
+next to vector search to catch exact tool names and keywords, and the reciprocal
+rank fusion that merges lexical and vector rankings.
+"""
+
+import math
+import re
+from collections import Counter, defaultdict
+
+_WORD_PATTERN = re.compile(r"[a-z0-9]+|[一-鿿]+")
+_CAMEL_CASE_PATTERN = re.compile(r"(?<=[a-z0-9])(?=[A-Z])")
+
+
+def tokenize(text):
+    """Split text into lowercase terms.
+
+    Latin words are split on ``snake_case`` and ``camelCase`` boundaries. Chinese
+    text has no spaces, so each run of characters yields its unigrams and bigrams.
+
+    Args:
+        text: Text to tokenize
+
+    Returns:
+        list: Terms of the text, with repetitions
+    """
+    terms = []
+    for word in _WORD_PATTERN.findall(_CAMEL_CASE_PATTERN.sub(" ", text).lower()):
+        if word[0] >= "一":
+            terms.extend(word)
+            terms.extend(word[i : i + 2] for i in range(len(word) - 1))
+        else:
+            terms.append(word)
+    return terms
+
+
+class BM25Index(object):
+    """Inverted index of short documents scored with Okapi BM25.
+
+    Args:
+        k1: Term frequency saturation
+        b: Document length normalization
+    """
+
+    def __init__(self, k1=1.2, b=0.75):
+        self.k1 = k1
+        self.b = b
+        self.postings = defaultdict(dict)  # term -> {doc_id: term frequency}
+        self.doc_lengths = {}
+        self.total_length = 0
+
+    def __len__(self):
+        return len(self.doc_lengths)
+
+    def add(self, doc_id, text):
+        """Index *text* under *doc_id*, replacing a previous version."""
+        self.remove(doc_id)
+        terms = tokenize(text)
+        for term, count in Counter(terms).items():
+            self.postings[term][doc_id] = count
+        self.doc_lengths[doc_id] = len(terms)
+        self.total_length += len(terms)
+
+    def remove(self, doc_id):
+        length = self.doc_lengths.pop(doc_id, None)
+        if length is None:
+            return
+        self.total_length -= length
+        for term in list(self.postings):
+            posting = self.postings[term]
+            if posting.pop(doc_id, None) is not None and not posting:
+                del self.postings[term]
+
+    def idf(self, term):
+        doc_freq = len(self.postings.get(term, ()))
+        return math.log(1 + (len(self) - doc_freq + 0.5) / (doc_freq + 0.5))
+
+    def search(self, query, top_k=None):
+        """Return ``(doc_id, score)`` of the documents sharing terms with *query*.
+
+        Args:
+            query: Query text
+            top_k: Maximum number of results, all matches when None
+
+        Returns:
+            list: Results sorted by decreasing score
+        """
+        if not self.doc_lengths:
+            return []
+        average_length = self.total_length / len(self) or 1
+        scores = defaultdict(float)
+        for term in set(tokenize(query)):
+            posting = self.postings.get(term)
+            if not posting:
+                continue
+            idf = self.idf(term)
+            for doc_id, freq in posting.items():
+                norm = self.k1 * (
+                    1 - self.b + self.b * self.doc_lengths[doc_id] / average_length
+                )
+                scores[doc_id] += idf * freq * (self.k1 + 1) / (freq + norm)
+        results = sorted(scores.items(), key=lambda item: item[1], reverse=True)
+        return results if top_k is None else results[:top_k]
+
+    def get_coverage(self, query, doc_id):
+        """Share of the query IDF mass matched by a document, between 0 and 1.
+
+        Rare query terms weigh more, and terms unknown to the index count as
+        unmatched, so a high coverage means the document explains the query.
+        """
+        query_terms = set(tokenize(query))
+        total = sum(self.idf(term) for term in query_terms)
+        if not total:
+            return 0.0
+        matched = sum(
+            self.idf(term)
+            for term in query_terms
+            if doc_id in self.postings.get(term, ())
+        )
+        return matched / total
+
+
+def reciprocal_rank_fusion(rankings, weights=None, k=60, top_k=None):
+    """Merge rankings by summing ``weight / (k + rank)`` for every item.
+
+    Args:
+        rankings: Lists of items, best first
+        weights: Weight of each ranking, 1 for all when None
+        k: Damping constant, larger values flatten the rank contributions
+        top_k: Maximum number of items returned
+
+    Returns:
+        list: Items sorted by decreasing fused score
+    """
+    weights = weights or [1.0] * len(rankings)
+    scores = defaultdict(float)
+    for ranking, weight in zip(rankings, weights):
+        for rank, item in enumerate(ranking):
+            scores[item] += weight / (k + rank + 1)
+    fused = sorted(scores, key=lambda item: scores[item], reverse=True)
+    return fused if top_k is None else fused[:top_k]
@@ -0,0 +1,655 @@
+"""local_vector_db.py Embedded Vector Database Module.
+
+This file implements a local replacement of the Vearch service so that tool retrieval
+and RAG can run without a vector database cluster. The local store answers the same
+REST-style calls as :class:`VectorToolAsync` with Vearch-shaped responses, so that
+:class:`LocalVectorDB` reuses all the business logic of :class:`VearchDB`.
+
+Each space keeps its vectors in a float32 matrix persisted as a ``.npy`` file under
+``{cache_dir}/local_vector_db/{db_name}/{space_name}/`` and memory-mapped when the
+space is opened. Spaces with an ``IVF*`` retrieval type switch to an
+inverted-file approximate search once they hold ``index_size`` documents; other
+spaces are always searched exactly.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import shutil
+import threading
+import time
+import uuid
+
+import numpy as np
+
+from oxygent.config import Config
+
+from .vearch_db import VearchDB, VectorToolAsync
+
+logger = logging.getLogger(__name__)
+
+# Spaces larger than this are searched in a worker thread
+_THREAD_SEARCH_SIZE = 50000
+
+
+class IVFIndex(object):
+    """Inverted-file index over the rows of a vector matrix.
+
+    The rows are clustered with k-means; a query only scores the rows of the
+    ``nprobe`` clusters whose centroids are closest to it.
+
+    Args:
+        ncentroids: Number of clusters
+        metric_type: ``InnerProduct`` or ``L2``
+    """
+
+    def __init__(self, ncentroids, metric_type="InnerProduct"):
+        self.ncentroids = ncentroids
+        self.metric_type = metric_type
+        self.centroids = None
+        self.lists = []
+        self.trained_size = 0
+
+    def _score(self, vectors, queries):
+        """Higher is closer for both metrics."""
+        scores = queries @ vectors.T
+        if self.metric_type == "L2":
+            scores = 2 * scores - np.sum(vectors * vectors, axis=1)
+        return scores
+
+    def _assign(self, vectors):
+        assignments = np.empty(len(vectors), dtype=np.int64)
+        for start in range(0, len(vectors), 8192):
+            block = vectors[start : start + 8192]
+            assignments[start : start + 8192] = np.argmax(
+                self._score(self.centroids, block), axis=1
+            )
+        return assignments
+
+    def train(self, vectors, n_iter=10, seed=0):
+        """Cluster *vectors* with k-means and fill the inverted lists.
+
+        Args:
+            vectors: float32 matrix of the rows to index
+            n_iter: Number of k-means iterations
+            seed: Seed of the centroid initialization
+        """
+        rng = np.random.default_rng(seed)
+        ncentroids = max(1, min(self.ncentroids, len(vectors)))
+        # k-means on a sample is as good as on all rows and much faster
+        sample_size = min(len(vectors), ncentroids * 64)
+        sample = vectors[rng.choice(len(vectors), sample_size, replace=False)]
+        self.centroids = sample[rng.choice(sample_size, ncentroids, replace=False)].copy()
+        for _ in range(n_iter):
+            assignments = self._assign(sample)
+            sums = np.zeros_like(self.centroids)
+            np.add.at(sums, assignments, sample)
+            counts = np.bincount(assignments, minlength=ncentroids)
+            non_empty = counts > 0
+            self.centroids[non_empty] = sums[non_empty] / counts[non_empty, None]
+            if self.metric_type == "InnerProduct":
+                norms = np.linalg.norm(self.centroids, axis=1, keepdims=True)
+                self.centroids /= np.maximum(norms, 1e-12)
+
+        assignments = self._assign(vectors)
+        order = np.argsort(assignments, kind="stable")
+        bounds = np.searchsorted(assignments[order], np.arange(ncentroids + 1))
+        self.lists = [
+            list(order[bounds[i] : bounds[i + 1]]) for i in range(ncentroids)
+        ]
+        self.trained_size = len(vectors)
+
+    def add(self, rows, vectors):
+        """Append new rows to the list of their closest centroid."""
+        for row, assignment in zip(rows, self._assign(vectors)):
+            self.lists[assignment].append(row)
+
+    def candidates(self, query, nprobe):
+        """Return the rows of the ``nprobe`` clusters closest to *query*."""
+        nprobe = min(nprobe, len(self.lists))
+        scores = self._score(self.centroids, query[None, :])[0]
+        probes = np.argpartition(-scores, nprobe - 1)[:nprobe]
+        rows = [self.lists[probe] for probe in probes if self.lists[probe]]
+        if not rows:
+            return np.empty(0, dtype=np.int64)
+        return np.concatenate([np.asarray(r, dtype=np.int64) for r in rows])
+
+
+class LocalSpace(object):
+    """Documents and vectors of one space, persisted in a directory.
+
+    Rows are never reordered while the space is open: deleted documents leave a
+    tombstone that is dropped when the space is compacted on save.
+
+    Args:
+        space_dir: Directory of the space files
+        space_config: Vearch space configuration, read from disk when None
+    """
+
+    def __init__(self, space_dir, space_config=None):
+        self.space_dir = space_dir
+        self.lock = threading.RLock()
+        if space_config is None:
+            with open(self._path("space.json"), "r", encoding="utf-8") as f:
+                space_config = json.load(f)
+        self.space_config = space_config
+
+        properties = space_config.get("properties", {})
+        self.vector_field = "vector"
+        self.dimension = None
+        for name, prop in properties.items():
+            if prop.get("type") == "vector":
+                self.vector_field = name
+                self.dimension = prop.get("dimension")
+        engine = space_config.get("engine", {})
+        retrieval_param = engine.get("retrieval_param", {})
+        self.metric_type = retrieval_param.get("metric_type", "InnerProduct")
+        self.is_ivf = str(engine.get("retrieval_type", "FLAT")).upper().startswith(
+            "IVF"
+        )
+        self.index_size = engine.get("index_size", 100000)
+        self.ncentroids = retrieval_param.get("ncentroids", 256)
+        self.nprobe = retrieval_param.get("nprobe", max(1, self.ncentroids // 16))
+
+        self.ids = []
+        self.sources = []
+        self.id_to_row = {}
+        self.size = 0
+        self.vectors = np.empty((0, self.dimension or 0), dtype=np.float32)
+        self.is_valid = np.empty(0, dtype=bool)
+        self.ivf_index = None
+        self._vectors_file = None
+        self._load()
+
+    def _path(self, name):
+        return os.path.join(self.space_dir, name)
+
+    def _load(self):
+        docs_path = self._path("docs.json")
+        if not os.path.exists(docs_path):
+            return
+        with open(docs_path, "r", encoding="utf-8") as f:
+            docs = json.load(f)
+        self.ids = docs["ids"]
+        self.sources = docs["sources"]
+        self.size = len(self.ids)
+        self.id_to_row = {doc_id: row for row, doc_id in enumerate(self.ids)}
+        self._vectors_file = docs["vectors_file"]
+        # Copy-on-write mapping: opening is instant, the file is never modified
+        self.vectors = np.load(self._path(self._vectors_file), mmap_mode="c")
+        self.is_valid = np.ones(self.size, dtype=bool)
+        if self.dimension is None and self.size:
+            self.dimension = self.vectors.shape[1]
+
+    def save(self):
+        """Compact the tombstones away and write the space atomically."""
+        with self.lock:
+            if self.size and not self.is_valid[: self.size].all():
+                self._compact()
+            os.makedirs(self.space_dir, exist_ok=True)
+            # A new vectors file per save; replacing docs.json commits both at once
+            vectors_file = f"vectors-{uuid.uuid4().hex[:12]}.npy"
+            np.save(
+                self._path(vectors_file), np.ascontiguousarray(self.vectors[: self.size])
+            )
+            tmp_docs_path = self._path("docs.json.tmp")
+            with open(tmp_docs_path, "w", encoding="utf-8") as f:
+                json.dump(
+                    {
+                        "vectors_file": vectors_file,
+                        "ids": self.ids,
+                        "sources": self.sources,
+                    },
+                    f,
+                    ensure_ascii=False,
+                )
+            os.replace(tmp_docs_path, self._path("docs.json"))
+            old_vectors_file, self._vectors_file = self._vectors_file, vectors_file
+            if old_vectors_file:
+                try:
+                    os.remove(self._path(old_vectors_file))
+                except OSError:
+                    pass
+
+    def save_config(self):
+        os.makedirs(self.space_dir, exist_ok=True)
+        with open(self._path("space.json"), "w", encoding="utf-8") as f:
+            json.dump(self.space_config, f, ensure_ascii=False)
+
+    def _compact(self):
+        valid_rows = np.flatnonzero(self.is_valid[: self.size])
+        self.vectors = np.ascontiguousarray(self.vectors[valid_rows])
+        self.ids = [self.ids[row] for row in valid_rows]
+        self.sources = [self.sources[row] for row in valid_rows]
+        self.size = len(self.ids)
+        self.is_valid = np.ones(self.size, dtype=bool)
+        self.id_to_row = {doc_id: row for row, doc_id in enumerate(self.ids)}
+        self.ivf_index = None
+
+    def _reserve(self, count):
+        """Grow the matrix geometrically so appends are amortized O(1)."""
+        needed = self.size + count
+        if needed <= len(self.vectors) and self.vectors.flags.writeable:
+            return
+        capacity = max(needed, 2 * len(self.vectors), 64)
+        vectors = np.empty((capacity, self.dimension), dtype=np.float32)
+        vectors[: self.size] = self.vectors[: self.size]
+        self.vectors = vectors
+        is_valid = np.zeros(capacity, dtype=bool)
+        is_valid[: self.size] = self.is_valid[: self.size]
+        self.is_valid = is_valid
+
+    def upsert(self, docs):
+        """Insert or replace documents.
+
+        Args:
+            docs: List of ``(doc_id, source)`` where *source* holds the vector
+                field as ``{"feature": [...]}``
+        """
+        with self.lock:
+            new_rows = []
+            for doc_id, source in docs:
+                source = dict(source)
+                vector = source.pop(self.vector_field, None)
+                if isinstance(vector, dict):
+                    vector = vector.get("feature")
+                if vector is None:
+                    raise ValueError(f"Document {doc_id} has no {self.vector_field}")
+                vector = np.asarray(vector, dtype=np.float32).reshape(-1)
+                # The schema dimension is a hint: an empty space takes any model
+                if self.dimension is None or (
+                    self.size == 0 and len(vector) != self.dimension
+                ):
+                    self.dimension = len(vector)
+                    self.vectors = np.empty((0, self.dimension), dtype=np.float32)
+                if len(vector) != self.dimension:
+                    raise ValueError(
+                        f"Vector of {doc_id} has dimension {len(vector)}, "
+                        f"expected {self.dimension}"
+                    )
+                self._reserve(1)
+                row = self.id_to_row.get(doc_id)
+                if row is None:
+                    row = self.size
+                    self.size += 1
+                    self.ids.append(doc_id)
+                    self.sources.append(source)
+                    self.id_to_row[doc_id] = row
+                    new_rows.append(row)
+                else:
+                    self.sources[row] = source
+                    # The IVF list of a replaced vector may be stale
+                    self.ivf_index = None
+                self.vectors[row] = vector
+                self.is_valid[row] = True
+            if self.ivf_index is not None and new_rows:
+                self.ivf_index.add(new_rows, self.vectors[new_rows])
+            return len(docs)
+
+    def delete(self, doc_ids):
+        with self.lock:
+            deleted = 0
+            for doc_id in doc_ids:
+                row = self.id_to_row.pop(doc_id, None)
+                if row is not None:
+                    self.is_valid[row] = False
+                    self.sources[row] = None
+                    deleted += 1
+            return deleted
+
+    @property
+    def doc_num(self):
+        return len(self.id_to_row)
+
+    def filter_mask(self, filters):
+        """Boolean mask of the rows matching all Vearch ``term`` filters."""
+        mask = self.is_valid[: self.size].copy()
+        for condition in filters or []:
+            term = condition.get("term", {})
+            for field, values in term.items():
+                if field == "operator":
+                    continue
+                if not isinstance(values, (list, tuple, set)):
+                    values = [values]
+                values = set(values)
+                mask &= np.fromiter(
+                    (
+                        source is not None and source.get(field) in values
+                        for source in self.sources[: self.size]
+                    ),
+                    dtype=bool,
+                    count=self.size,
+                )
+        return mask
+
+    def _get_ivf_index(self):
+        """Return the IVF index, (re)trained when the space doubled in size."""
+        if not self.is_ivf or self.doc_num < self.index_size:
+            return None
+        if self.ivf_index is None or self.size > 2 * self.ivf_index.trained_size:
+            valid_rows = np.flatnonzero(self.is_valid[: self.size])
+            self.ivf_index = IVFIndex(self.ncentroids, self.metric_type)
+            self.ivf_index.train(self.vectors[valid_rows])
+            # Inverted lists hold row numbers of the whole matrix
+            self.ivf_index.lists = [
+                list(valid_rows[np.asarray(rows, dtype=np.int64)])
+                for rows in self.ivf_index.lists
+            ]
+            self.ivf_index.trained_size = self.size
+        return self.ivf_index
+
+    def _score(self, rows, query):
+        if len(rows) * 4 > self.size:
+            # Scoring every row beats gathering most of the matrix
+            vectors = self.vectors[: self.size]
+            if self.metric_type == "L2":
+                diff = vectors - query
+                return -np.sqrt(np.sum(diff * diff, axis=1))[rows]
+            return (vectors @ query)[rows]
+        vectors = self.vectors[rows]
+        if self.metric_type == "L2":
+            diff = vectors - query
+            return -np.sqrt(np.sum(diff * diff, axis=1))
+        return vectors @ query
+
+    def search(self, query, size, filters=None, is_brute_search=False, nprobe=None):
+        """Return ``(rows, scores)`` of the *size* best matches of *query*.
+
+        Scores are inner products for ``InnerProduct`` spaces and negative L2
+        distances otherwise, so higher is always closer.
+        """
+        with self.lock:
+            query = np.asarray(query, dtype=np.float32).reshape(-1)
+            mask = self.filter_mask(filters) if filters else None
+            ivf_index = None if is_brute_search else self._get_ivf_index()
+            if ivf_index is not None:
+                rows = ivf_index.candidates(query, nprobe or self.nprobe)
+                rows = rows[self.is_valid[rows]]
+                if mask is not None:
+                    rows = rows[mask[rows]]
+                # Too few candidates after filtering, fall back to exact search
+                if len(rows) < size:
+                    ivf_index = None
+            if ivf_index is None:
+                valid = mask if mask is not None else self.is_valid[: self.size]
+                rows = np.flatnonzero(valid)
+            if len(rows) == 0:
+                return rows, np.empty(0, dtype=np.float32)
+            scores = self._score(rows, query)
+            if len(rows) > size:
+                top = np.argpartition(-scores, size - 1)[:size]
+            else:
+                top = np.arange(len(rows))
+            top = top[np.argsort(-scores[top], kind="stable")]
+            return rows[top], scores[top]
+
+
+class LocalVectorToolAsync(VectorToolAsync):
+    """Embedded implementation of the Vearch REST calls of :class:`VectorToolAsync`.
+
+    The URL arguments are accepted for compatibility and ignored. Responses have the
+    shape of the Vearch responses that :class:`VearchDB` parses.
+
+    Args:
+        data_dir: Root directory of the local databases
+    """
+
+    def __init__(self, data_dir):
+        self.data_dir = data_dir
+        self._spaces = {}
+        self._lock = threading.Lock()
+
+    def _space_dir(self, db_name, space_name):
+        return os.path.join(self.data_dir, db_name, space_name)
+
+    def _get_space(self, db_name, space_name):
+        """Return the open space, loading it from disk, or None if missing."""
+        key = (db_name, space_name)
+        with self._lock:
+            space = self._spaces.get(key)
+            if space is None:
+                space_dir = self._space_dir(db_name, space_name)
+                if not os.path.exists(os.path.join(space_dir, "space.json")):
+                    return None
+                space = LocalSpace(space_dir)
+                self._spaces[key] = space
+            return space
+
+    @staticmethod
+    def _space_not_exists(db_name, space_name):
+        reason = f"dbName:{db_name} or spaceName:{space_name} not exists"
+        return {
+            "error": {"root_cause": [{"type": "", "reason": reason}], "reason": reason},
+            "status": 400,
+        }
+
+    async def create_db(self, master_url, db_name):
+        os.makedirs(os.path.join(self.data_dir, db_name), exist_ok=True)
+        return {"code": 0, "msg": "success"}
+
+    async def create_space(self, master_url, db_name, space_config):
+        space_name = space_config["name"]
+        if self._get_space(db_name, space_name) is not None:
+            return {"code": 564, "msg": f"space_exists: {space_name}"}
+        space = LocalSpace(self._space_dir(db_name, space_name), space_config)
+        space.save_config()
+        with self._lock:
+            self._spaces[(db_name, space_name)] = space
+        return {"code": 0, "msg": "success", "data": space_config}
+
+    async def drop_space(self, master_url, db_name, space_name):
+        with self._lock:
+            self._spaces.pop((db_name, space_name), None)
+        shutil.rmtree(self._space_dir(db_name, space_name), ignore_errors=True)
+        return json.dumps({"code": 0, "msg": "success"})
+
+    async def _upsert(self, db_name, space_name, docs):
+        space = self._get_space(db_name, space_name)
+        if space is None:
+            return json.dumps(self._space_not_exists(db_name, space_name))
+        total = space.upsert(docs)
+        await asyncio.to_thread(space.save)
+        return json.dumps({"code": 0, "msg": "success", "total": total})
+
+    async def insert_batch(self, db_name, space_name, router_url, data_list):
+        """Apply documents given as Vearch bulk NDJSON with a single save.
+
+        ``index`` actions are followed by their document line, ``delete`` actions
+        are not. The NDJSON may also be an async iterator of encoded chunks.
+        """
+        space = self._get_space(db_name, space_name)
+        if space is None:
+            return json.dumps(self._space_not_exists(db_name, space_name))
+        if not isinstance(data_list, (str, bytes)):
+            data_list = b"".join([chunk async for chunk in data_list])
+        if isinstance(data_list, bytes):
+            data_list = data_list.decode("utf-8")
+        lines = iter(line for line in data_list.splitlines() if line.strip())
+        docs, deleted_ids = [], []
+        for action_line in lines:
+            action = json.loads(action_line)
+            if "delete" in action:
+                deleted_ids.append(action["delete"]["_id"])
+                continue
+            doc_id = action.get("index", {}).get("_id") or uuid.uuid4().hex
+            docs.append((doc_id, json.loads(next(lines))))
+        total = space.upsert(docs) + space.delete(deleted_ids)
+        if total:
+            await asyncio.to_thread(space.save)
+        return json.dumps({"code": 0, "msg": "success", "total": total})
+
+    async def delete_batch(self, db_name, space_name, router_url, doc_ids):
+        return await self.delete_by_docids(db_name, space_name, doc_ids)
+
+    async def insert_single(self, db_name, space_name, router_url, data_list):
+        doc = json.loads(data_list) if isinstance(data_list, str) else dict(data_list)
+        doc_id = doc.pop("_id", None) or uuid.uuid4().hex
+        return await self._upsert(db_name, space_name, [(doc_id, doc)])
+
+    async def upsert(self, db_name, space_name, docs):
+        """Insert or replace documents given as ``(doc_id, source)`` pairs."""
+        return json.loads(await self._upsert(db_name, space_name, list(docs)))
+
+    async def check_info(self, db_name, space_name, master_url):
+        space = self._get_space(db_name, space_name)
+        if space is None:
+            return {"code": 565, "msg": "space_notexists"}
+        return {
+            "code": 0,
+            "msg": "success",
+            "data": {"name": space_name, "doc_num": space.doc_num},
+        }
+
+    async def get_cluster_health(self, master_url):
+        health = []
+        if not os.path.exists(self.data_dir):
+            return health
+        for db_name in sorted(os.listdir(self.data_dir)):
+            db_dir = os.path.join(self.data_dir, db_name)
+            if not os.path.isdir(db_dir):
+                continue
+            spaces = []
+            for space_name in sorted(os.listdir(db_dir)):
+                space = self._get_space(db_name, space_name)
+                if space is not None:
+                    spaces.append({"name": space_name, "doc_num": space.doc_num})
+            health.append({"db_name": db_name, "spaces": spaces})
+        return health
+
+    async def check_doc_num(self, master_url, db_name, space_name):
+        space = self._get_space(db_name, space_name)
+        return -1 if space is None else space.doc_num
+
+    def _to_hits(self, space, rows, scores, fields, took):
+        hits = []
+        for row, score in zip(rows, scores):
+            source = space.sources[row]
+            if fields:
+                source = {k: v for k, v in source.items() if k in fields}
+            hits.append(
+                {"_id": space.ids[row], "_score": float(score), "_source": dict(source)}
+            )
+        return {
+            "took": int(took * 1000),
+            "timed_out": False,
+            "_shards": {"total": 1, "successful": 1},
+            "hits": {
+                "total": len(hits),
+                "max_score": hits[0]["_score"] if hits else -1,
+                "hits": hits,
+            },
+        }
+
+    async def search(self, db_name, space_name, search_query):
+        """Run a Vearch ``_search`` query against a local space."""
+        start = time.perf_counter()
+        space = self._get_space(db_name, space_name)
+        if space is None:
+            return self._space_not_exists(db_name, space_name)
+        query = search_query.get("query", {})
+        filters = query.get("filter", [])
+        size = search_query.get("size", 50)
+        fields = search_query.get("fields", [])
+        features = query.get("sum", [])
+        if not features:
+            # Filter only: every matching document with a neutral score
+            with space.lock:
+                rows = np.flatnonzero(space.filter_mask(filters))[:size]
+            scores = np.ones(len(rows), dtype=np.float32)
+            return self._to_hits(space, rows, scores, fields, time.perf_counter() - start)
+
+        search_args = (
+            features[0]["feature"],
+            size,
+            filters,
+            bool(search_query.get("is_brute_search", 0)),
+            search_query.get("retrieval_param", {}).get("nprobe"),
+        )
+        if space.size > _THREAD_SEARCH_SIZE:
+            rows, scores = await asyncio.to_thread(space.search, *search_args)
+        else:
+            rows, scores = space.search(*search_args)
+        return self._to_hits(space, rows, scores, fields, time.perf_counter() - start)
+
+    async def search_by_filter(self, db_name, space_name, router_url, data_list):
+        return await self.search(db_name, space_name, data_list)
+
+    async def emb_search(self, db_name, space_name, router_url, emb, retrieval_nums, fields):
+        # Unlike the Vearch client, let the space decide whether to search exactly
+        search_query = {
+            "query": {"sum": [{"field": "vector", "feature": list(emb)[0]}]},
+            "fields": fields,
+            "size": retrieval_nums,
+        }
+        return await self.search(db_name, space_name, search_query)
+
+    async def filter_and_emb_search(
+        self, db_name, space_name, router_url, emb, retrieval_nums, fields, filter={}
+    ):
+        search_query = {
+            "query": {
+                "sum": [{"field": "vector", "feature": list(emb)[0]}],
+                "filter": [
+                    {"term": {k: [v], "operator": "and"}} for k, v in filter.items()
+                ],
+            },
+            "fields": fields,
+            "size": retrieval_nums,
+        }
+        return await self.search(db_name, space_name, search_query)
+
+    async def delete_by_docid(self, db_name, space_name, router_url, doc_id):
+        return await self.delete_by_docids(db_name, space_name, [doc_id])
+
+    async def delete_by_docids(self, db_name, space_name, doc_ids):
+        space = self._get_space(db_name, space_name)
+        if space is None:
+            return json.dumps(self._space_not_exists(db_name, space_name))
+        total = space.delete(doc_ids)
+        if total:
+            await asyncio.to_thread(space.save)
+        return json.dumps({"code": 0, "msg": "success", "total": total})
+
+    async def delete_by_filter(self, db_name, space_name, router_url, filters):
+        """Delete every document matching Vearch ``term`` filters at once."""
+        space = self._get_space(db_name, space_name)
+        if space is None:
+            return json.dumps(self._space_not_exists(db_name, space_name))
+        with space.lock:
+            doc_ids = [space.ids[row] for row in np.flatnonzero(space.filter_mask(filters))]
+        return await self.delete_by_docids(db_name, space_name, doc_ids)
+
+
+class LocalVectorDB(VearchDB):
+    """Embedded drop-in replacement of :class:`VearchDB`.
+
+    All the tool management and search methods of :class:`VearchDB` run unchanged
+    on a :class:`LocalVectorToolAsync`, so the retrieval path works offline and
+    without a network hop per query. Embeddings are still computed by the configured
+    embedding service, or by *emb_func* when given.
+
+    Args:
+        config: Vearch configuration; ``master_url`` and ``router_url`` are not used
+        emb_func: Optional async function mapping a list of texts to an embedding
+            matrix, overriding ``embedding_model_url``
+    """
+
+    def __init__(self, config, emb_func=None):
+        config = dict(config)
+        config.setdefault("db_name", "oxygent")
+        config.setdefault("tool_space_name", "tool_df")
+        config.setdefault("master_url", "")
+        config.setdefault("router_url", "")
+        super().__init__(config)
+        self.vearch_tools = LocalVectorToolAsync(
+            os.path.join(Config.get_cache_save_dir(), "local_vector_db")
+        )
+        self._is_custom_emb_func = emb_func is not None
+        if emb_func is not None:
+            self.emb_func = emb_func
+
+    async def _get_tool_desc_embeddings(self, tool_descs):
+        if self._is_custom_emb_func:
+            return await self.emb_func(list(tool_descs))
+        return await super()._get_tool_desc_embeddings(tool_descs)
@@ -7,16 +7,57 @@ embedding support and advanced filtering capabilities.
 
 import asyncio
 import base64
+import hashlib
 import json
+import logging
 import random
+import re
+import time
+import weakref
+from contextlib import contextmanager
 
 import httpx
 import numpy as np
 import pandas as pd
 
+from oxygent.config import Config
 from oxygent.databases.db_vector.base_vector_db import BaseVectorDB
+from oxygent.databases.db_vector.bm25_index import (
+    BM25Index,
+    reciprocal_rank_fusion,
+    tokenize,
+)
 from oxygent.embedding_cache import EmbeddingCache
 
+logger = logging.getLogger(__name__)
+
+# One pooled HTTP client per event loop, as httpx clients are bound to the loop
+# they were created in
+_http_clients = weakref.WeakKeyDictionary()
+
+
+def _get_http_client():
+    """Return the pooled client of the running event loop."""
+    loop = asyncio.get_running_loop()
+    client = _http_clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            timeout=Config.get_vector_db_timeout(),
+            limits=httpx.Limits(
+                max_connections=Config.get_vector_db_max_concurrency() * 2,
+                max_keepalive_connections=Config.get_vector_db_max_concurrency(),
+            ),
+        )
+        _http_clients[loop] = client
+    return client
+
+
+async def close_http_client():
+    """Close the pooled client of the running event loop, if any."""
+    client = _http_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
 
 class VectorToolAsync(object):
     """Asynchronous toolkit for low-level Vearch database operations.
@@ -45,9 +86,8 @@ class VectorToolAsync(object):
         """
         url = f"{master_url}/db/_create"
         data = {"name": db_name}
-        async with httpx.AsyncClient() as client:
-            response = await client.put(url, json=data)
-            return response.json()
+        response = await _get_http_client().put(url, json=data)
+        return response.json()
 
     @staticmethod
     async def create_space(master_url, db_name, space_config):
@@ -62,9 +102,8 @@ class VectorToolAsync(object):
             Dict[str, Any]: API Response
         """
         url = f"{master_url}/space/{db_name}/_create"
-        async with httpx.AsyncClient() as client:
-            response = await client.put(url, json=space_config)
-            return response.json()
+        response = await _get_http_client().put(url, json=space_config)
+        return response.json()
 
     @staticmethod
     async def drop_space(master_url, db_name, space_name):
@@ -79,9 +118,8 @@ class VectorToolAsync(object):
             str: Text response from the Vearch API
         """
         url = f"{master_url}/space/{db_name}/{space_name}"
-        async with httpx.AsyncClient() as client:
-            response = await client.delete(url)
-            return response.text
+        response = await _get_http_client().delete(url)
+        return response.text
 
     @staticmethod
     def generate_random_str(randomlength=10):
@@ -104,15 +142,35 @@ class VectorToolAsync(object):
             db_name: Name of the target database
             space_name: Name of the target space
             router_url: URL of the Vearch router node
-            data_list: Bulk data in NDJSON format
+            data_list: Bulk data in NDJSON format, or an async iterator of its
+                encoded chunks to stream the request body
 
         Returns:
             str: Text response from the Vearch API
         """
         url = f"{router_url}/{db_name}/{space_name}/_bulk"
-        async with httpx.AsyncClient() as client:
-            response = await client.post(url, data=data_list)
-            return response.text
+        response = await _get_http_client().post(url, content=data_list)
+        return response.text
+
+    @staticmethod
+    async def delete_batch(db_name, space_name, router_url, doc_ids):
+        """Delete multiple documents in one request using bulk API.
+
+        Args:
+            db_name: Name of the target database
+            space_name: Name of the target space
+            router_url: URL of the Vearch router node
+            doc_ids: IDs of the documents to delete
+
+        Returns:
+            str: Text response from the Vearch API
+        """
+        items = "".join(
+            json.dumps({"delete": {"_id": doc_id}}) + "\n" for doc_id in doc_ids
+        )
+        url = f"{router_url}/{db_name}/{space_name}/_bulk"
+        response = await _get_http_client().post(url, content=items)
+        return response.text
 
     @staticmethod
     async def insert_single(db_name, space_name, router_url, data_list):
@@ -128,9 +186,8 @@ class VectorToolAsync(object):
             str: Text response from the Vearch API
         """
         url = f"{router_url}/{db_name}/{space_name}"
-        async with httpx.AsyncClient() as client:
-            response = await client.post(url, data=data_list)
-            return response.text
+        response = await _get_http_client().post(url, content=data_list)
+        return response.text
 
     @staticmethod
     async def check_info(db_name, space_name, master_url):
@@ -145,9 +202,8 @@ class VectorToolAsync(object):
             Dict[str, Any]: JSON response containing space status
         """
         url = f"{master_url}/space/{db_name}/{space_name}"
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url)
-            return response.json()
+        response = await _get_http_client().get(url)
+        return response.json()
 
     @staticmethod
     async def get_cluster_health(master_url):
@@ -160,9 +216,8 @@ class VectorToolAsync(object):
             Dict[str, Any]: JSON response containing cluster health data
         """
         url = f"{master_url}/_cluster/health"
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url)
-            return response.json()
+        response = await _get_http_client().get(url)
+        return response.json()
 
     @staticmethod
     async def check_doc_num(master_url, db_name, space_name):
@@ -203,9 +258,8 @@ class VectorToolAsync(object):
             Dict[str, Any]: JSON response containing search results
         """
         url = f"{router_url}/{db_name}/{space_name}/_search"
-        async with httpx.AsyncClient() as client:
-            response = await client.post(url, json=data_list)
-            return response.json()
+        response = await _get_http_client().post(url, json=data_list)
+        return response.json()
 
     @staticmethod
     async def emb_search(db_name, space_name, router_url, emb, retrieval_nums, fields):
@@ -233,9 +287,8 @@ class VectorToolAsync(object):
             "is_brute_search": 1,
             "size": retrieval_nums,
         }
-        async with httpx.AsyncClient() as client:
-            response = await client.post(url, json=search_query)
-            return response.json()
+        response = await _get_http_client().post(url, json=search_query)
+        return response.json()
 
     @staticmethod
     async def filter_and_emb_search(
@@ -270,9 +323,8 @@ class VectorToolAsync(object):
             "is_brute_search": 1,
             "size": retrieval_nums,
         }
-        async with httpx.AsyncClient() as client:
-            response = await client.post(url, json=search_query)
-            return response.json()
+        response = await _get_http_client().post(url, json=search_query)
+        return response.json()
 
     @staticmethod
     async def delete_by_docid(db_name, space_name, router_url, doc_id):
@@ -288,9 +340,26 @@ class VectorToolAsync(object):
             str: Text response from the Vearch API
         """
         url = f"{router_url}/{db_name}/{space_name}/{doc_id}"
-        async with httpx.AsyncClient() as client:
-            response = await client.delete(url)
-            return response.text
+        response = await _get_http_client().delete(url)
+        return response.text
+
+    @staticmethod
+    async def delete_by_filter(db_name, space_name, router_url, filters):
+        """Delete every document matching filter conditions in one request.
+
+        Args:
+            db_name: Name of the database
+            space_name: Name of the space
+            router_url: URL of the Vearch router node
+            filters: List of Vearch ``term`` filter conditions
+
+        Returns:
+            str: Text response from the Vearch API
+        """
+        url = f"{router_url}/{db_name}/{space_name}/_delete_by_query"
+        data = {"query": {"filter": filters}}
+        response = await _get_http_client().post(url, json=data)
+        return response.text
 
     @staticmethod
     def retrieval2df(res):
@@ -368,6 +437,32 @@ class VearchDB(BaseVectorDB):
         else:
             self.emb_func = None
 
+        # BM25 indexes of tool names and descriptions, keyed by (app_name, agent_name)
+        self._tool_lexical_indexes = {}
+        # Number of tool retrievals answered by each path
+        self.tool_retrieval_stats = {"lexical": 0, "hybrid": 0, "vector": 0}
+        # Latency of each operation: count, total_ms and max_ms
+        self.latency_stats = {}
+
+    @contextmanager
+    def _timed(self, operation):
+        """Record the latency of the enclosed block under *operation*."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            stats = self.latency_stats.setdefault(
+                operation, {"count": 0, "total_ms": 0.0, "max_ms": 0.0}
+            )
+            stats["count"] += 1
+            stats["total_ms"] += elapsed_ms
+            stats["max_ms"] = max(stats["max_ms"], elapsed_ms)
+
+    async def close(self):
+        """Close the pooled HTTP client of the running event loop."""
+        await close_http_client()
+
     async def create_space(self, space_config):
         """Create a new space with custom configuration.
 
@@ -465,14 +560,15 @@ class VearchDB(BaseVectorDB):
             raise ValueError("Please specify the embedding function")
 
         # Perform vector similarity search
-        res = await self.vearch_tools.emb_search(
-            self.config.db_name,
-            space_name=space_name,
-            router_url=self.config.router_url,
-            emb=emb,
-            retrieval_nums=retrieval_nums,
-            fields=fields,
-        )
+        with self._timed("query_search"):
+            res = await self.vearch_tools.emb_search(
+                self.config.db_name,
+                space_name=space_name,
+                router_url=self.config.router_url,
+                emb=emb,
+                retrieval_nums=retrieval_nums,
+                fields=fields,
+            )
 
         # Process result and apply threshold if provided
         if self.vearch_tools.check_search_result(res):
@@ -485,7 +581,7 @@ class VearchDB(BaseVectorDB):
         return res_df
 
     async def query_search_batch(
-        self, space_name, query_list, retrieval_nums, fields=[]
+        self, space_name, query_list, retrieval_nums, fields=[], max_concurrency=None
     ):
         """Perform batch semantic search for multiple queries.
 
@@ -494,12 +590,16 @@ class VearchDB(BaseVectorDB):
             query_list: List of text queries to search for
             retrieval_nums: Maximum number of results per query
             fields: List of fields to include in results
+            max_concurrency: Maximum number of searches in flight, defaults to
+                ``Config.get_vector_db_max_concurrency()``
 
         Returns:
             pandas.DataFrame containing concatenated results from all queries
 
         NOTE:
             Results are not deduplicated and no threshold filtering is applied.
+            All queries are embedded in one call and searched concurrently; the
+            results keep the order of *query_list*.
 
         Raises:
             ValueError: If embedding function is not specified
@@ -507,23 +607,112 @@ class VearchDB(BaseVectorDB):
         if self.emb_func is None:
             raise ValueError("Please specify the embedding function")
 
-        batch_result = []
-        for q in query_list:
-            emb = await self.emb_func([q])
-            res = await self.vearch_tools.emb_search(
-                self.config.db_name,
-                space_name=space_name,
-                router_url=self.config.router_url,
-                emb=emb,
-                retrieval_nums=retrieval_nums,
-                fields=fields,
+        with self._timed("query_search_batch"):
+            embs = await self.emb_func(list(query_list))
+            semaphore = asyncio.Semaphore(
+                max_concurrency or Config.get_vector_db_max_concurrency()
+            )
+
+            async def search(emb):
+                async with semaphore:
+                    with self._timed("query_search"):
+                        return await self.vearch_tools.emb_search(
+                            self.config.db_name,
+                            space_name=space_name,
+                            router_url=self.config.router_url,
+                            emb=emb,
+                            retrieval_nums=retrieval_nums,
+                            fields=fields,
+                        )
+
+            results = await asyncio.gather(
+                *(search(embs[i : i + 1]) for i in range(len(query_list)))
             )
-            if self.vearch_tools.check_search_result(res):
-                res_df = self.vearch_tools.retrieval2df(res)
-                batch_result.append(res_df)
+        batch_result = [
+            self.vearch_tools.retrieval2df(res)
+            for res in results
+            if self.vearch_tools.check_search_result(res)
+        ]
+        if not batch_result:
+            return pd.DataFrame()
         batch_result_df = pd.concat(batch_result)
         return batch_result_df
 
+    async def upsert(self, space_name, docs, chunk_size=None, max_concurrency=None):
+        """Insert or replace documents through chunked, streamed bulk requests.
+
+        Args:
+            space_name: Name of the target space
+            docs: Iterable of ``(doc_id, source)`` where the ``vector`` field of
+                *source* is a list, an array or ``{"feature": [...]}``
+            chunk_size: Number of documents per bulk request, defaults to
+                ``Config.get_vector_db_bulk_chunk_size()``
+            max_concurrency: Maximum number of bulk requests in flight, defaults
+                to ``Config.get_vector_db_max_concurrency()``
+
+        Returns:
+            int: Number of documents sent
+
+        NOTE:
+            *docs* is consumed lazily one chunk at a time, and each request body is
+            streamed line by line, so large uploads never hold the whole payload.
+        """
+        chunk_size = chunk_size or Config.get_vector_db_bulk_chunk_size()
+        semaphore = asyncio.Semaphore(
+            max_concurrency or Config.get_vector_db_max_concurrency()
+        )
+
+        async def send(chunk):
+            async def stream():
+                for doc_id, source in chunk:
+                    source = dict(source)
+                    vector = source.get("vector")
+                    if vector is not None and not isinstance(vector, dict):
+                        source["vector"] = {"feature": np.asarray(vector).tolist()}
+                    action = json.dumps({"index": {"_id": doc_id}})
+                    yield f"{action}\n{json.dumps(source)}\n".encode("utf-8")
+
+            try:
+                with self._timed("bulk_upsert_chunk"):
+                    return await self.vearch_tools.insert_batch(
+                        self.config.db_name,
+                        space_name,
+                        self.config.router_url,
+                        stream(),
+                    )
+            finally:
+                semaphore.release()
+
+        with self._timed("upsert"):
+            tasks, total, chunk = [], 0, []
+            for doc in docs:
+                chunk.append(doc)
+                if len(chunk) == chunk_size:
+                    await semaphore.acquire()
+                    tasks.append(asyncio.create_task(send(chunk)))
+                    total, chunk = total + len(chunk), []
+            if chunk:
+                await semaphore.acquire()
+                tasks.append(asyncio.create_task(send(chunk)))
+                total += len(chunk)
+            await asyncio.gather(*tasks)
+        return total
+
+    async def delete_by_filter(self, space_name, filters):
+        """Delete every document of a space matching filter conditions at once.
+
+        Args:
+            space_name: Name of the space
+            filters: List of Vearch ``term`` filter conditions
+
+        Example:
+            filters = [{"term": {"app_name": ["app_test3"]}}]
+        """
+        with self._timed("delete_by_filter"):
+            return await self.vearch_tools.delete_by_filter(
+                self.config.db_name, space_name, self.config.router_url, filters
+            )
+
     async def check_space_exist(self, space_name):
         """Check if a space exists in the database.
 
@@ -561,38 +750,177 @@ class VearchDB(BaseVectorDB):
 
         Example:
             tool_list = [('app_test3', 'agent_test3', 'tool_test3', 'tool_desc_test3')]
+
+        Returns:
+            dict: Numbers of upserted, deleted and unchanged tools
+
+        NOTE:
+            Each tool is stored under an ID derived from its app, agent and tool
+            names, with a fingerprint of its description in ``remark``. Only the
+            tools whose fingerprint changed are embedded and upserted, and only the
+            tools that disappeared are deleted, so restarts are nearly free. If the
+            stored fingerprints cannot be read, the tools of the app are deleted
+            and all uploaded again.
         """
         # Create system table if not exist
         if not await self.check_space_exist(self.config.tool_space_name):
             await self.create_tool_df_space(self.config.tool_space_name)
 
-        df = pd.DataFrame(
-            tool_list, columns=["app_name", "agent_name", "tool_name", "tool_desc"]
+        # 1. Validate single app constraint
+        unique_app_name = {tool[0] for tool in tool_list}
+        assert len(unique_app_name) == 1, "app_name must be unique"
+        app_name = unique_app_name.pop()
+        self._build_tool_lexical_indexes(tool_list)
+
+        # 2. Compare the fingerprints of the tools with the stored ones
+        stored_fingerprints = await self.recall_tool_fingerprints(app_name)
+        if stored_fingerprints is None:
+            # Nothing to compare against, so stale documents could not be found
+            logger.warning(
+                f"Failed to read the stored tools of {app_name}, re-uploading all"
+            )
+            await self.delete_by_appname(app_name)
+            stored_fingerprints = {}
+        tools = {}
+        for tool in tool_list:
+            tools[self._get_tool_doc_id(*tool[:3])] = tool
+        changed_doc_ids = [
+            doc_id
+            for doc_id, tool in tools.items()
+            if stored_fingerprints.get(doc_id) != self._get_tool_fingerprint(tool[3])
+        ]
+        removed_doc_ids = [
+            doc_id for doc_id in stored_fingerprints if doc_id not in tools
+        ]
+
+        # 3. Embed and upsert the changed tools only
+        if changed_doc_ids:
+            changed_tools = [tools[doc_id] for doc_id in changed_doc_ids]
+            tool_desc_embeddings = await self._get_tool_desc_embeddings(
+                [tool[3] for tool in changed_tools]
+            )
+            await self._upsert_tools(changed_tools, tool_desc_embeddings)
+
+        # 4. Delete the tools that no longer exist
+        if removed_doc_ids:
+            await self.vearch_tools.delete_batch(
+                self.config.db_name,
+                self.config.tool_space_name,
+                self.config.router_url,
+                removed_doc_ids,
+            )
+
+        return {
+            "upserted": len(changed_doc_ids),
+            "deleted": len(removed_doc_ids),
+            "unchanged": len(tools) - len(changed_doc_ids),
+        }
+
+    @staticmethod
+    def _get_tool_doc_id(app_name, agent_name, tool_name):
+        """Stable document ID of a tool, so re-uploads replace it in place."""
+        key = f"{app_name}\t{agent_name}\t{tool_name}"
+        return hashlib.md5(key.encode("utf-8")).hexdigest()
+
+    def _get_tool_fingerprint(self, tool_desc):
+        """Fingerprint of a tool embedding: its description and the model."""
+        model = getattr(self.config, "embedding_model_url", "") or ""
+        return hashlib.md5(f"{model}\t{tool_desc}".encode("utf-8")).hexdigest()
+
+    async def _upsert_tools(self, tool_list, tool_desc_embeddings):
+        """Write tools and their embeddings with one bulk request.
+
+        Args:
+            tool_list: List of tuples (app_name, agent_name, tool_name, tool_desc)
+            tool_desc_embeddings: Embedding matrix aligned with *tool_list*
+
+        Returns:
+            int: Number of documents sent
+        """
+        # One conversion of the whole matrix instead of one per row
+        features = np.asarray(tool_desc_embeddings, dtype=float).tolist()
+        docs = (
+            (
+                self._get_tool_doc_id(app_name, agent_name, tool_name),
+                {
+                    "app_name": app_name,
+                    "agent_name": agent_name,
+                    "tool_name": tool_name,
+                    "vector": {"feature": feature},
+                    "tool_desc": tool_desc,
+                    "remark": self._get_tool_fingerprint(tool_desc),
+                },
+            )
+            for (app_name, agent_name, tool_name, tool_desc), feature in zip(
+                tool_list, features
+            )
         )
-        # print(df)
+        return await self.upsert(self.config.tool_space_name, docs)
 
-        # 1. Generate embeddings for tool dscriptions
-        with EmbeddingCache() as embedding:
-            # Method 1: Individual embedding
-            # for app_name, agent_name, tool_name, tool_desc in tool_list:
-            #     tool_desc_embedding = embedding.get(tool_desc)
-            #     print(tool_desc_embedding)
+    def _build_tool_lexical_indexes(self, tool_list):
+        """Index the names and descriptions of the tools of every agent.
 
-            # Method 2: Batch embedding
-            tool_desc_embeddings = await embedding.get(list(df["tool_desc"]))
-            df["tool_desc_embedding"] = list(tool_desc_embeddings)
+        Args:
+            tool_list: List of tuples (app_name, agent_name, tool_name, tool_desc)
+        """
+        indexes = {}
+        for app_name, agent_name, tool_name, tool_desc in tool_list:
+            index = indexes.setdefault((app_name, agent_name), BM25Index())
+            index.add(tool_name, f"{tool_name} {tool_desc}")
+        # Replace the indexes of the indexed apps only
+        app_names = {app_name for app_name, _ in indexes}
+        self._tool_lexical_indexes = {
+            key: index
+            for key, index in self._tool_lexical_indexes.items()
+            if key[0] not in app_names
+        }
+        self._tool_lexical_indexes.update(indexes)
 
-        # 2. Validate single app constraint
-        unique_app_name = df["app_name"].unique()
-        assert len(unique_app_name) == 1, "app_name must be unique"
+    def _lexical_tool_retrieval(self, index, query, top_k):
+        """Rank tools by BM25 and tell whether the lexical match is conclusive.
+
+        Tools named verbatim in the query come first. Other tools must cover at
+        least ``lexical_min_coverage`` of the query, so that sharing one common
+        term is not enough to be fused with the vector ranking. The ranking is
+        conclusive when a tool with a compound name such as ``get_weather`` is
+        named, or when the best tool covers most of the query terms. A one-word
+        name such as ``search`` may be an ordinary word of the query.
 
-        # 3. Clean existing data for this app
-        await self.delete_by_appname(unique_app_name[0])
+        Returns:
+            tuple: (list of tool names, whether the vector search can be skipped)
+        """
+        named_tools = [
+            tool_name
+            for tool_name in index.doc_lengths
+            if len(tool_name) > 2
+            and re.search(rf"(?<!\w){re.escape(tool_name)}(?!\w)", query, re.IGNORECASE)
+        ]
+        min_coverage = Config.get_tool_retrieval_lexical_min_coverage()
+        ranked_tools = [
+            tool_name
+            for tool_name, _ in index.search(query)
+            if tool_name not in named_tools
+            and index.get_coverage(query, tool_name) >= min_coverage
+        ]
+        tools = named_tools + ranked_tools
+        if any(len(tokenize(tool_name)) > 1 for tool_name in named_tools):
+            return tools[:top_k], True
+        is_confident = bool(tools) and index.get_coverage(
+            query, tools[0]
+        ) >= Config.get_tool_retrieval_lexical_confidence()
+        return tools[:top_k], is_confident
+
+    async def _get_tool_desc_embeddings(self, tool_descs):
+        """Embed tool descriptions through the on-disk embedding cache.
 
-        # 4. Update new data
-        await self.upload_by_df(df)
+        Args:
+            tool_descs: List of tool descriptions
 
-        return
+        Returns:
+            numpy.ndarray: Embedding vectors, shape (n_tools, embedding_dim)
+        """
+        with EmbeddingCache() as embedding:
+            return await embedding.get(tool_descs)
 
     async def upload_by_df(self, df):
         """Upload tool data from DataFrame to Vearch.
@@ -601,37 +929,12 @@ class VearchDB(BaseVectorDB):
             df: pandas.DataFrame containing tool information with embeddings
 
         Returns:
-            str: Response from bulk insert operation
+            int: Number of documents sent
         """
-        items = ""
-        for ind, row in df.iterrows():
-            # Prepare document data
-            data = {
-                "app_name": row["app_name"],
-                "agent_name": row["agent_name"],
-                "tool_name": row["tool_name"],
-                "vector": {
-                    "feature": [float(e) for e in list(row["tool_desc_embedding"])]
-                },
-                "tool_desc": row["tool_desc"],
-                "remark": "1",
-            }
-            # Build NDJSON format for bulk insert
-            items += (
-                json.dumps({"index": {"_id": self.vearch_tools.generate_random_str()}})
-                + "\n"
-                + json.dumps(data)
-                + "\n"
-            )
-        # Perform bulk insert
-        res = await self.vearch_tools.insert_batch(
-            self.config.db_name,
-            self.config.tool_space_name,
-            self.config.router_url,
-            items,
+        tool_list = list(
+            zip(df["app_name"], df["agent_name"], df["tool_name"], df["tool_desc"])
         )
-
-        return res
+        return await self._upsert_tools(tool_list, np.stack(df["tool_desc_embedding"]))
 
     async def delete_by_appname(self, app_name):
         """Delete all documents associated with a specific app name.
@@ -639,18 +942,46 @@ class VearchDB(BaseVectorDB):
         Args:
             app_name: Name of the application whose tools should be deleted
         """
-        ids = await self.recall_by_appname(app_name)
-
-        # Delete each document individually
-        for doc_id in ids:
-            await self.vearch_tools.delete_by_docid(
-                self.config.db_name,
-                self.config.tool_space_name,
-                self.config.router_url,
-                doc_id,
-            )
+        await self.delete_by_filter(
+            self.config.tool_space_name, [{"term": {"app_name": [app_name]}}]
+        )
         return
 
+    async def recall_tool_fingerprints(self, app_name):
+        """Retrieve the description fingerprint of every stored tool of an app.
+
+        Args:
+            app_name: Name of the application to search for
+
+        Returns:
+            Optional[dict]: Mapping of document ID to fingerprint, None for
+                documents uploaded before fingerprints were stored. None if the
+                search failed or did not return every document.
+        """
+        max_size = 20000  # Large number to get all documents
+        search_query = {
+            "query": {
+                "filter": [
+                    {"term": {"app_name": app_name}},
+                ]
+            },
+            "fields": ["remark"],
+            "size": max_size,
+        }
+        resp = await self.vearch_tools.search_by_filter(
+            self.config.db_name,
+            self.config.tool_space_name,
+            self.config.router_url,
+            search_query,
+        )
+        if not isinstance(resp, dict) or "error" in resp:
+            return None
+        total = resp.get("hits", {}).get("total", 0)
+        hits = resp.get("hits", {}).get("hits", [])
+        if total > len(hits) or len(hits) >= max_size:
+            return None
+        return {hit["_id"]: hit.get("_source", {}).get("remark") for hit in hits}
+
     async def recall_by_appname(self, app_name):
         """Retrieve all document IDs for a specific app name.
 
@@ -706,27 +1037,54 @@ class VearchDB(BaseVectorDB):
 
         Returns:
             list: List of tool names that match the criteria
+
+        NOTE:
+            When hybrid retrieval is enabled, tools are also ranked by BM25 over their
+            names and descriptions. A conclusive lexical match skips the embedding
+            call; otherwise both rankings are merged by reciprocal rank fusion.
         """
+        lexical_tools = []
+        index = self._tool_lexical_indexes.get((app_name, agent_name))
+        if index is not None and Config.get_tool_retrieval_is_hybrid():
+            lexical_tools, is_confident = self._lexical_tool_retrieval(
+                index, query, top_k
+            )
+            if is_confident or self.emb_func is None:
+                self.tool_retrieval_stats["lexical"] += 1
+                return lexical_tools
+
         filter = {"app_name": app_name, "agent_name": agent_name}
         emb = await self.emb_func([query])
-        # Perform filtered similarity search
-        resp = await self.vearch_tools.filter_and_emb_search(
-            self.config.db_name,
-            self.config.tool_space_name,
-            self.config.router_url,
-            emb,
-            top_k,
-            [],
-            filter,
-        )
+        # Perform filtered similarity search, with more candidates to fuse
+        with self._timed("tool_retrieval"):
+            resp = await self.vearch_tools.filter_and_emb_search(
+                self.config.db_name,
+                self.config.tool_space_name,
+                self.config.router_url,
+                emb,
+                top_k * 2 if lexical_tools else top_k,
+                [],
+                filter,
+            )
         # Process results and apply threshold
         if resp["hits"]["total"] > 0:
             res_df = self.vearch_tools.retrieval2df(resp)
             res_df = res_df.loc[res_df["_score"] > threshold]
             tools = res_df["tool_name"].to_list()
-            return tools
         else:
-            return []
+            tools = []
+        if not lexical_tools:
+            self.tool_retrieval_stats["vector"] += 1
+            return tools[:top_k]
+        self.tool_retrieval_stats["hybrid"] += 1
+        return reciprocal_rank_fusion(
+            [tools, lexical_tools],
+            weights=[
+                Config.get_tool_retrieval_vector_weight(),
+                Config.get_tool_retrieval_lexical_weight(),
+            ],
+            top_k=top_k,
+        )
 
     ##
     ## NOTE:Agent-level methods for table operations
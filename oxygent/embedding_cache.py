@@ -1,26 +1,81 @@
+import asyncio
 import base64
 import hashlib
 import json
 import logging
+import mmap
 import os
 import pickle
+import weakref
+import zlib
+from collections.abc import MutableMapping
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
 
 import httpx
 import numpy as np
-from tqdm import tqdm
 
 from .config import Config
 
 logger = logging.getLogger(__name__)
 
+# One pooled HTTP client and one batcher per event loop, as httpx clients are
+# bound to the loop they were created in
+_http_clients = weakref.WeakKeyDictionary()
+_batchers = weakref.WeakKeyDictionary()
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    """Return the pooled client of the running event loop."""
+    loop = asyncio.get_running_loop()
+    client = _http_clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            timeout=Config.get_embedding_timeout(),
+            limits=httpx.Limits(
+                max_connections=Config.get_embedding_max_concurrency() * 2,
+                max_keepalive_connections=Config.get_embedding_max_concurrency(),
+            ),
+        )
+        _http_clients[loop] = client
+    return client
+
+
+async def close_http_client():
+    """Close the pooled client of the running event loop, if any."""
+    client = _http_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+def decode_embeddings(output) -> np.ndarray:
+    """Decode base64-encoded JSON arrays into one matrix with a single parse.
+
+    Args:
+        output (list[str]): Base64 strings, each a JSON-serialised 2-D array.
+
+    Returns:
+        np.ndarray: The arrays concatenated along the first axis.
+    """
+    decoded = [base64.b64decode(item).decode("utf-8") for item in output]
+    try:
+        array = np.asarray(json.loads("[" + ",".join(decoded) + "]"), dtype=float)
+        return array.reshape(-1, array.shape[-1])
+    except ValueError:
+        # Items of different shapes
+        return np.concatenate([np.array(json.loads(item)) for item in decoded])
+
 
 async def get_embedding(querys):
     """Retrieve L2-normalised embeddings for a batch of input texts.
 
-    The routine wraps an asynchronous HTTP request to the embedding service
-    configured in :class:`~config.Config`.  The service is expected to follow
-    the Triton-style JSON inference schema and to return base64-encoded NumPy
-    arrays.
+    The routine sends an HTTP request to the embedding service configured in
+    :class:`~config.Config` on the pooled client of the running event loop. The
+    service is expected to follow the Triton-style JSON inference schema and to
+    return base64-encoded NumPy arrays.
 
     Args:
         querys (Sequence[str]): A non-empty list or tuple of UTF-8 strings for
@@ -48,18 +103,17 @@ async def get_embedding(querys):
                     "name": "text",
                     "shape": [text_len],
                     "datatype": "BYTES",
-                    "data": querys,
+                    "data": list(querys),
                 },
             ],
             "outputs": [{"name": "last_hidden_state_clip"}],
         }
         headers = {"Accept-Encoding": "identity"}
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                url=Config.get_vearch_embedding_model_url(), headers=headers, json=data
-            )
-            result = response.json()
+        response = await _get_http_client().post(
+            url=Config.get_vearch_embedding_model_url(), headers=headers, json=data
+        )
+        result = response.json()
 
         # ------------------------------------------------------------------
         # The server returns a list whose elements are base64‑encoded strings
@@ -67,16 +121,9 @@ async def get_embedding(querys):
         # concatenate them into a single NumPy array before L2‑normalising.
         # ------------------------------------------------------------------
 
-        output = result["outputs"][0]["data"]
-        res_lis = []
-        for item in output:
-            item_output = base64.b64decode(item).decode("utf-8")
-            # res_lis.append(np.array(eval(item_output)))
-            res_lis.append(np.array(json.loads(item_output)))
-        res_lis = np.concatenate(res_lis)
-
+        res_lis = decode_embeddings(result["outputs"][0]["data"])
         norms = np.linalg.norm(res_lis, axis=1, keepdims=True)  # Compute L2 norms
-        res_lis = res_lis / norms
+        res_lis = res_lis / np.maximum(norms, 1e-12)
 
         return res_lis
 
@@ -84,12 +131,338 @@ async def get_embedding(querys):
         logger.error(e)
 
 
+class EmbeddingBatcher:
+    """Coalesce embedding requests of concurrent callers into batched calls.
+
+    Texts submitted within ``batch_window_ms`` of each other are sent together,
+    in batches of at most ``max_batch_size`` texts and with at most
+    ``max_concurrency`` batches in flight. A text requested by several callers
+    is embedded once.
+
+    Args:
+        batch_window_ms (float, optional): How long to wait for more texts
+            before sending a partial batch.
+        max_batch_size (int, optional): Maximum number of texts per request.
+        max_concurrency (int, optional): Maximum number of requests in flight.
+    """
+
+    def __init__(self, batch_window_ms=None, max_batch_size=None, max_concurrency=None):
+        if batch_window_ms is None:
+            batch_window_ms = Config.get_embedding_batch_window_ms()
+        self.batch_window = batch_window_ms / 1000
+        self.max_batch_size = max_batch_size or Config.get_embedding_max_batch_size()
+        self.max_concurrency = max_concurrency or Config.get_embedding_max_concurrency()
+        # text -> futures of the callers waiting for it
+        self._pending: dict = {}
+        self._flush_handle = None
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._tasks = set()
+        self.request_count = 0
+        self.text_count = 0
+
+    async def embed(self, texts) -> np.ndarray:
+        """Return the embeddings of *texts*, in order."""
+        if not texts:
+            return np.empty((0, 0))
+        loop = asyncio.get_running_loop()
+        futures = []
+        for text in texts:
+            future = loop.create_future()
+            self._pending.setdefault(text, []).append(future)
+            futures.append(future)
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.batch_window, self._flush)
+        return np.stack(await asyncio.gather(*futures))
+
+    def _flush(self):
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        pending, self._pending = self._pending, {}
+        texts = list(pending)
+        for start in range(0, len(texts), self.max_batch_size):
+            batch = {text: pending[text] for text in texts[start : start + self.max_batch_size]}
+            task = asyncio.create_task(self._send(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _send(self, batch: dict):
+        texts = list(batch)
+        try:
+            async with self._semaphore:
+                self.request_count += 1
+                self.text_count += len(texts)
+                features = await get_embedding(texts)
+            if features is None or len(features) != len(texts):
+                raise ValueError(f"Embedding service failed for {len(texts)} texts")
+            for text, feature in zip(texts, features):
+                for future in batch[text]:
+                    if not future.done():
+                        future.set_result(feature)
+        except Exception as e:
+            for futures in batch.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(e)
+
+
+def get_embedding_batcher() -> EmbeddingBatcher:
+    """Return the batcher shared by the callers of the running event loop."""
+    loop = asyncio.get_running_loop()
+    batcher = _batchers.get(loop)
+    if batcher is None:
+        batcher = EmbeddingBatcher()
+        _batchers[loop] = batcher
+    return batcher
+
+
+# One index record per stored vector: md5 digest, byte offset in the vector
+# log, vector dimension and CRC32 of the vector bytes
+INDEX_DTYPE = np.dtype(
+    [("md5", "u1", (16,)), ("offset", "<u8"), ("dim", "<u4"), ("crc", "<u4")]
+)
+# Index records whose vector bytes are checked when the store is opened
+_CHECKED_TAIL_SIZE = 16
+
+
+class EmbeddingStore(MutableMapping):
+    """Append-only, memory-mapped storage of embedding vectors by MD5 key.
+
+    Vectors are appended as float32 to ``embedding_vectors.bin`` and indexed by
+    fixed-size records appended to ``embedding_index.bin`` once their vector is
+    written. Opening the store maps both files without reading the vectors, and
+    saving writes only the new entries. A crash can at worst leave a torn tail,
+    which is ignored on the next open. Superseded entries are dropped by
+    :meth:`compact`, to be run while no other process uses the store.
+
+    Args:
+        save_dir (str): Directory of the store files.
+    """
+
+    def __init__(self, save_dir):
+        self.vector_file = os.path.join(save_dir, "embedding_vectors.bin")
+        self.index_file = os.path.join(save_dir, "embedding_index.bin")
+        self.offsets = {}  # md5 hex -> (offset, dim)
+        self.pending = {}  # md5 hex -> vector not saved yet
+        self._index_size = 0  # bytes of the index file already loaded
+        self._vectors = None
+        self._load_index()
+
+    # ------------------------------------------------------------------
+    # Loading
+    # ------------------------------------------------------------------
+
+    def _read_index(self, start):
+        """Return the complete index records after byte *start*."""
+        if not os.path.exists(self.index_file):
+            return np.empty(0, dtype=INDEX_DTYPE)
+        size = os.path.getsize(self.index_file)
+        count = (size - start) // INDEX_DTYPE.itemsize
+        if count <= 0:
+            return np.empty(0, dtype=INDEX_DTYPE)
+        return np.memmap(
+            self.index_file, dtype=INDEX_DTYPE, mode="r", offset=start, shape=(count,)
+        )
+
+    def _is_valid_record(self, record, vector_size):
+        end = int(record["offset"]) + 4 * int(record["dim"])
+        if end > vector_size:
+            return False
+        with open(self.vector_file, "rb") as f:
+            f.seek(int(record["offset"]))
+            return zlib.crc32(f.read(4 * int(record["dim"]))) == int(record["crc"])
+
+    def _get_vector_size(self):
+        if os.path.exists(self.vector_file):
+            return os.path.getsize(self.vector_file)
+        return 0
+
+    def _count_valid_records(self, records, vector_size):
+        """Number of leading records kept once the torn tail is dropped."""
+        count = len(records)
+        # Only the tail can be torn: drop records up to the last valid one
+        for i in range(count - 1, max(count - _CHECKED_TAIL_SIZE, 0) - 1, -1):
+            if self._is_valid_record(records[i], vector_size):
+                break
+            count = i
+        return count
+
+    def _load_index(self):
+        records = self._read_index(self._index_size)
+        if not len(records):
+            return
+        count = self._count_valid_records(records, self._get_vector_size())
+        records = records[:count]
+        # One hex conversion for all digests is much faster than one per record
+        md5_hex = np.ascontiguousarray(records["md5"]).tobytes().hex()
+        self.offsets.update(
+            zip(
+                (md5_hex[i : i + 32] for i in range(0, len(md5_hex), 32)),
+                zip(records["offset"].tolist(), records["dim"].tolist()),
+            )
+        )
+        self._index_size += count * INDEX_DTYPE.itemsize
+        self._vectors = None
+
+    def refresh(self):
+        """Load the entries appended by other instances or processes."""
+        if (
+            os.path.exists(self.index_file)
+            and os.path.getsize(self.index_file) > self._index_size
+        ):
+            self._load_index()
+
+    def _get_vectors(self):
+        if self._vectors is None:
+            with open(self.vector_file, "rb") as f:
+                mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            # A plain ndarray over the mapping slices much faster than np.memmap
+            self._vectors = np.frombuffer(mapping, dtype=np.float32)
+        return self._vectors
+
+    # ------------------------------------------------------------------
+    # Mapping interface
+    # ------------------------------------------------------------------
+
+    def __contains__(self, md5):
+        if md5 in self.pending or md5 in self.offsets:
+            return True
+        self.refresh()
+        return md5 in self.offsets
+
+    def __getitem__(self, md5):
+        if md5 in self.pending:
+            return self.pending[md5]
+        if md5 not in self:
+            raise KeyError(md5)
+        offset, dim = self.offsets[md5]
+        start = offset // 4
+        return self._get_vectors()[start : start + dim]
+
+    def __setitem__(self, md5, vector):
+        self.pending[md5] = vector
+
+    def __delitem__(self, md5):
+        raise NotImplementedError("EmbeddingStore is append-only")
+
+    def __iter__(self):
+        yield from self.offsets
+        yield from (md5 for md5 in self.pending if md5 not in self.offsets)
+
+    def __len__(self):
+        return len(self.offsets) + sum(
+            1 for md5 in self.pending if md5 not in self.offsets
+        )
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def _truncate_torn_index(self, index_f):
+        """Cut a torn tail off the index before appending to it.
+
+        Records appended after a partial or invalid one would be misaligned or
+        follow garbage, so every later entry would be dropped on load. Must be
+        called while holding the index lock.
+        """
+        size = os.fstat(index_f.fileno()).st_size
+        count = size // INDEX_DTYPE.itemsize
+        start = max(count - _CHECKED_TAIL_SIZE, 0)
+        tail = np.fromfile(
+            self.index_file,
+            dtype=INDEX_DTYPE,
+            count=count - start,
+            offset=start * INDEX_DTYPE.itemsize,
+        )
+        valid_size = (
+            start + self._count_valid_records(tail, self._get_vector_size())
+        ) * INDEX_DTYPE.itemsize
+        if valid_size < size:
+            logger.warning(
+                f"Truncate torn tail of {self.index_file}: {size} -> {valid_size} bytes"
+            )
+            index_f.truncate(valid_size)
+            # Load the records appended next even if the cut ones were loaded
+            self._index_size = min(self._index_size, valid_size)
+
+    def flush(self):
+        """Append the pending vectors, then their index records."""
+        if not self.pending:
+            return
+        os.makedirs(os.path.dirname(self.vector_file), exist_ok=True)
+        with open(self.index_file, "ab") as index_f:
+            if fcntl is not None:
+                # Serialize appends of concurrent processes
+                fcntl.flock(index_f, fcntl.LOCK_EX)
+            try:
+                self._truncate_torn_index(index_f)
+                with open(self.vector_file, "ab") as vector_f:
+                    offset = vector_f.seek(0, os.SEEK_END)
+                    records = np.empty(len(self.pending), dtype=INDEX_DTYPE)
+                    for i, (md5, vector) in enumerate(self.pending.items()):
+                        data = np.ascontiguousarray(vector, dtype=np.float32).tobytes()
+                        vector_f.write(data)
+                        records[i] = (
+                            np.frombuffer(bytes.fromhex(md5), dtype=np.uint8),
+                            offset,
+                            len(data) // 4,
+                            zlib.crc32(data),
+                        )
+                        offset += len(data)
+                    vector_f.flush()
+                    os.fsync(vector_f.fileno())
+                index_f.write(records.tobytes())
+                index_f.flush()
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(index_f, fcntl.LOCK_UN)
+        self.pending.clear()
+        self.refresh()
+
+    def compact(self):
+        """Rewrite the store with one entry per key; run it offline."""
+        self.flush()
+        self.refresh()
+        if not self.offsets:
+            return
+        vectors = self._get_vectors()
+        records = np.empty(len(self.offsets), dtype=INDEX_DTYPE)
+        tmp_vector_file = self.vector_file + ".tmp"
+        tmp_index_file = self.index_file + ".tmp"
+        new_offsets = {}
+        with open(tmp_vector_file, "wb") as f:
+            new_offset = 0
+            for i, (md5, (offset, dim)) in enumerate(self.offsets.items()):
+                data = vectors[offset // 4 : offset // 4 + dim].tobytes()
+                f.write(data)
+                records[i] = (
+                    np.frombuffer(bytes.fromhex(md5), dtype=np.uint8),
+                    new_offset,
+                    dim,
+                    zlib.crc32(data),
+                )
+                new_offsets[md5] = (new_offset, dim)
+                new_offset += len(data)
+        with open(tmp_index_file, "wb") as f:
+            f.write(records.tobytes())
+        self._vectors = None
+        # The empty index keeps the store consistent between the two renames
+        open(self.index_file, "wb").close()
+        os.replace(tmp_vector_file, self.vector_file)
+        os.replace(tmp_index_file, self.index_file)
+        self.offsets = new_offsets
+        self._index_size = len(records) * INDEX_DTYPE.itemsize
+
+
 class EmbeddingCache:
     """Lightweight, disk‑backed cache for text embeddings.
 
     The cache stores the MD5 hash of an input string as the key and its
-    corresponding embedding vector as the value.  Writing to disk is batched to
-    minimise I/O overhead.
+    corresponding embedding vector as the value, in an append-only
+    :class:`EmbeddingStore`.  Writing to disk is batched to minimise I/O
+    overhead, and only appends the new embeddings.
 
     Example:
         >>> async with EmbeddingCache() as cache:
@@ -104,7 +477,9 @@ class EmbeddingCache:
                 accumulate before the in‑memory cache is flushed to disk.
                 Defaults to ``1000``.
         """
-        self.file = os.path.join(Config.get_cache_save_dir(), "cache.pkl")
+        self.save_dir = Config.get_cache_save_dir()
+        # Legacy pickle, imported once into the store
+        self.file = os.path.join(self.save_dir, "cache.pkl")
         self.count = 0
         self.save_batch = save_batch
         self.data = self.load()
@@ -115,23 +490,31 @@ class EmbeddingCache:
         return hashlib.md5(key.encode("utf-8")).hexdigest()
 
     def load(self):
-        """Load the on‑disk cache if it exists; otherwise, return an empty dict."""
-        if not os.path.exists(self.file):
-            return dict()
-        with open(self.file, "rb") as f:
-            return pickle.load(f)
+        """Open the on‑disk store, importing the legacy pickle into a new one."""
+        store = EmbeddingStore(self.save_dir)
+        if not len(store) and os.path.exists(self.file):
+            try:
+                with open(self.file, "rb") as f:
+                    store.update(pickle.load(f))
+                store.flush()
+            except Exception as e:
+                logger.error(f"Failed to import embedding cache {self.file}: {e}")
+        return store
 
-    # TODO: save embeddings
     def save(self):
-        """Persist the in‑memory cache to disk (no‑op if nothing new)."""
+        """Append the new embeddings to disk (no‑op if nothing new)."""
         if not self.count:
             return
         try:
-            with open(self.file, "wb") as f:
-                pickle.dump(self.data, f)
+            self.data.flush()
             self.count = 0
         except Exception as e:
-            logger.error("Failed to save embedding cache", e)
+            logger.error(f"Failed to save embedding cache: {e}")
+
+    def compact(self):
+        """Drop superseded entries from disk; run it while the cache is unused."""
+        self.data.compact()
+        self.count = 0
 
     # ---------------------------------------------------------------------
     # Public API
@@ -155,48 +538,25 @@ class EmbeddingCache:
             return await self._get_single(key)
 
     async def _get_multiple(self, keys):
-        feature_list = []
-        texts = []
-
-        for k in tqdm(keys, desc="embedding tools"):
-            feature = await self._get_or_queue(k, texts)
-            if feature is not None:
-                feature_list.append(feature)
-
-            # Send queued texts if any
-            if len(texts) >= 1:
-                features = await self._embed_and_cache(texts)
-                feature_list.extend(features)
-                texts.clear()
-
-        # Final flush for remaining texts
-        if texts:
-            features = await self._embed_and_cache(texts)
-            feature_list.extend(features)
-
-        return np.array(feature_list)
+        keys = list(keys)
+        missing = list(
+            dict.fromkeys(k for k in keys if self.get_md5(k) not in self.data)
+        )
+        if missing:
+            # Concurrent callers share batched requests through the batcher
+            features = await get_embedding_batcher().embed(missing)
+            for content, feature in zip(missing, features):
+                self.set(content, feature)
+        return np.array([self.data[self.get_md5(k)] for k in keys])
 
     async def _get_single(self, key):
         key_md5 = self.get_md5(key)
         if key_md5 in self.data:
             return self.data[key_md5]
-        feature = (await get_embedding([key]))[0]
+        feature = (await get_embedding_batcher().embed([key]))[0]
         self.set(key, feature)
         return feature
 
-    async def _get_or_queue(self, key, texts):
-        key_md5 = self.get_md5(key)
-        if key_md5 in self.data:
-            return self.data[key_md5]
-        texts.append(key)
-        return None
-
-    async def _embed_and_cache(self, texts):
-        features = await get_embedding(texts)
-        for content, feature in zip(texts, features):
-            self.set(content, feature)
-        return features
-
     def __enter__(self):
         return self
 
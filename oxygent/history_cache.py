@@ -0,0 +1,189 @@
+"""In-process, write-through cache of conversation history.
+
+Agents read their short memory from ``{app}_history`` on every invocation, which
+re-fetches the same records on every turn of a multi-turn session. The
+:class:`HistoryCache` keeps the records of recently used sessions in memory:
+
+* ``put`` is called when a history record is written, so the cache always
+  holds the records written by this process.
+* ``fill`` merges the records returned by an Elasticsearch query.
+* ``get`` answers a history query only when the cache is known to hold every
+  record the query would return, otherwise it returns ``None`` and the caller
+  falls back to Elasticsearch.
+
+It also keeps the rolling summary digests of long conversations (see
+``LocalAgent.is_summarize_memory``).
+
+Memory is bounded by the number of sessions (LRU) and the number of records per
+session; sessions expire after ``ttl`` seconds without access.
+"""
+
+import logging
+import time
+from collections import OrderedDict
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+class _SessionHistory:
+    """History records of one session and the traces they fully cover."""
+
+    def __init__(self):
+        self.created_at = time.monotonic()
+        self.accessed_at = self.created_at
+        self.records: list = []
+        self.history_ids: set = set()
+        # Traces whose records were loaded from Elasticsearch
+        self.es_trace_ids: set = set()
+        # Size of the last truncated Elasticsearch query, None if never truncated
+        self.window: Optional[int] = None
+
+    def add(self, record: dict):
+        if record["history_id"] in self.history_ids:
+            return
+        self.history_ids.add(record["history_id"])
+        self.records.append(record)
+
+
+class HistoryCache:
+    """Per-``session_name`` LRU cache of history records with TTL eviction.
+
+    Args:
+        max_sessions (int): Maximum number of cached sessions.
+        max_records_per_session (int): Sessions growing beyond this are evicted.
+        ttl (float): Seconds a session stays cached without access.
+    """
+
+    def __init__(
+        self,
+        max_sessions: int = 1024,
+        max_records_per_session: int = 256,
+        ttl: float = 3600,
+    ):
+        self.max_sessions = max_sessions
+        self.max_records_per_session = max_records_per_session
+        self.ttl = ttl
+        self._sessions: OrderedDict[str, _SessionHistory] = OrderedDict()
+        # trace_id -> time the trace started in this process
+        self._trace_start_times: OrderedDict[str, float] = OrderedDict()
+        # (session_name, root_trace_id) -> (rolling summary digest, cached time)
+        self._digests: OrderedDict[tuple, tuple] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def start_trace(self, trace_id: str):
+        """Register a trace started by this process.
+
+        Every history record of such a trace is written through this cache, so
+        sessions cached before the trace started cover it completely.
+        """
+        self._trace_start_times[trace_id] = time.monotonic()
+        self._trace_start_times.move_to_end(trace_id)
+        while len(self._trace_start_times) > self.max_sessions * 4:
+            self._trace_start_times.popitem(last=False)
+
+    def _get_session(self, session_name: str) -> Optional[_SessionHistory]:
+        session = self._sessions.get(session_name)
+        if session is None:
+            return None
+        now = time.monotonic()
+        if now - session.accessed_at > self.ttl:
+            del self._sessions[session_name]
+            return None
+        session.accessed_at = now
+        self._sessions.move_to_end(session_name)
+        return session
+
+    def _get_or_create_session(self, session_name: str) -> _SessionHistory:
+        session = self._get_session(session_name)
+        if session is None:
+            session = _SessionHistory()
+            self._sessions[session_name] = session
+            while len(self._sessions) > self.max_sessions:
+                self._sessions.popitem(last=False)
+        return session
+
+    def _check_size(self, session_name: str, session: _SessionHistory):
+        if len(session.records) > self.max_records_per_session:
+            del self._sessions[session_name]
+
+    def _is_covered(self, session: _SessionHistory, trace_id: str) -> bool:
+        if trace_id in session.es_trace_ids:
+            return True
+        start_time = self._trace_start_times.get(trace_id)
+        return start_time is not None and start_time >= session.created_at
+
+    def put(self, session_name: str, record: dict):
+        """Write through a history record.
+
+        Args:
+            session_name (str): Session of the record.
+            record (dict): With ``history_id``, ``trace_id``, ``create_time`` and
+                the decoded ``memory``.
+        """
+        session = self._get_or_create_session(session_name)
+        session.add(record)
+        self._check_size(session_name, session)
+
+    def fill(self, session_name: str, trace_ids: list, size: int, records: list):
+        """Merge the records returned by an Elasticsearch history query."""
+        session = self._get_or_create_session(session_name)
+        for record in records:
+            session.add(record)
+        session.records.sort(key=lambda record: record["create_time"])
+        session.es_trace_ids.update(trace_ids)
+        if len(records) >= size:
+            session.window = size if session.window is None else min(session.window, size)
+        self._check_size(session_name, session)
+
+    def get(self, session_name: str, trace_ids: list, size: int) -> Optional[list]:
+        """Return the latest *size* records of *trace_ids*, oldest first.
+
+        Returns:
+            Optional[list]: The records, or None if the cache cannot answer.
+        """
+        session = self._get_session(session_name)
+        if (
+            session is None
+            or not all(self._is_covered(session, trace_id) for trace_id in trace_ids)
+            or (
+                session.window is not None
+                and (
+                    size > session.window
+                    or not session.es_trace_ids.issubset(trace_ids)
+                )
+            )
+        ):
+            self.misses += 1
+            return None
+        self.hits += 1
+        trace_id_set = set(trace_ids)
+        records = [
+            record for record in session.records if record["trace_id"] in trace_id_set
+        ]
+        return records[-size:] if size > 0 else []
+
+    def get_digest(self, session_name: str, root_trace_id: str) -> Optional[dict]:
+        """Return the cached summary digest of a conversation in a session."""
+        key = (session_name, root_trace_id)
+        if key not in self._digests:
+            return None
+        digest, cached_at = self._digests[key]
+        if time.monotonic() - cached_at > self.ttl:
+            del self._digests[key]
+            return None
+        self._digests.move_to_end(key)
+        return digest
+
+    def put_digest(self, session_name: str, root_trace_id: str, digest: dict):
+        key = (session_name, root_trace_id)
+        self._digests[key] = (digest, time.monotonic())
+        self._digests.move_to_end(key)
+        while len(self._digests) > self.max_sessions:
+            self._digests.popitem(last=False)
+
+    def clear(self):
+        self._sessions.clear()
+        self._trace_start_times.clear()
+        self._digests.clear()
@@ -12,6 +12,9 @@ NOTE: This module contains the following parts:
     - master_agent_name: Name of the master agent (instance of BaseAgent)
     - active_tasks: Dictionary to manage active tasks, for SSE and other async operations
     - es_client / redis_client / vearch_client: Database clients for Elasticsearch, Redis, and Vearch
+    - history_cache: In-memory write-through cache of the history table
+    - message_coalescer: Merges streamed LLM deltas before they are pushed to Redis
+    - message_writer: Buffers stored messages and writes them to ES in bulk
     - agent_organization: Dictionary representing the organization structure of agents
     - lock: Boolean to control task execution flow
 """
@@ -28,17 +31,22 @@ import msgpack
 from elasticsearch import AsyncElasticsearch
 from pydantic import BaseModel, ConfigDict, Field
 
+from .batch_runner import BatchRunner
 from .config import Config
-from .databases.db_es import JesEs, LocalEs
+from .databases.db_es import BulkWriter, JesEs, LocalEs
 from .databases.db_redis import JimdbApRedis, LocalRedis
-from .databases.db_vector import VearchDB
+from .databases.db_vector import LocalVectorDB, VearchDB
 from .db_factory import DBFactory
+from .embedding_cache import close_http_client as close_embedding_http_client
+from .history_cache import HistoryCache
 from .log_setup import setup_logging
+from .message_coalescer import MessageCoalescer
 from .oxy import Oxy
 from .oxy.agents.base_agent import BaseAgent
 from .oxy.agents.remote_agent import RemoteAgent
 from .oxy.base_flow import BaseFlow
 from .oxy.base_tool import BaseTool
+from .oxy.function_tools.function_hub import FunctionHub
 from .oxy.llms.base_llm import BaseLLM
 from .oxy.mcp_tools.base_mcp_client import BaseMCPClient
 from .routes import router
@@ -46,6 +54,7 @@ from .schemas import OxyRequest, OxyResponse, WebResponse
 from .utils.common_utils import (
     generate_uuid,
     get_format_time,
+    get_md5,
     msgpack_preprocess,
     print_tree,
     to_json,
@@ -78,6 +87,9 @@ class MAS(BaseModel):
     vearch_client: Optional[VearchDB] = Field(None)
     es_client: Optional[AsyncElasticsearch] = Field(None)
     redis_client: Optional[JimdbApRedis] = Field(None)
+    history_cache: Optional[HistoryCache] = Field(None)
+    message_coalescer: Optional[MessageCoalescer] = Field(None)
+    message_writer: Optional[BulkWriter] = Field(None)
 
     lock: bool = Field(False)
     active_tasks: dict = Field(default_factory=dict)
@@ -128,9 +140,16 @@ class MAS(BaseModel):
         logger.info("=" * 64)
         logger.info("🪂 OxyGent MAS Application Exit")
         logger.info("=" * 64)
+        if self.message_coalescer:
+            await self.message_coalescer.close()
+        if self.message_writer:
+            await self.message_writer.close()
         await self.es_client.close()
         await self.redis_client.close()
         await self.cleanup_servers()
+        if self.vearch_client:
+            await self.vearch_client.close()
+        await close_embedding_http_client()
 
     @classmethod
     async def create(cls, **kwargs):
@@ -218,12 +237,12 @@ class MAS(BaseModel):
         """Gracefully shut down remote servers/clients.
 
         The method concurrently calls ``cleanup()`` on every
-        :class:`BaseMCPClient` that has been registered.  It is automatically
-        invoked by :func:`__aexit__`.
+        :class:`BaseMCPClient` and :class:`FunctionHub` that has been registered.
+        It is automatically invoked by :func:`__aexit__`.
         """
         cleanup_tasks = []
         for oxy in self.oxy_name_to_oxy.values():
-            if not isinstance(oxy, BaseMCPClient):
+            if not isinstance(oxy, (BaseMCPClient, FunctionHub)):
                 continue
             cleanup_tasks.append(asyncio.create_task(oxy.cleanup()))
 
@@ -239,6 +258,8 @@ class MAS(BaseModel):
         {app_name}_trace: trace_id: record trace of each call
         {app_name}_node: node_id: record log of each node
         {app_name}_history: history_id: record history of read and write operations
+        {app_name}_history_digest: digest_id: rolling summary of long sessions
+        {app_name}_blob: version_blob_id: large strings shared by node records
         """
 
         # es
@@ -251,6 +272,15 @@ class MAS(BaseModel):
             self.es_client = db_factory.get_instance(JesEs, hosts, user, password)
         else:
             self.es_client = db_factory.get_instance(LocalEs)
+        # Buffered writes trade durability for throughput, so they are opt-in
+        if Config.get_message_store_flush_interval_ms() > 0:
+            self.message_writer = BulkWriter(
+                self.es_client,
+                flush_size=Config.get_message_store_flush_size(),
+                flush_interval_ms=Config.get_message_store_flush_interval_ms(),
+                max_pending=Config.get_message_store_max_pending(),
+                overflow_policy=Config.get_message_store_overflow_policy(),
+            )
         # trace table
         await self.es_client.create_index(
             Config.get_app_name() + "_trace",
@@ -351,6 +381,54 @@ class MAS(BaseModel):
                 "settings": Config.get_es_settings_config(),
             },
         )
+        # history digest table
+        await self.es_client.create_index(
+            Config.get_app_name() + "_history_digest",
+            {
+                "mappings": {
+                    "properties": {
+                        "digest_id": {"type": "keyword"},
+                        "session_name": {"type": "keyword"},
+                        "root_trace_id": {"type": "keyword"},
+                        "trace_ids": {"type": "keyword"},
+                        "summary": {"type": "text"},
+                        "last_create_time": {
+                            "format": "yyyy-MM-dd HH:mm:ss.SSSSSSSSS",
+                            "type": "date",
+                        },
+                        "create_time": {
+                            "format": "yyyy-MM-dd HH:mm:ss.SSSSSSSSS",
+                            "type": "date",
+                        },
+                    },
+                },
+                "settings": Config.get_es_settings_config(),
+            },
+        )
+        if Config.get_history_cache_is_enabled():
+            self.history_cache = HistoryCache(
+                max_sessions=Config.get_history_cache_max_sessions(),
+                max_records_per_session=Config.get_history_cache_max_records_per_session(),
+                ttl=Config.get_history_cache_ttl(),
+            )
+        # blob table
+        await self.es_client.create_index(
+            Config.get_app_name() + "_blob",
+            {
+                "mappings": {
+                    "properties": {
+                        "blob_id": {"type": "keyword"},
+                        "version": {"type": "keyword"},
+                        "content": {"type": "text", "index": False},
+                        "create_time": {
+                            "format": "yyyy-MM-dd HH:mm:ss.SSSSSSSSS",
+                            "type": "date",
+                        },
+                    },
+                },
+                "settings": Config.get_es_settings_config(),
+            },
+        )
 
         # init redis client
         redis_config = Config.get_redis_config()
@@ -364,6 +442,12 @@ class MAS(BaseModel):
             )
         else:
             self.redis_client = LocalRedis()
+        if Config.get_message_stream_flush_ms() > 0:
+            self.message_coalescer = MessageCoalescer(
+                self._push_message,
+                flush_ms=Config.get_message_stream_flush_ms(),
+                flush_bytes=Config.get_message_stream_flush_bytes(),
+            )
 
     async def batch_init_oxy(self, *class_type):
         """Batch initialize oxy objects of specified types asynchronously.
@@ -380,6 +464,16 @@ class MAS(BaseModel):
             if not isinstance(oxy, class_type):
                 continue
             oxy.set_mas(self)
+            if (
+                isinstance(oxy, BaseMCPClient)
+                and oxy.is_manifest_cached
+                and oxy.register_tools_from_manifest_cache()
+            ):
+                # Connect and refresh the tools without blocking the start-up
+                revalidate_task = asyncio.create_task(oxy.revalidate_tools())
+                self.background_tasks.add(revalidate_task)
+                revalidate_task.add_done_callback(self.background_tasks.discard)
+                continue
             task = oxy.init()
             if Config.get_tool_is_concurrent_init():
                 tasks.append(task)
@@ -491,8 +585,12 @@ class MAS(BaseModel):
                     continue
                 tool_list.append((self.name, tool_name, permitted_tool_name, tool_desc))
         if tool_list:
-            # vearch
-            self.vearch_client = VearchDB(Config.get_vearch_config())
+            # vearch, or the embedded vector store when no Vearch router is configured
+            vearch_config = Config.get_vearch_config()
+            if vearch_config.get("router_url"):
+                self.vearch_client = VearchDB(vearch_config)
+            else:
+                self.vearch_client = LocalVectorDB(vearch_config)
             await self.vearch_client.create_vearch_table_by_tool_list(tool_list)
 
     # ------------------------------------------------------------------
@@ -572,6 +670,9 @@ class MAS(BaseModel):
         The data is MsgPack‑encoded before being stored.  At most **10** items
         are kept to bound memory usage for long‑running SSE connections.
 
+        Streamed LLM deltas are not persisted unless they ask for it, and are
+        merged by the :class:`MessageCoalescer` before being pushed.
+
         Args:
             message: Any serialisable Python object.
             redis_key: Target Redis key (usually ``mas_msg:{app}:{trace_id}``).
@@ -585,6 +686,9 @@ class MAS(BaseModel):
         _is_stored, _is_send = "_is_stored", "_is_send"
         if isinstance(message, dict):
             message_type = message.get("type", "")
+            # Stream deltas are transient, the full answer is stored on its own
+            if message_type == "stream":
+                message_is_stored = False
             if _is_stored in message:
                 message_is_stored = message[_is_stored]
                 del message[_is_stored]
@@ -596,22 +700,32 @@ class MAS(BaseModel):
             parts = redis_key.split(":")
             current_trace_id = parts[-1] if len(parts) >= 3 else ""
 
-            # Insert into Elasticsearch
+            # Insert into Elasticsearch, in bulk off the request path if buffered
             message_id = generate_uuid()
-            await self.es_client.index(
-                Config.get_app_name() + "_message",
-                doc_id=message_id,
-                body={
-                    "message_id": message_id,
-                    "trace_id": current_trace_id,
-                    "message": to_json(message),
-                    "message_type": message_type,
-                    "create_time": get_format_time(),
-                },
-            )
+            body = {
+                "message_id": message_id,
+                "trace_id": current_trace_id,
+                "message": to_json(message),
+                "message_type": message_type,
+                "create_time": get_format_time(),
+            }
+            if self.message_writer:
+                await self.message_writer.add(
+                    Config.get_app_name() + "_message", message_id, body
+                )
+            else:
+                await self.es_client.index(
+                    Config.get_app_name() + "_message", doc_id=message_id, body=body
+                )
         if message_is_send:
-            bytes_msg = msgpack.packb(msgpack_preprocess(message))
-            await self.redis_client.lpush(redis_key, bytes_msg)
+            if self.message_coalescer:
+                await self.message_coalescer.add(message, redis_key)
+            else:
+                await self._push_message(message, redis_key)
+
+    async def _push_message(self, message, redis_key):
+        bytes_msg = msgpack.packb(msgpack_preprocess(message))
+        await self.redis_client.lpush(redis_key, bytes_msg)
 
     async def chat_with_agent(
         self,
@@ -788,9 +902,9 @@ class MAS(BaseModel):
             )
             self.active_tasks[current_trace_id] = task
             while True:
-                bytes_msg = await self.redis_client.rpop(redis_key)
+                # Woken up by the push of the next message, no polling
+                bytes_msg = await self.redis_client.brpop(redis_key, timeout=10)
                 if bytes_msg is None:
-                    await asyncio.sleep(0.1)
                     continue
                 message = msgpack.unpackb(bytes_msg)
                 if message:
@@ -1068,42 +1182,60 @@ class MAS(BaseModel):
     # Batch helper
     # ------------------------------------------------------------------
 
-    async def start_batch_processing(self, querys, return_trace_id=False):
+    async def start_batch_processing(
+        self,
+        querys,
+        return_trace_id=False,
+        concurrency=None,
+        checkpoint_path=None,
+        is_resume=False,
+    ):
         """Execute a batch of queries concurrently.
 
         Args:
             querys: Iterable of natural-language prompts.
             return_trace_id: If ``True`` the trace ID is returned together
                 with each answer - handy for offline audits.
+            concurrency: Maximum number of queries in flight, defaults to
+                ``Config.get_batch_concurrency()``.
+            checkpoint_path: Optional JSONL file each answer is appended to as
+                soon as it completes, keyed by the query text.
+            is_resume: If ``True`` the answers already in *checkpoint_path* are
+                reused instead of recomputed; otherwise it is started over.
 
         Returns:
-            list: Answers (or dicts with *output* + *trace_id*).
+            list: Answers (or dicts with *output* + *trace_id*), None for the
+            queries that failed.
         """
-        import time
-
-        cost_times = []
 
         async def handle_query(query):
-            start_time = time.time()
-            from_trace_id = ""
             payload = {
                 "query": query,
-                "from_trace_id": from_trace_id,
+                "from_trace_id": "",
                 "extra_arg": "value",
             }
             oxy_response = await self.chat_with_agent(payload=payload)
-            from_trace_id = oxy_response.oxy_request.current_trace_id
-            end_time = time.time()
-            cost_times.append(end_time - start_time)
-            if return_trace_id:
-                return {
-                    "output": oxy_response.output,
-                    "trace_id": oxy_response.oxy_request.current_trace_id,
-                }
-            else:
-                return oxy_response.output
+            return {
+                "output": oxy_response.output,
+                "trace_id": oxy_response.oxy_request.current_trace_id,
+            }
 
-        tasks = [asyncio.create_task(handle_query(query)) for query in querys]
-        results = await asyncio.gather(*tasks)
-        logger.info("done.")
-        return results
+        runner = BatchRunner(
+            handle_query,
+            concurrency=concurrency or Config.get_batch_concurrency(),
+            checkpoint_path=checkpoint_path,
+            is_resume=is_resume,
+        )
+        # Keyed by the query, so a changed list never reuses another answer
+        results = await runner.run(
+            list(querys), get_task_id=lambda query: get_md5(to_json(query))
+        )
+        logger.info(f"done. {runner.stats.summary()}")
+        if return_trace_id:
+            return [
+                None
+                if "error" in result
+                else {"output": result["output"], "trace_id": result["trace_id"]}
+                for result in results
+            ]
+        return [result.get("output") for result in results]
@@ -0,0 +1,134 @@
+"""Per-trace coalescing of streamed LLM deltas.
+
+Streaming LLMs send one ``{"type": "stream", "content": {"delta": ...}}`` message
+per token, and each of them used to cost a Redis push and an SSE frame. The
+:class:`MessageCoalescer` sits in front of the push: consecutive deltas of a trace
+are merged and sent as one message when the flush window expires or the merged
+text reaches the byte threshold, whichever comes first.
+
+Any other message flushes the pending deltas of its trace before being sent, so
+the order seen by the client is unchanged.
+"""
+
+import asyncio
+import logging
+import weakref
+from typing import Awaitable, Callable, Dict
+
+logger = logging.getLogger(__name__)
+
+
+def is_stream_delta(message) -> bool:
+    """Return True for a transient ``stream`` message carrying only a text delta."""
+    if not isinstance(message, dict) or message.get("type") != "stream":
+        return False
+    content = message.get("content")
+    return (
+        isinstance(content, dict)
+        and list(content) == ["delta"]
+        and isinstance(content["delta"], str)
+    )
+
+
+class _PendingDeltas:
+    """Deltas of one trace waiting to be sent as a single message."""
+
+    def __init__(self, template: dict):
+        # The message without its content, shared by all merged deltas
+        self.template = template
+        self.parts: list = []
+        self.size = 0
+
+    def add(self, delta: str):
+        self.parts.append(delta)
+        self.size += len(delta.encode("utf-8"))
+
+    def to_message(self) -> dict:
+        return dict(self.template, content={"delta": "".join(self.parts)})
+
+
+class MessageCoalescer:
+    """Merge the stream deltas of each Redis key within a flush window.
+
+    Args:
+        send (Callable): ``async send(message, redis_key)`` that delivers a message.
+        flush_ms (float): Longest time a delta waits for the next one.
+        flush_bytes (int): Size of merged text that triggers an immediate flush.
+    """
+
+    def __init__(
+        self,
+        send: Callable[[dict, str], Awaitable],
+        flush_ms: float = 30,
+        flush_bytes: int = 256,
+    ):
+        self.send = send
+        self.flush_interval = flush_ms / 1000
+        self.flush_bytes = flush_bytes
+        self._pending: Dict[str, _PendingDeltas] = {}
+        # One lock per key keeps the sends of a trace in order; unused locks are freed
+        self._locks = weakref.WeakValueDictionary()
+        self._timers: set = set()
+        self.received_count = 0
+        self.sent_count = 0
+
+    def _get_lock(self, redis_key: str) -> asyncio.Lock:
+        lock = self._locks.get(redis_key)
+        if lock is None:
+            lock = asyncio.Lock()
+            self._locks[redis_key] = lock
+        return lock
+
+    async def add(self, message, redis_key: str):
+        """Send *message*, merging it with the pending deltas when it is one."""
+        self.received_count += 1
+        if not is_stream_delta(message):
+            lock = self._get_lock(redis_key)
+            async with lock:
+                await self._flush_locked(redis_key)
+                await self._send(message, redis_key)
+            return
+
+        template = {k: v for k, v in message.items() if k != "content"}
+        pending = self._pending.get(redis_key)
+        if pending is not None and pending.template != template:
+            await self.flush(redis_key)
+            pending = None
+        if pending is None:
+            pending = self._pending[redis_key] = _PendingDeltas(template)
+            timer = asyncio.create_task(self._flush_later(redis_key, pending))
+            self._timers.add(timer)
+            timer.add_done_callback(self._timers.discard)
+        pending.add(message["content"]["delta"])
+        if pending.size >= self.flush_bytes:
+            await self.flush(redis_key)
+
+    async def flush(self, redis_key: str):
+        """Send the pending deltas of *redis_key* now."""
+        lock = self._get_lock(redis_key)
+        async with lock:
+            await self._flush_locked(redis_key)
+
+    async def close(self):
+        """Flush every key, then wait for the timers, which have nothing left."""
+        for redis_key in list(self._pending):
+            await self.flush(redis_key)
+        await asyncio.gather(*self._timers, return_exceptions=True)
+
+    async def _flush_later(self, redis_key: str, pending: _PendingDeltas):
+        await asyncio.sleep(self.flush_interval)
+        # Skip if these deltas were already flushed by size or by another message
+        if self._pending.get(redis_key) is pending:
+            try:
+                await self.flush(redis_key)
+            except Exception as e:
+                logger.error(f"Error flushing stream deltas of {redis_key}: {e}")
+
+    async def _flush_locked(self, redis_key: str):
+        pending = self._pending.pop(redis_key, None)
+        if pending is not None:
+            await self._send(pending.to_message(), redis_key)
+
+    async def _send(self, message, redis_key: str):
+        self.sent_count += 1
+        await self.send(message, redis_key)
@@ -5,6 +5,7 @@ implementations in the OxyGent system. It handles trace management, data persist
 and common agent lifecycle operations.
 """
 
+import json
 import logging
 from typing import Any
 
@@ -71,6 +72,10 @@ class BaseAgent(BaseFlow):
                 # Add the current from_trace_id to the root trace IDs
                 oxy_request.root_trace_ids.append(oxy_request.from_trace_id)
 
+            history_cache = getattr(self.mas, "history_cache", None)
+            if history_cache:
+                history_cache.start_trace(oxy_request.current_trace_id)
+
         return oxy_request
 
     async def _pre_save_data(self, oxy_request: OxyRequest):
@@ -204,6 +209,19 @@ class BaseAgent(BaseFlow):
 
                 # Store the conversation history record
                 history_id = generate_uuid()
+                memory = to_json(history)
+                create_time = get_format_time()
+                history_cache = getattr(self.mas, "history_cache", None)
+                if history_cache:
+                    history_cache.put(
+                        oxy_request.session_name,
+                        {
+                            "history_id": history_id,
+                            "trace_id": oxy_request.current_trace_id,
+                            "memory": json.loads(memory),
+                            "create_time": create_time,
+                        },
+                    )
                 await self.mas.es_client.index(
                     Config.get_app_name() + "_history",
                     doc_id=history_id,
@@ -211,8 +229,8 @@ class BaseAgent(BaseFlow):
                         "history_id": history_id,
                         "session_name": oxy_request.session_name,
                         "trace_id": oxy_request.current_trace_id,
-                        "memory": to_json(history),
-                        "create_time": get_format_time(),
+                        "memory": memory,
+                        "create_time": create_time,
                     },
                 )
             else:
@@ -6,6 +6,7 @@ capabilities. It handles tool retrieval, conversation history, and instruction b
 for LLM interactions.
 """
 
+import asyncio
 import copy
 import json
 import logging
@@ -15,7 +16,9 @@ from typing import Optional
 from pydantic import Field
 
 from ...config import Config
-from ...schemas import Memory, Message, OxyRequest, OxyResponse
+from ...prompts import MEMORY_SUMMARY_PROMPT
+from ...schemas import Memory, Message, OxyRequest, OxyResponse, OxyState
+from ...utils.common_utils import generate_uuid, get_format_time, to_json
 from ..base_tool import BaseTool
 from ..function_tools.function_hub import FunctionHub
 from ..function_tools.function_tool import FunctionTool
@@ -47,6 +50,10 @@ class LocalAgent(BaseAgent):
         short_memory_size (int): Number of conversation turns to retain.
         team_size (int): Number of parallel instances for team execution.
         is_retain_master_short_memory (bool): Whether to retain user history.
+        is_summarize_memory (bool): Whether to replace older turns of short
+            memory with a rolling summary digest.
+        summary_keep_turns (int): Number of latest turns kept verbatim when
+            summarizing.
         is_multimodal_supported (bool): Whether to support multimodal input.
         team_size (int): Number of parallel instances for m execution.
     """
@@ -98,6 +105,12 @@ class LocalAgent(BaseAgent):
     is_retain_master_short_memory: bool = Field(
         False, description="Whether to retrieve user history"
     )
+    is_summarize_memory: bool = Field(
+        False, description="Whether to summarize older turns of short memory"
+    )
+    summary_keep_turns: int = Field(
+        4, description="Number of latest turns kept verbatim when summarizing"
+    )
     is_attachment_processing_enabled: bool = Field(
         True, description="Whether to inject attachments into `query`."
     )
@@ -114,6 +127,9 @@ class LocalAgent(BaseAgent):
         if not self.llm_model:
             raise Exception(f"agent {self.name} not set llm_model")
 
+        # Sessions being summarized in background
+        self._summarizing_keys: set = set()
+
     def _init_available_tool_name_list(self):
         """Initialize the list of tools(sub-agents, MCP tools, function tools and
         function hubs) available to this agent.
@@ -179,6 +195,7 @@ class LocalAgent(BaseAgent):
         await super().init()
         if self.intent_understanding_agent:
             self.sub_agents.append(self.intent_understanding_agent)
+            self._invalidate_class_attr()
         self._init_available_tool_name_list()
         if self.llm_model not in self.mas.oxy_name_to_oxy:
             raise Exception(f"LLM model [{self.llm_model}] not exists.")
@@ -207,6 +224,222 @@ class LocalAgent(BaseAgent):
             parallel_agent.set_mas(self.mas)
             self.mas.oxy_name_to_oxy[self.name] = parallel_agent
 
+    async def _search_history(self, oxy_request: OxyRequest, session_name: str) -> list:
+        """Search the latest history records of a session in the current trace chain.
+
+        The history cache of the MAS is checked first, and Elasticsearch results
+        are written back to it.
+
+        Args:
+            oxy_request (OxyRequest): The current request containing trace info.
+            session_name (str): The session to search.
+
+        Returns:
+            list: History records of at most ``short_memory_size`` entries,
+                oldest first, each with ``history_id``, ``trace_id``,
+                ``create_time`` and the decoded ``memory``.
+        """
+        trace_ids = oxy_request.root_trace_ids + [oxy_request.current_trace_id]
+        history_cache = getattr(self.mas, "history_cache", None)
+        if history_cache:
+            records = history_cache.get(
+                session_name, trace_ids, self.short_memory_size
+            )
+            if records is not None:
+                return records
+        es_response = await self.mas.es_client.search(
+            Config.get_app_name() + "_history",
+            {
+                "query": {
+                    "bool": {
+                        "must": [
+                            {"terms": {"trace_id": trace_ids}},
+                            {"term": {"session_name": session_name}},
+                        ]
+                    }
+                },
+                "size": self.short_memory_size,
+                "sort": [{"create_time": {"order": "desc"}}],
+            },
+        )
+        records = [
+            {
+                "history_id": history["_source"]["history_id"],
+                "trace_id": history["_source"]["trace_id"],
+                "memory": json.loads(history["_source"]["memory"]),
+                "create_time": history["_source"]["create_time"],
+            }
+            for history in es_response["hits"]["hits"][::-1]
+        ]
+        if history_cache:
+            history_cache.fill(
+                session_name, trace_ids, self.short_memory_size, records
+            )
+        return records
+
+    async def _get_memory_digest(
+        self, session_name: str, trace_ids: list
+    ) -> Optional[dict]:
+        """Get the latest summary digest of the conversation in a session.
+
+        A digest is valid only if every trace it summarizes belongs to the
+        current trace chain.
+        """
+        history_cache = getattr(self.mas, "history_cache", None)
+        if history_cache:
+            digest = history_cache.get_digest(session_name, trace_ids[0])
+            if digest and set(digest["trace_ids"]).issubset(trace_ids):
+                return digest
+        es_response = await self.mas.es_client.search(
+            Config.get_app_name() + "_history_digest",
+            {
+                "query": {
+                    "bool": {
+                        "must": [
+                            {"term": {"session_name": session_name}},
+                            {"term": {"root_trace_id": trace_ids[0]}},
+                        ]
+                    }
+                },
+                "size": 10,
+                "sort": [{"create_time": {"order": "desc"}}],
+            },
+        )
+        for hit in (es_response or {}).get("hits", {}).get("hits", []):
+            digest = hit["_source"]
+            if set(digest["trace_ids"]).issubset(trace_ids):
+                if history_cache:
+                    history_cache.put_digest(session_name, trace_ids[0], digest)
+                return digest
+        return None
+
+    async def _summarize_history(
+        self,
+        session_name: str,
+        trace_ids: list,
+        digest: Optional[dict],
+        records: list,
+    ):
+        """Fold history records into the summary digest and save it.
+
+        The LLM is called on a detached request with its own trace: the summary
+        runs while the agent keeps executing, so it must not touch the node
+        graph of the user request nor stream into the user's messages.
+        """
+        summarizing_key = (session_name, trace_ids[0])
+        if summarizing_key in self._summarizing_keys:
+            return
+        self._summarizing_keys.add(summarizing_key)
+        try:
+            conversation = "\n\n".join(
+                f"User: {record['memory']['query']}\nAssistant: {to_json(record['memory']['answer'])}"
+                for record in records
+            )
+            summary = digest["summary"] if digest else ""
+            llm = self.mas.oxy_name_to_oxy[self.llm_model]
+            # Without a MAS the request sends no messages
+            summary_request = OxyRequest(
+                caller=self.name,
+                caller_category=self.category,
+                call_stack=["user", self.name],
+                arguments={
+                    "messages": [
+                        Message.system_message(MEMORY_SUMMARY_PROMPT.strip()).to_dict(),
+                        Message.user_message(
+                            f"Existing summary: {summary}\n---\nNew conversation turns:\n{conversation}"
+                        ).to_dict(),
+                    ]
+                },
+            )
+            oxy_response = await asyncio.wait_for(
+                llm.execute(summary_request), timeout=llm.timeout
+            )
+            if oxy_response.state is not OxyState.COMPLETED:
+                return
+            digest_id = generate_uuid()
+            new_digest = {
+                "digest_id": digest_id,
+                "session_name": session_name,
+                "root_trace_id": trace_ids[0],
+                "trace_ids": sorted(
+                    set(digest["trace_ids"] if digest else [])
+                    | {record["trace_id"] for record in records}
+                ),
+                "summary": to_json(oxy_response.output),
+                "last_create_time": records[-1]["create_time"],
+                "create_time": get_format_time(),
+            }
+            history_cache = getattr(self.mas, "history_cache", None)
+            if history_cache:
+                history_cache.put_digest(session_name, trace_ids[0], new_digest)
+            await self.mas.es_client.index(
+                Config.get_app_name() + "_history_digest",
+                doc_id=digest_id,
+                body=new_digest,
+            )
+        except Exception as e:
+            logger.warning(f"Summarize history of {session_name} error: {e}")
+        finally:
+            self._summarizing_keys.discard(summarizing_key)
+
+    async def _compact_history(
+        self, oxy_request: OxyRequest, session_name: str, records: list
+    ) -> tuple:
+        """Replace older history records with the summary digest of the session.
+
+        The latest ``summary_keep_turns`` records are kept verbatim, older records
+        already folded into the digest are dropped, and the remaining older
+        records are summarized in background for the next turns.
+
+        Returns:
+            tuple: ``(summary, records)``, where *summary* is None if the session
+                has no digest yet.
+        """
+        if len(records) <= self.summary_keep_turns:
+            return None, records
+        trace_ids = oxy_request.root_trace_ids + [oxy_request.current_trace_id]
+        digest = await self._get_memory_digest(session_name, trace_ids)
+        last_create_time = digest["last_create_time"] if digest else ""
+        older_records = [
+            record
+            for record in records[: len(records) - self.summary_keep_turns]
+            if record["create_time"] > last_create_time
+        ]
+        if older_records and self.mas:
+            task = asyncio.create_task(
+                self._summarize_history(
+                    session_name, trace_ids, digest, older_records
+                )
+            )
+            self.mas.background_tasks.add(task)
+            task.add_done_callback(self.mas.background_tasks.discard)
+        summary = digest["summary"] if digest else None
+        return summary, older_records + records[
+            len(records) - self.summary_keep_turns :
+        ]
+
+    async def _get_history_records(
+        self, oxy_request: OxyRequest, session_name: str
+    ) -> tuple:
+        """Search the history of a session, compacted if summarization is enabled.
+
+        Returns:
+            tuple: ``(summary, records)``.
+        """
+        records = await self._search_history(oxy_request, session_name)
+        if self.is_summarize_memory:
+            return await self._compact_history(oxy_request, session_name, records)
+        return None, records
+
+    @staticmethod
+    def _add_summary_messages(short_memory: Memory, summary: Optional[str]):
+        """Put the summary digest in front of short memory as one QA turn."""
+        if summary:
+            short_memory.add_message(
+                Message.user_message("Summarize our earlier conversation.")
+            )
+            short_memory.add_message(Message.assistant_message(summary))
+
     async def _get_history(
         self, oxy_request: OxyRequest, is_get_user_master_session=False
     ) -> Memory:
@@ -226,29 +459,12 @@ class LocalAgent(BaseAgent):
                 session_name = "__".join(oxy_request.call_stack[:2])
             else:
                 session_name = oxy_request.session_name
-            es_response = await self.mas.es_client.search(
-                Config.get_app_name() + "_history",
-                {
-                    "query": {
-                        "bool": {
-                            "must": [
-                                {
-                                    "terms": {
-                                        "trace_id": oxy_request.root_trace_ids
-                                        + [oxy_request.current_trace_id]
-                                    }
-                                },
-                                {"term": {"session_name": session_name}},
-                            ]
-                        }
-                    },
-                    "size": self.short_memory_size,
-                    "sort": [{"create_time": {"order": "desc"}}],
-                },
+            summary, records = await self._get_history_records(
+                oxy_request, session_name
             )
-            historys = es_response["hits"]["hits"][::-1]
-            for history in historys:
-                memory = json.loads(history["_source"]["memory"])
+            self._add_summary_messages(short_memory, summary)
+            for record in records:
+                memory = record["memory"]
                 short_memory.add_message(Message.user_message(memory["query"]))
                 short_memory.add_message(Message.assistant_message(memory["answer"]))
         return short_memory
@@ -270,7 +486,9 @@ class LocalAgent(BaseAgent):
             str: Concatenated tool descriptions for LLM context.
         """
         # Build tool description list for LLM instruction
-        self.permitted_tool_name_list.sort()
+        if self.permitted_tool_name_list != sorted(self.permitted_tool_name_list):
+            self.permitted_tool_name_list.sort()
+            self._invalidate_class_attr()
         # Create instruction
         llm_tool_desc_list = []
         if not Config.get_vearch_config():
@@ -8,12 +8,17 @@ with tool execution in an iterative loop.
 import asyncio
 import json
 import logging
+from collections import OrderedDict
 from typing import Callable, Optional
 
 from pydantic import Field
 
 from ...config import Config
-from ...prompts import SYSTEM_PROMPT, SYSTEM_PROMPT_RETRIEVAL
+from ...prompts import (
+    PARALLEL_TOOL_CALLS_PROMPT,
+    SYSTEM_PROMPT,
+    SYSTEM_PROMPT_RETRIEVAL,
+)
 from ...schemas import (
     ExecResult,
     LLMResponse,
@@ -21,11 +26,17 @@ from ...schemas import (
     Memory,
     Message,
     Observation,
+    OxyOutput,
     OxyRequest,
     OxyResponse,
     OxyState,
 )
-from ...utils.common_utils import chunk_list, extract_first_json, generate_uuid
+from ...utils.common_utils import (
+    chunk_list,
+    extract_first_json,
+    generate_uuid,
+    get_md5,
+)
 from .local_agent import LocalAgent
 
 logger = logging.getLogger(__name__)
@@ -57,6 +68,14 @@ class ReActAgent(LocalAgent):
         is_discard_react_memory (bool): Whether to discard detailed ReAct memory.
         memory_max_tokens (int): Maximum tokens for memory management.
         trust_mode (bool): Whether to enable trust mode for direct tool results.
+        is_memoize_tool_calls (bool): Whether to serve exact repeat calls of
+            read-only tools from the observations already obtained in the
+            current trace.
+        max_no_progress_rounds (int): Number of consecutive rounds repeating the
+            previous round's tool calls and observation, or parse error, before
+            forcing a final answer. 0 disables the check.
+        is_parallel_tool_calls (bool): Whether to instruct the LLM that it can
+            send dependent tool calls as a DAG executed in a single round.
 
     TODO:
         - LLM model: Support both service URLs and weight files for training
@@ -79,6 +98,21 @@ class ReActAgent(LocalAgent):
 
     trust_mode: bool = Field(False, description="Enable trust mode for direct results")
 
+    is_memoize_tool_calls: bool = Field(
+        False,
+        description="Whether to reuse observations of repeated read-only tool calls",
+    )
+    max_memoized_traces: int = Field(
+        256, description="Maximum number of traces whose tool calls are memoized"
+    )
+    max_no_progress_rounds: int = Field(
+        0,
+        description="Repeated rounds before forcing a final answer, 0 to disable",
+    )
+    is_parallel_tool_calls: bool = Field(
+        False, description="Whether to allow dependent tool calls in one round"
+    )
+
     func_parse_llm_response: Optional[Callable[[str, OxyRequest], LLMResponse]] = Field(
         None, exclude=True, description="Function to parse LLM output"
     )
@@ -101,9 +135,13 @@ class ReActAgent(LocalAgent):
         if self.func_reflexion is None:
             self.func_reflexion = self._default_reflexion
 
+        # Trace id -> tool call ledger, least recently used first
+        self._tool_call_ledgers: OrderedDict[str, dict] = OrderedDict()
+
         # Add retrieve_tools if vector search is conf igured
         if Config.get_vearch_config():
             self.tools.append("retrieve_tools")
+            self._invalidate_class_attr()
 
     def _default_reflexion(self, response: str, oxy_request: OxyRequest) -> str:
         """Default reflexion function that checks if response is empty or invalid.
@@ -120,6 +158,12 @@ class ReActAgent(LocalAgent):
             return "The response should not be empty. Please provide a more detailed and helpful answer."
         return None
 
+    def _build_instruction(self, arguments) -> str:
+        instruction = super()._build_instruction(arguments)
+        if self.is_parallel_tool_calls:
+            instruction += "\n" + PARALLEL_TOOL_CALLS_PROMPT.strip()
+        return instruction
+
     async def _get_history(
         self, oxy_request: OxyRequest, is_get_user_master_session=False
     ) -> Memory:
@@ -142,39 +186,19 @@ class ReActAgent(LocalAgent):
             session_name = "__".join(oxy_request.call_stack[:2])
         else:
             session_name = oxy_request.session_name
-        es_response = await self.mas.es_client.search(
-            Config.get_app_name() + "_history",
-            {
-                "query": {
-                    "bool": {
-                        "must": [
-                            {
-                                "terms": {
-                                    "trace_id": oxy_request.root_trace_ids
-                                    + [oxy_request.current_trace_id]
-                                }
-                            },
-                            {"term": {"session_name": session_name}},
-                        ]
-                    }
-                },
-                "size": self.short_memory_size,
-                "sort": [{"create_time": {"order": "desc"}}],
-            },
-        )
-        historys = es_response["hits"]["hits"][::-1]
+        summary, records = await self._get_history_records(oxy_request, session_name)
+        memories = [record["memory"] for record in records]
+        self._add_summary_messages(short_memory, summary)
         if self.is_discard_react_memory:
             # Simple mode: Only keep query-answer pairs
-            for history in historys:
-                memory = json.loads(history["_source"]["memory"])
+            for memory in memories:
                 short_memory.add_message(Message.user_message(memory["query"]))
                 short_memory.add_message(Message.assistant_message(memory["answer"]))
         else:
             # Advanced mode: Weighted memory management with token limits
             # Collect all question-answer pairs from both short and ReAct memory
             qa_list = []
-            for short_i, history in enumerate(historys):
-                memory = json.loads(history["_source"]["memory"])
+            for short_i, memory in enumerate(memories):
                 qa_list.append((memory["query"], memory["answer"], short_i, "short"))
                 for react_q, react_a in chunk_list(memory["react_memory"]):
                     qa_list.append(
@@ -259,6 +283,23 @@ class ReActAgent(LocalAgent):
                     output=tool_call_dict,
                     ori_response=ori_response,
                 )
+            elif isinstance(tool_call_dict.get("tool_calls"), list):
+                tool_call_dict_list = tool_call_dict["tool_calls"]
+                # References between the calls are validated when they are run
+                if not all(
+                    isinstance(d, dict) and "tool_name" in d
+                    for d in tool_call_dict_list
+                ):
+                    return LLMResponse(
+                        state=LLMState.ERROR_PARSE,
+                        output="Please answer strictly according to the format. Every item of tool_calls must provide tool_name.",
+                        ori_response=ori_response,
+                    )
+                return LLMResponse(
+                    state=LLMState.TOOL_CALL,
+                    output=tool_call_dict_list,
+                    ori_response=ori_response,
+                )
             else:
                 return LLMResponse(
                     state=LLMState.ERROR_PARSE,
@@ -292,6 +333,186 @@ class ReActAgent(LocalAgent):
                 state=LLMState.ERROR_PARSE, output=e, ori_response=ori_response
             )
 
+    def _get_tool_call_key(self, tool_call_dict: dict) -> str:
+        """Build a canonical key of a tool call from its name and arguments."""
+        return get_md5(
+            json.dumps(
+                [tool_call_dict.get("tool_name"), tool_call_dict.get("arguments")],
+                sort_keys=True,
+                ensure_ascii=False,
+                default=str,
+            )
+        )
+
+    def _get_tool_call_ledger(self, trace_id: str) -> dict:
+        """Return the ledger of completed tool calls shared by a whole trace."""
+        if trace_id in self._tool_call_ledgers:
+            self._tool_call_ledgers.move_to_end(trace_id)
+        else:
+            self._tool_call_ledgers[trace_id] = dict()
+            while len(self._tool_call_ledgers) > max(self.max_memoized_traces, 1):
+                self._tool_call_ledgers.popitem(last=False)
+        return self._tool_call_ledgers[trace_id]
+
+    def _is_tool_call_memoized(self, tool_name: str) -> bool:
+        """Only side-effect free tools may be served from the ledger."""
+        if not self.is_memoize_tool_calls:
+            return False
+        tool = self.mas.oxy_name_to_oxy.get(tool_name)
+        return bool(getattr(tool, "is_read_only", False))
+
+    async def _call_tool(
+        self,
+        oxy_request: OxyRequest,
+        tool_call_dict: dict,
+        parallel_id: str,
+        tool_call_ledger: dict,
+    ) -> OxyResponse:
+        """Call a tool, serving exact repeats of read-only tools from the ledger."""
+        tool_call_key = self._get_tool_call_key(tool_call_dict)
+        is_memoized = self._is_tool_call_memoized(tool_call_dict["tool_name"])
+        if is_memoized and tool_call_key in tool_call_ledger:
+            logger.info(
+                f"Repeated tool call served from ledger: {tool_call_dict['tool_name']}",
+                extra={
+                    "trace_id": oxy_request.current_trace_id,
+                    "node_id": oxy_request.node_id,
+                },
+            )
+            return tool_call_ledger[tool_call_key]
+        oxy_response = await oxy_request.call(
+            callee=tool_call_dict["tool_name"],
+            arguments=tool_call_dict.get("arguments", {}),
+            parallel_id=parallel_id,
+        )
+        if is_memoized and oxy_response.state is OxyState.COMPLETED:
+            tool_call_ledger[tool_call_key] = oxy_response
+        return oxy_response
+
+    def _find_tool_call_refs(self, value) -> set:
+        """Collect the ids of tool calls referenced by ``{"$ref": id}`` in *value*."""
+        refs = set()
+        if isinstance(value, dict):
+            if set(value.keys()) == {"$ref"}:
+                refs.add(value["$ref"])
+            else:
+                for v in value.values():
+                    refs |= self._find_tool_call_refs(v)
+        elif isinstance(value, list):
+            for v in value:
+                refs |= self._find_tool_call_refs(v)
+        return refs
+
+    def _resolve_tool_call_refs(self, value, ref_outputs: dict):
+        """Replace ``{"$ref": id}`` in *value* with the output of tool call *id*."""
+        if isinstance(value, dict):
+            if set(value.keys()) == {"$ref"} and value["$ref"] in ref_outputs:
+                return ref_outputs[value["$ref"]]
+            return {
+                k: self._resolve_tool_call_refs(v, ref_outputs)
+                for k, v in value.items()
+            }
+        if isinstance(value, list):
+            return [self._resolve_tool_call_refs(v, ref_outputs) for v in value]
+        return value
+
+    def _check_tool_call_dag(self, tool_call_dict_list: list) -> Optional[str]:
+        """Validate that tool calls form a DAG.
+
+        Returns:
+            Optional[str]: Feedback for the LLM if the tool calls are invalid,
+                otherwise None.
+        """
+        for tool_call_dict in tool_call_dict_list:
+            if not isinstance(tool_call_dict, dict) or "tool_name" not in tool_call_dict:
+                return "Please answer strictly according to the format. Every item of tool_calls must provide tool_name."
+        ids = [
+            tool_call_dict["id"]
+            for tool_call_dict in tool_call_dict_list
+            if tool_call_dict.get("id") is not None
+        ]
+        if len(ids) != len(set(ids)):
+            return "The ids of tool_calls must be unique."
+        dependencies = dict()
+        for tool_call_dict in tool_call_dict_list:
+            refs = self._find_tool_call_refs(tool_call_dict.get("arguments", {}))
+            unknown_refs = refs - set(ids)
+            if unknown_refs:
+                return f"Referenced tool call ids do not exist: {sorted(map(str, unknown_refs))}."
+            if tool_call_dict.get("id") is not None:
+                dependencies[tool_call_dict["id"]] = refs
+        # Kahn's algorithm, any remaining node is part of a cycle
+        remaining = dict(dependencies)
+        while remaining:
+            ready = [k for k, refs in remaining.items() if not refs & remaining.keys()]
+            if not ready:
+                return f"The tool_calls contain circular references: {sorted(map(str, remaining))}."
+            for k in ready:
+                del remaining[k]
+        return None
+
+    async def _call_tool_dag(
+        self,
+        oxy_request: OxyRequest,
+        tool_call_dict_list: list,
+        parallel_id: str,
+        tool_call_ledger: dict,
+    ) -> list:
+        """Execute tool calls with maximal parallelism, respecting their references.
+
+        A tool call starts as soon as all the calls it references have completed.
+        If a referenced call fails, the dependent call is skipped. If the calls do
+        not form a DAG, none of them is run and each fails with the reason.
+
+        Returns:
+            list: OxyResponse of each tool call, in the order of the input list.
+        """
+        error_msg = self._check_tool_call_dag(tool_call_dict_list)
+        if error_msg:
+            return [
+                OxyResponse(state=OxyState.FAILED, output=error_msg)
+                for _ in tool_call_dict_list
+            ]
+        id_to_task = dict()
+
+        async def _run(tool_call_dict):
+            arguments = tool_call_dict.get("arguments", {})
+            # Every task is registered before the first one runs
+            refs = self._find_tool_call_refs(arguments) & id_to_task.keys()
+            if refs:
+                ref_responses = {ref: await id_to_task[ref] for ref in refs}
+                failed_refs = [
+                    ref
+                    for ref, ref_response in ref_responses.items()
+                    if ref_response.state is not OxyState.COMPLETED
+                ]
+                if failed_refs:
+                    return OxyResponse(
+                        state=OxyState.SKIPPED,
+                        output=f"Skipped because the referenced tool calls failed: {failed_refs}",
+                    )
+                ref_outputs = {
+                    ref: ref_response.output.result
+                    if isinstance(ref_response.output, OxyOutput)
+                    else ref_response.output
+                    for ref, ref_response in ref_responses.items()
+                }
+                tool_call_dict = {
+                    **tool_call_dict,
+                    "arguments": self._resolve_tool_call_refs(arguments, ref_outputs),
+                }
+            return await self._call_tool(
+                oxy_request, tool_call_dict, parallel_id, tool_call_ledger
+            )
+
+        tasks = []
+        for tool_call_dict in tool_call_dict_list:
+            task = asyncio.ensure_future(_run(tool_call_dict))
+            if tool_call_dict.get("id") is not None:
+                id_to_task[tool_call_dict["id"]] = task
+            tasks.append(task)
+        return await asyncio.gather(*tasks)
+
     async def _execute(self, oxy_request: OxyRequest) -> OxyResponse:
         """Execute the ReAct reasoning and acting loop.
 
@@ -306,6 +527,11 @@ class ReActAgent(LocalAgent):
             OxyResponse: Final response with answer and ReAct memory trace.
         """
         react_memory = Memory()
+        # Tool call key -> response of the completed call within this trace
+        tool_call_ledger = self._get_tool_call_ledger(oxy_request.current_trace_id)
+        # Signature of the previous round, to detect rounds that change nothing
+        last_round_key = None
+        no_progress_rounds = 0
         for current_round in range(self.max_react_rounds + 1):
             # Build complete message context: instruction + short memory + query + react memory
             temp_memory = Memory()
@@ -348,15 +574,8 @@ class ReActAgent(LocalAgent):
                     )
 
                 parallel_id = generate_uuid()
-                oxy_responses = await asyncio.gather(
-                    *[
-                        oxy_request.call(
-                            callee=tool_call_dict["tool_name"],
-                            arguments=tool_call_dict["arguments"],
-                            parallel_id=parallel_id,
-                        )
-                        for tool_call_dict in tool_call_dict_list
-                    ]
+                oxy_responses = await self._call_tool_dag(
+                    oxy_request, tool_call_dict_list, parallel_id, tool_call_ledger
                 )
 
                 # observation_list = []
@@ -371,6 +590,14 @@ class ReActAgent(LocalAgent):
                         )
                     )
 
+                round_key = "tool_call:" + ",".join(
+                    sorted(
+                        self._get_tool_call_key(tool_call_dict)
+                        for tool_call_dict in tool_call_dict_list
+                    )
+                )
+                round_key += ":" + get_md5(observation.to_str())
+
                 # When trust_mode == 1, write in short_memory，return observation
                 if isinstance(llm_response.output, dict):
                     if self.trust_mode or (
@@ -390,6 +617,7 @@ class ReActAgent(LocalAgent):
                 )
                 react_memory.add_message(Message.user_message(observation.to_str()))
             else:
+                round_key = "error_parse:" + get_md5(str(llm_response.ori_response))
                 # Parsing error - add to memory for correction
                 logger.info(
                     f"Format error, adding to react_memory: {llm_response.ori_response}",
@@ -403,7 +631,26 @@ class ReActAgent(LocalAgent):
                 )
                 react_memory.add_message(Message.user_message(llm_response.output))
 
-        # Fallback mechanism when max rounds reached
+            # A round repeating the previous one brings no new information
+            if round_key == last_round_key:
+                no_progress_rounds += 1
+            else:
+                last_round_key = round_key
+                no_progress_rounds = 0
+            if (
+                self.max_no_progress_rounds > 0
+                and no_progress_rounds >= self.max_no_progress_rounds
+            ):
+                logger.info(
+                    f"No progress in {no_progress_rounds} rounds, forcing final answer.",
+                    extra={
+                        "trace_id": oxy_request.current_trace_id,
+                        "node_id": oxy_request.node_id,
+                    },
+                )
+                break
+
+        # Fallback mechanism when max rounds reached or no progress is made
         # Extract tool call results for final summary
         tid = 1
         tool_call_results = []
@@ -18,6 +18,7 @@ from pydantic import BaseModel, Field
 # from ..mas import MAS
 from ..config import Config
 from ..schemas import OxyRequest, OxyResponse, OxyState
+from ..utils.blob_utils import save_blobs, split_blobs
 from ..utils.common_utils import (
     filter_json_types,
     generate_uuid,
@@ -155,9 +156,38 @@ class Oxy(BaseModel, ABC):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self._semaphore: asyncio.Semaphore = asyncio.Semaphore(self.semaphore)
+        # Snapshot of class attributes saved with every node record
+        self._class_attr: Optional[tuple] = None
         self._ensure_async_functions()
         self._set_desc_for_llm()
 
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if not name.startswith("_"):
+            # Public attributes changed, so the cached snapshot is stale
+            self._invalidate_class_attr()
+
+    def _invalidate_class_attr(self):
+        """Drop the cached snapshot; call after mutating a public field in place."""
+        object.__setattr__(self, "_class_attr", None)
+
+    def _get_class_attr(self) -> tuple:
+        """Return the cached class attributes snapshot and its blobs.
+
+        Returns:
+            tuple: ``(class_attr, blobs)``. When blob storage is enabled, large
+                strings in *class_attr* are replaced by blob references.
+        """
+        if getattr(self, "_class_attr", None) is None:
+            class_attr = self.model_dump(
+                exclude=set(Oxy.model_fields.keys()) - {"class_name"}
+            )
+            blobs = {}
+            if Config.get_blob_is_enabled():
+                class_attr, blobs = split_blobs(class_attr)
+            object.__setattr__(self, "_class_attr", (class_attr, blobs))
+        return self._class_attr
+
     def _ensure_async_functions(self):
         """Ensure all function fields are async. Convert sync functions to async if needed."""
         # List of function field names to check and convert
@@ -189,6 +219,7 @@ class Oxy(BaseModel, ABC):
             logger.warning(f"Tool {tool_name} already exists.")
         else:
             self.permitted_tool_name_list.append(tool_name)
+            self._invalidate_class_attr()
 
     def add_permitted_tools(self, tool_names: list):
         """Add multiple tools to the permitted tools list."""
@@ -442,12 +473,12 @@ class Oxy(BaseModel, ABC):
         if not self.is_save_data:
             return
         oxy_request = oxy_response.oxy_request
-        oxy_input = {
-            "class_attr": self.model_dump(
-                exclude=set(Oxy.model_fields.keys()) - {"class_name"}
-            ),
-            "arguments": oxy_request.arguments,
-        }
+        class_attr, blobs = self._get_class_attr()
+        arguments = oxy_request.arguments
+        if Config.get_blob_is_enabled():
+            arguments, arguments_blobs = split_blobs(arguments)
+            blobs = {**blobs, **arguments_blobs}
+        oxy_input = {"class_attr": class_attr, "arguments": arguments}
         callee_name = oxy_request.callee
         callee_cat = oxy_request.callee_category
         if self.mas and self.mas.es_client:
@@ -463,6 +494,8 @@ class Oxy(BaseModel, ABC):
                 }
             else:
                 to_save_shared_data = to_json(oxy_request.shared_data)
+            if blobs:
+                await save_blobs(self.mas.es_client, blobs)
             await self.mas.es_client.update(
                 Config.get_app_name() + "_node",
                 doc_id=oxy_request.node_id,
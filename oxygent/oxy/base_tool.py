@@ -19,6 +19,8 @@ class BaseTool(Oxy):
             this tool. Defaults to True for security.
         category (str): Tool category identifier. Always "tool".
         timeout (float): Execution timeout in seconds. Defaults to 60 seconds.
+        is_read_only (bool): Whether the tool has no side effects, so the result
+            of a repeated call with the same arguments can be reused.
     """
 
     is_permission_required: bool = Field(
@@ -26,6 +28,9 @@ class BaseTool(Oxy):
     )
     category: str = Field("tool", description="Tool category identifier")
     timeout: float = Field(60, description="Timeout in seconds.")
+    is_read_only: bool = Field(
+        False, description="Whether the tool has no side effects"
+    )
 
     async def _execute(self, oxy_request: OxyRequest) -> OxyResponse:
         raise NotImplementedError("This method is not yet implemented")
@@ -0,0 +1,136 @@
+"""Argument binder compiled once from a function signature.
+
+FunctionTool used to inspect the signature of its function on every call. The
+ArgumentBinder inspects it once at registration and keeps, for each parameter,
+its default value, whether ``oxy_request`` has to be injected and a pydantic
+TypeAdapter that validates and coerces the arguments supplied by the LLM.
+"""
+
+from inspect import Parameter, signature
+from typing import Any, Callable, Optional
+
+from pydantic import ConfigDict, TypeAdapter, ValidationError
+from pydantic.fields import FieldInfo
+from pydantic_core import PydanticUndefined
+
+_MISSING = object()
+
+# LLMs often send numbers for string parameters
+_COERCE_CONFIG = ConfigDict(coerce_numbers_to_str=True)
+
+
+class _BoundParameter:
+    """Precompiled metadata of one function parameter."""
+
+    def __init__(self, name: str, param: Parameter):
+        self.name = name
+        self.kind = param.kind
+        annotation = param.annotation
+        if annotation is Parameter.empty:
+            self.type_name = None
+        else:
+            self.type_name = getattr(annotation, "__name__", str(annotation))
+        self.is_oxy_request = self.type_name == "OxyRequest"
+
+        if isinstance(param.default, FieldInfo):
+            # Pydantic Field: extract description and required status from FieldInfo
+            self.description = param.default.description or ""
+            self.is_required = param.default.is_required()
+            self.default = (
+                _MISSING
+                if self.is_required
+                else param.default.get_default(call_default_factory=False)
+            )
+            self.default_factory = param.default.default_factory
+        else:
+            self.description = ""
+            self.is_required = param.default is Parameter.empty
+            self.default = _MISSING if self.is_required else param.default
+            self.default_factory = None
+
+        self.type_adapter: Optional[TypeAdapter] = None
+        if annotation not in (Parameter.empty, Any) and not self.is_oxy_request:
+            try:
+                self.type_adapter = TypeAdapter(annotation, config=_COERCE_CONFIG)
+            except Exception:
+                try:
+                    self.type_adapter = TypeAdapter(annotation)
+                except Exception:
+                    # Forward references or arbitrary classes are passed unchecked
+                    self.type_adapter = None
+
+    def get_default(self):
+        if self.default_factory is not None:
+            return self.default_factory()
+        if self.default is _MISSING or self.default is PydanticUndefined:
+            return None
+        return self.default
+
+    def coerce(self, value):
+        if self.type_adapter is None or value is None:
+            return value
+        try:
+            return self.type_adapter.validate_python(value)
+        except ValidationError as e:
+            messages = "; ".join(error["msg"] for error in e.errors())
+            raise ValueError(
+                f"Invalid value {value!r} for argument '{self.name}': {messages}"
+            ) from None
+
+
+class ArgumentBinder:
+    """Bind tool arguments to the parameters of a function.
+
+    Args:
+        func (Callable): The function to bind arguments to.
+    """
+
+    def __init__(self, func: Callable):
+        self.parameters: list[_BoundParameter] = []
+        self.var_keyword: Optional[_BoundParameter] = None
+        for name, param in signature(func).parameters.items():
+            bound_param = _BoundParameter(name, param)
+            if param.kind == Parameter.VAR_KEYWORD:
+                self.var_keyword = bound_param
+            elif param.kind != Parameter.VAR_POSITIONAL:
+                self.parameters.append(bound_param)
+        self.needs_oxy_request = any(p.is_oxy_request for p in self.parameters)
+        self._names = {p.name for p in self.parameters}
+
+    @property
+    def input_schema(self) -> dict:
+        """Input schema with 'properties' and 'required' fields."""
+        schema = {"properties": {}, "required": []}
+        for param in self.parameters:
+            if param.is_oxy_request:
+                continue
+            schema["properties"][param.name] = {
+                "description": param.description,
+                "type": param.type_name,
+            }
+            if param.is_required:
+                schema["required"].append(param.name)
+        return schema
+
+    def bind(self, arguments: dict, oxy_request=None) -> dict:
+        """Build the keyword arguments of a call.
+
+        Missing arguments take the parameter default, or None when the parameter
+        has no default.
+
+        Raises:
+            ValueError: If an argument cannot be coerced to its annotated type.
+        """
+        func_kwargs = {}
+        for param in self.parameters:
+            if param.is_oxy_request:
+                func_kwargs[param.name] = oxy_request
+            elif param.name in arguments:
+                func_kwargs[param.name] = param.coerce(arguments[param.name])
+            else:
+                func_kwargs[param.name] = param.get_default()
+        if self.var_keyword is not None:
+            for name, value in arguments.items():
+                if name not in self._names:
+                    func_kwargs[name] = value
+        return func_kwargs
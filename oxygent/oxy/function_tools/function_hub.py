@@ -6,13 +6,33 @@ It supports both synchronous and asynchronous functions with automatic conversio
 """
 
 import asyncio
+import contextvars
 import functools
+import importlib
+import inspect
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Optional
 
 from pydantic import Field
 
+from ...config import Config
 from ..base_tool import BaseTool
 from .function_tool import FunctionTool
 
+EXECUTION_MODES = ("inline", "thread", "process")
+
+
+def _call_by_qualname(module_name: str, qualname: str, args: tuple, kwargs: dict):
+    """Call a registered synchronous function inside a worker process.
+
+    The decorator rebinds the module attribute to the async wrapper, so the
+    function is looked up by name and unwrapped instead of being pickled.
+    """
+    obj = importlib.import_module(module_name)
+    for attr in qualname.split("."):
+        obj = getattr(obj, attr)
+    return inspect.unwrap(obj)(*args, **kwargs)
+
 
 class FunctionHub(BaseTool):
     """Central hub for registering and managing Python functions as tools.
@@ -20,14 +40,40 @@ class FunctionHub(BaseTool):
     This class provides a decorator-based interface for converting regular
     Python functions into executable tools within the OxyGent system.
 
+    Synchronous functions run according to their execution mode:
+
+    * ``inline``: on the event loop, for fast non-blocking functions;
+    * ``thread``: in the thread pool of the hub, for blocking I/O;
+    * ``process``: in the process pool of the hub, for CPU-bound work. The
+      function must be defined at module level and its arguments and result
+      must be picklable.
+
     Attributes:
         func_dict (dict): Dictionary mapping function names to their descriptions
             and execution functions. Format: {name: (description, async_func)}
+        execution_mode (str): Default execution mode of synchronous functions.
+        thread_pool_size (int): Maximum number of threads of the hub.
+        process_pool_size (int): Maximum number of worker processes of the hub.
     """
 
     func_dict: dict = Field(
         default_factory=dict, description="Registry of functions and their metadata"
     )
+    execution_mode: str = Field(
+        default_factory=Config.get_tool_function_execution_mode,
+        description="Default execution mode of synchronous functions",
+    )
+    thread_pool_size: int = Field(
+        default_factory=Config.get_tool_function_thread_pool_size
+    )
+    process_pool_size: int = Field(
+        default_factory=Config.get_tool_function_process_pool_size
+    )
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._thread_executor: Optional[ThreadPoolExecutor] = None
+        self._process_executor: Optional[ProcessPoolExecutor] = None
 
     async def init(self):
         """Initialize the hub by creating FunctionTool instances for all registered
@@ -37,7 +83,16 @@ class FunctionHub(BaseTool):
         instances and registers them with the MAS (Multi-Agent System).
         """
         await super().init()
-        params = self.model_dump(exclude={"func_dict", "name", "desc"})
+        params = self.model_dump(
+            exclude={
+                "func_dict",
+                "name",
+                "desc",
+                "execution_mode",
+                "thread_pool_size",
+                "process_pool_size",
+            }
+        )
 
         # Create FunctionTool instances for each registered function
         for tool_name, (tool_desc, tool_func) in self.func_dict.items():
@@ -47,7 +102,21 @@ class FunctionHub(BaseTool):
             function_tool.set_mas(self.mas)
             self.mas.add_oxy(function_tool)
 
-    def tool(self, description):
+    def _get_executor(self, execution_mode: str) -> Executor:
+        if execution_mode == "thread":
+            if self._thread_executor is None:
+                self._thread_executor = ThreadPoolExecutor(
+                    max_workers=self.thread_pool_size,
+                    thread_name_prefix=f"{self.name}_worker",
+                )
+            return self._thread_executor
+        if self._process_executor is None:
+            self._process_executor = ProcessPoolExecutor(
+                max_workers=self.process_pool_size
+            )
+        return self._process_executor
+
+    def tool(self, description, execution_mode=None):
         """Decorator for registering functions as tools.
 
         This decorator automatically converts both synchronous and asynchronous
@@ -56,6 +125,8 @@ class FunctionHub(BaseTool):
 
         Args:
             description (str): Human-readable description of the tool's functionality.
+            execution_mode (str, optional): ``inline``, ``thread`` or ``process``
+                for synchronous functions. Defaults to the hub execution mode.
 
         Returns:
             Callable: Decorator function that registers and returns the async version
@@ -65,16 +136,56 @@ class FunctionHub(BaseTool):
         def decorator(func):
             # Check if function is already asynchronous
             if asyncio.iscoroutinefunction(func):
+                if execution_mode not in (None, "inline"):
+                    raise ValueError(
+                        f"Async function {func.__name__} can only run inline"
+                    )
                 async_func = func
             else:
+                mode = execution_mode or self.execution_mode
+                if mode not in EXECUTION_MODES:
+                    raise ValueError(
+                        f"Unknown execution mode {mode}, expected one of {EXECUTION_MODES}"
+                    )
+                if mode == "process" and "<locals>" in func.__qualname__:
+                    raise ValueError(
+                        f"Function {func.__qualname__} must be defined at module level "
+                        "to run in a process"
+                    )
+
                 # Wrap synchronous function to make it asynchronous
                 @functools.wraps(func)
                 async def async_func(*args, **kwargs):
-                    # TODO: Use thread pool for blocking synchronous operations
-                    return func(*args, **kwargs)
+                    if mode == "inline":
+                        return func(*args, **kwargs)
+                    loop = asyncio.get_running_loop()
+                    if mode == "thread":
+                        # Keep context variables such as the trace logging context
+                        call = functools.partial(
+                            contextvars.copy_context().run, func, *args, **kwargs
+                        )
+                    else:
+                        call = functools.partial(
+                            _call_by_qualname,
+                            func.__module__,
+                            func.__qualname__,
+                            args,
+                            kwargs,
+                        )
+                    return await loop.run_in_executor(self._get_executor(mode), call)
+
+                async_func.execution_mode = mode
 
             # Register function in the hub's dictionary
             self.func_dict[func.__name__] = (description, async_func)
             return async_func  # Return the async version
 
         return decorator
+
+    async def cleanup(self) -> None:
+        """Shut down the worker pools of the hub."""
+        for executor in (self._thread_executor, self._process_executor):
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
+        self._thread_executor = None
+        self._process_executor = None
@@ -6,15 +6,13 @@ function signatures and handles execution with proper error handling.
 """
 
 import logging
-from inspect import Parameter, signature
 from typing import Callable, Optional
 
 from pydantic import Field
-from pydantic.fields import FieldInfo
-from pydantic_core import PydanticUndefined
 
 from ...schemas import OxyRequest, OxyResponse, OxyState
 from ..base_tool import BaseTool
+from .argument_binder import ArgumentBinder
 
 logger = logging.getLogger(__name__)
 
@@ -48,6 +46,8 @@ class FunctionTool(BaseTool):
     def _extract_input_schema(self, func):
         """Extract input schema from function signature.
 
+        The signature is compiled into the argument binder used by every call.
+
         Args:
             func (Callable): The function to analyze.
 
@@ -55,78 +55,18 @@ class FunctionTool(BaseTool):
             dict: Input schema with 'properties' and 'required' fields describing
                 the function's parameters.
         """
-        sig = signature(func)
-        schema = {"properties": {}, "required": []}
-
-        for name, param in sig.parameters.items():
-            param_type = param.annotation
-            
-            # Get type name, handling empty annotations
-            if param_type is Parameter.empty:
-                type_name = None
-            else:
-                type_name = getattr(param_type, "__name__", str(param_type))
-                # Skip OxyRequest parameters
-                if type_name == "OxyRequest":
-                    self.needs_oxy_request = True
-                    continue
-            
-            # Determine parameter properties based on default value
-            if isinstance(param.default, FieldInfo):
-                # Pydantic Field: extract description and required status from FieldInfo
-                description = param.default.description or ""
-                is_required = param.default.is_required()
-            elif param.default is Parameter.empty:
-                # No default value: parameter is required
-                description = ""
-                is_required = True
-            else:
-                # Has regular default value: parameter is optional
-                description = ""
-                is_required = False
-            
-            # Add parameter to schema
-            schema["properties"][name] = {"description": description, "type": type_name}
-            if is_required:
-                schema["required"].append(name)
-
-        return schema
+        self._binder = ArgumentBinder(func)
+        self.needs_oxy_request = self._binder.needs_oxy_request
+        return self._binder.input_schema
 
     async def _execute(self, oxy_request: OxyRequest) -> OxyResponse:
         """Execute the wrapped function with provided arguments."""
         try:
-            func_kwargs = {}
-            sig = signature(self.func_process)
-
-            for param_name, param in sig.parameters.items():
-                param_type = param.annotation
-                
-                # Get type name, handling empty annotations
-                if param_type is Parameter.empty:
-                    type_name = None
-                else:
-                    type_name = getattr(param_type, "__name__", str(param_type))
-                    # Handle OxyRequest parameters
-                    if type_name == "OxyRequest":
-                        func_kwargs[param_name] = oxy_request
-                        continue
-
-                # Process parameter value based on availability in arguments
-                if param_name in oxy_request.arguments:
-                    func_kwargs[param_name] = oxy_request.arguments[param_name]
-                else:
-                    # Handle missing arguments - use parameter default if available
-                    if isinstance(param.default, FieldInfo):
-                        func_kwargs[param_name] = (
-                            param.default.default if param.default.default is not PydanticUndefined else None
-                        )
-                    elif param.default is not Parameter.empty:
-                        func_kwargs[param_name] = param.default
-                    else:
-                        # No default value available, pass None
-                        func_kwargs[param_name] = None
-
+            func_kwargs = self._binder.bind(oxy_request.arguments, oxy_request)
             result = await self.func_process(**func_kwargs)
+            if isinstance(result, OxyResponse):
+                # The function reports its own state and extra information
+                return result
             return OxyResponse(state=OxyState.COMPLETED, output=result)
         except Exception as e:
             import traceback
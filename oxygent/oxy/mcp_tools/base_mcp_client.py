@@ -7,16 +7,20 @@ and tool execution through the Model Context Protocol standard.
 
 import asyncio
 import logging
+from collections import OrderedDict
 from contextlib import AsyncExitStack
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 import anyio
 from mcp import ClientSession
+from mcp.types import ListToolsResult
 from pydantic import Field
 
 from ...config import Config
 from ...schemas import OxyRequest, OxyResponse, OxyState
 from ..base_tool import BaseTool
+from .mcp_manifest_cache import load_manifest, save_manifest
+from .mcp_session_pool import MCPSessionPool
 from .mcp_tool import MCPTool
 
 logger = logging.getLogger(__name__)
@@ -31,6 +35,24 @@ class BaseMCPClient(BaseTool):
 
     Attributes:
         included_tool_name_list: List of tool names discovered from the MCP server.
+        pool_size: Maximum number of warm sessions, 0 to disable the session pool.
+        pool_min_size: Number of sessions kept warm in the pool.
+        pool_session_concurrency: Maximum concurrent calls per pooled session.
+        pool_idle_timeout: Seconds before an idle pooled session is closed.
+        pool_health_check_interval: Seconds between health checks of the pool.
+        pool_max_header_sets: Maximum number of pools kept for distinct dynamic
+            header sets.
+        pool_max_in_flight: Maximum in-flight calls to the server, 0 for no limit.
+        is_manifest_cached: Whether to register tools from the on-disk manifest
+            cache at start-up and revalidate them in background.
+        manifest_version: Part of the manifest cache key, change it to drop the
+            cached manifest.
+        is_read_only_cached: Whether to cache the results of tools annotated with
+            ``readOnlyHint``.
+        cached_tool_name_list: Tools whose results are cached regardless of their
+            annotations. Destructive tools are never cached.
+        result_cache_ttl: Seconds a cached tool result stays valid.
+        result_cache_max_size: Maximum number of cached results per tool.
     """
 
     included_tool_name_list: list = Field(default_factory=list)
@@ -40,6 +62,40 @@ class BaseMCPClient(BaseTool):
     is_dynamic_headers: bool = Field(False, description="is dynamic headers")
     is_inherit_headers: bool = Field(False, description="is inherit headers")
     is_keep_alive: bool = Field(default_factory=Config.get_tool_mcp_is_keep_alive)
+    pool_size: int = Field(
+        default_factory=Config.get_tool_mcp_pool_size,
+        description="Maximum warm sessions, 0 to disable the session pool",
+    )
+    pool_min_size: int = Field(default_factory=Config.get_tool_mcp_pool_min_size)
+    pool_session_concurrency: int = Field(
+        default_factory=Config.get_tool_mcp_pool_session_concurrency
+    )
+    pool_idle_timeout: float = Field(
+        default_factory=Config.get_tool_mcp_pool_idle_timeout
+    )
+    pool_health_check_interval: float = Field(
+        default_factory=Config.get_tool_mcp_pool_health_check_interval
+    )
+    pool_max_header_sets: int = Field(
+        default_factory=Config.get_tool_mcp_pool_max_header_sets
+    )
+    pool_max_in_flight: int = Field(
+        default_factory=Config.get_tool_mcp_pool_max_in_flight
+    )
+    is_manifest_cached: bool = Field(
+        default_factory=Config.get_tool_mcp_is_manifest_cached
+    )
+    manifest_version: str = Field("", description="Version of the tool manifest")
+    is_read_only_cached: bool = Field(
+        default_factory=Config.get_tool_mcp_is_read_only_cached
+    )
+    cached_tool_name_list: list = Field(default_factory=list)
+    result_cache_ttl: float = Field(
+        default_factory=Config.get_tool_mcp_result_cache_ttl
+    )
+    result_cache_max_size: int = Field(
+        default_factory=Config.get_tool_mcp_result_cache_max_size
+    )
 
     def __init__(self, **kwargs):
         """Initialize the MCP client with necessary resources.
@@ -52,6 +108,117 @@ class BaseMCPClient(BaseTool):
         self._cleanup_lock: asyncio.Lock = asyncio.Lock()
         self._exit_stack: AsyncExitStack = AsyncExitStack()
         self._stdio_context: Any = Field(None)
+        self._session_pool: Optional[MCPSessionPool] = None
+        self._init_lock: asyncio.Lock = asyncio.Lock()
+        # Pools of dynamic header sets, keyed by (server, sorted headers)
+        self._session_pools: OrderedDict[tuple, MCPSessionPool] = OrderedDict()
+        self._session_pools_lock: asyncio.Lock = asyncio.Lock()
+        # Evicted pools waiting for their in-flight calls -> their closing task
+        self._evicted_session_pools: dict[MCPSessionPool, asyncio.Task] = {}
+        self._in_flight_semaphore: Optional[asyncio.Semaphore] = (
+            asyncio.Semaphore(self.pool_max_in_flight)
+            if self.pool_max_in_flight > 0
+            else None
+        )
+
+    def open_session(self, headers=None):
+        """Return an async context manager yielding a new initialized session."""
+        raise NotImplementedError(
+            f"{self.__class__.__name__} does not support session pooling"
+        )
+
+    def _get_server_key(self) -> str:
+        """Identify the server in session pool keys."""
+        return self.name
+
+    async def _create_session_pool(self, headers, min_size) -> MCPSessionPool:
+        session_pool = MCPSessionPool(
+            lambda: self.open_session(headers=headers),
+            max_size=self.pool_size,
+            min_size=min_size,
+            max_concurrency=self.pool_session_concurrency,
+            idle_timeout=self.pool_idle_timeout,
+            health_check_interval=self.pool_health_check_interval,
+            name=self.name,
+        )
+        await session_pool.start()
+        return session_pool
+
+    async def get_session_pool(self, headers=None) -> MCPSessionPool:
+        """Get the session pool for a header set, creating it on first use.
+
+        Without dynamic headers the server has one warm pool. With dynamic headers
+        there is one pool per distinct header set, created cold and evicted in
+        LRU order beyond ``pool_max_header_sets``.
+        """
+        if not self.is_dynamic_headers:
+            async with self._session_pools_lock:
+                if self._session_pool is None:
+                    self._session_pool = await self._create_session_pool(
+                        self.headers, self.pool_min_size
+                    )
+            return self._session_pool
+
+        key = (self._get_server_key(), tuple(sorted((headers or {}).items())))
+        async with self._session_pools_lock:
+            session_pool = self._session_pools.get(key)
+            if session_pool is None:
+                session_pool = await self._create_session_pool(headers, 0)
+                self._session_pools[key] = session_pool
+            self._session_pools.move_to_end(key)
+            evicted_pools = []
+            while len(self._session_pools) > max(1, self.pool_max_header_sets):
+                evicted_pools.append(self._session_pools.popitem(last=False)[1])
+        for evicted_pool in evicted_pools:
+            # Other calls may still use the pool, close it in background once idle
+            task = asyncio.create_task(evicted_pool.close_when_idle())
+            self._evicted_session_pools[evicted_pool] = task
+            task.add_done_callback(
+                lambda _, pool=evicted_pool: self._evicted_session_pools.pop(pool, None)
+            )
+        return session_pool
+
+    async def _call_tool_by_pool(self, tool_name, arguments, headers=None):
+        # The call is registered on the pool right after getting it, with no
+        # await in between, so an eviction cannot close the pool under it
+        if self._in_flight_semaphore is None:
+            session_pool = await self.get_session_pool(headers)
+            return await session_pool.call_tool(tool_name, arguments)
+        async with self._in_flight_semaphore:
+            session_pool = await self.get_session_pool(headers)
+            return await session_pool.call_tool(tool_name, arguments)
+
+    def _get_manifest_key(self) -> str:
+        return "|".join(
+            [self.__class__.__name__, self._get_server_key(), self.manifest_version]
+        )
+
+    def register_tools_from_manifest_cache(self) -> bool:
+        """Register the tools of the cached manifest.
+
+        Returns:
+            bool: Whether a cached manifest was found.
+        """
+        tools_response = load_manifest(self._get_manifest_key())
+        if tools_response is None:
+            return False
+        self.add_tools(tools_response)
+        logger.info(f"Server {self.name} tools registered from manifest cache")
+        return True
+
+    async def revalidate_tools(self) -> None:
+        """Connect to the server and refresh tools registered from the cache.
+
+        Failures are logged and the cached tools stay registered, the connection
+        is retried on the next tool call.
+        """
+        try:
+            async with self._init_lock:
+                await self.init(is_fetch_tools=True)
+        except Exception as e:
+            logger.warning(
+                f"Revalidate tools of server {self.name} error, cached tools kept: {e}"
+            )
 
     async def list_tools(self) -> None:
         """Discover and register tools from the MCP server.
@@ -64,6 +231,11 @@ class BaseMCPClient(BaseTool):
         tools_response = await self._session.list_tools()
         self.add_tools(tools_response)
 
+    def _is_tool_result_cached(self, tool_name: str, annotations: dict) -> bool:
+        return tool_name in self.cached_tool_name_list or (
+            self.is_read_only_cached and bool(annotations.get("readOnlyHint"))
+        )
+
     def add_tools(self, tools_response) -> None:
         """
         dynamically creates MCPTool instances for each discovered tool. These tools are
@@ -76,17 +248,44 @@ class BaseMCPClient(BaseTool):
                 "headers",
                 "middlewares",
                 "included_tool_name_list",
+                "cached_tool_name_list",
                 "name",
                 "desc",
                 "mcp_client",
                 "server_name",
                 "input_schema",
+                "is_read_only",
             }
         )
+        tool_names = set()
         for item in tools_response:
             if isinstance(item, tuple) and item[0] == "tools":
                 for tool in item[1]:
+                    tool_names.add(tool.name)
+                    annotations = getattr(tool, "annotations", None) or {}
+                    if not isinstance(annotations, dict):
+                        annotations = annotations.model_dump(exclude_none=True)
+                    is_result_cached = self._is_tool_result_cached(
+                        tool.name, annotations
+                    )
+                    registered_tool = self.mas.oxy_name_to_oxy.get(tool.name)
+                    if (
+                        isinstance(registered_tool, MCPTool)
+                        and registered_tool.mcp_client is self
+                    ):
+                        # Registered from the manifest cache, refresh in place
+                        registered_tool.desc = tool.description
+                        registered_tool.input_schema = tool.inputSchema
+                        registered_tool.annotations = annotations
+                        registered_tool.is_result_cached = is_result_cached
+                        registered_tool.is_read_only = bool(
+                            annotations.get("readOnlyHint")
+                        )
+                        registered_tool.clear_result_cache()
+                        registered_tool._set_desc_for_llm()
+                        continue
                     self.included_tool_name_list.append(tool.name)
+                    self._invalidate_class_attr()
 
                     mcp_tool = MCPTool(
                         name=tool.name,
@@ -94,6 +293,9 @@ class BaseMCPClient(BaseTool):
                         mcp_client=self,
                         server_name=self.name,
                         input_schema=tool.inputSchema,
+                        annotations=annotations,
+                        is_result_cached=is_result_cached,
+                        is_read_only=bool(annotations.get("readOnlyHint")),
                         func_process_input=self.func_process_input,
                         func_process_output=self.func_process_output,
                         func_format_input=self.func_format_input,
@@ -104,6 +306,12 @@ class BaseMCPClient(BaseTool):
                     )
                     mcp_tool.set_mas(self.mas)
                     self.mas.add_oxy(mcp_tool)
+        for tool_name in set(self.included_tool_name_list) - tool_names:
+            logger.warning(f"Tool {tool_name} no longer provided by server {self.name}")
+            self.included_tool_name_list.remove(tool_name)
+            self._invalidate_class_attr()
+        if self.is_manifest_cached and isinstance(tools_response, ListToolsResult):
+            save_manifest(self._get_manifest_key(), tools_response)
 
     async def _execute(self, oxy_request: OxyRequest) -> OxyResponse:
         """Execute a tool call through the MCP server.
@@ -114,7 +322,30 @@ class BaseMCPClient(BaseTool):
         """
         tool_name = oxy_request.callee
 
-        if not self.is_dynamic_headers and self.is_keep_alive:
+        if self.is_dynamic_headers:
+            _headers = (
+                oxy_request.shared_data.get("_headers", {})
+                if self.is_inherit_headers
+                else {}
+            )
+            if "host" in _headers:
+                del _headers["host"]
+            merged_headers = (
+                self.headers | _headers | oxy_request.shared_data.get("headers", {})
+            )
+        else:
+            merged_headers = self.headers
+
+        if self.pool_size > 0:
+            mcp_response = await self._call_tool_by_pool(
+                tool_name, oxy_request.arguments, headers=merged_headers
+            )
+        elif not self.is_dynamic_headers and self.is_keep_alive:
+            if not self._session and self.is_manifest_cached:
+                # Tools registered from the manifest cache connect lazily
+                async with self._init_lock:
+                    if not self._session:
+                        await self.init(is_fetch_tools=False)
             if not self._session:
                 raise RuntimeError(f"Server {self.name} not initialized")
 
@@ -128,19 +359,6 @@ class BaseMCPClient(BaseTool):
                     tool_name, oxy_request.arguments
                 )
         else:
-            if self.is_dynamic_headers:
-                _headers = (
-                    oxy_request.shared_data.get("_headers", {})
-                    if self.is_inherit_headers
-                    else {}
-                )
-                if "host" in _headers:
-                    del _headers["host"]
-                merged_headers = (
-                    self.headers | _headers | oxy_request.shared_data.get("headers", {})
-                )
-            else:
-                merged_headers = self.headers
             mcp_response = await self.call_tool(
                 tool_name,
                 oxy_request.arguments,
@@ -162,6 +380,14 @@ class BaseMCPClient(BaseTool):
         """
         async with self._cleanup_lock:
             try:
+                if self._session_pool is not None:
+                    await self._session_pool.close()
+                for session_pool in self._session_pools.values():
+                    await session_pool.close()
+                self._session_pools.clear()
+                for session_pool in list(self._evicted_session_pools):
+                    await session_pool.close()
+                self._evicted_session_pools.clear()
                 await self._exit_stack.aclose()
             except asyncio.CancelledError:
                 # TODO cleanup(): Operation was cancelled
@@ -171,4 +397,5 @@ class BaseMCPClient(BaseTool):
                 # Suppress cleanup exceptions to prevent cascading failures
             finally:
                 self._session = None
+                self._session_pool = None
                 self._stdio_context = None
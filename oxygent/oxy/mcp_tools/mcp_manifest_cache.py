@@ -0,0 +1,63 @@
+"""On-disk cache of MCP server tool manifests.
+
+The manifest of a server is the result of its ``list_tools`` call. It is stored
+as ``{cache_dir}/mcp_manifest/<md5 of manifest key>.json`` so that the tools of a
+server can be registered at start-up before the server is reachable.
+"""
+
+import json
+import logging
+import os
+from typing import Optional
+
+from mcp.types import ListToolsResult
+
+from ...config import Config
+from ...utils.common_utils import get_format_time, get_md5
+
+logger = logging.getLogger(__name__)
+
+
+def get_manifest_path(manifest_key: str) -> str:
+    return os.path.join(
+        Config.get_cache_save_dir(), "mcp_manifest", get_md5(manifest_key) + ".json"
+    )
+
+
+def load_manifest(manifest_key: str) -> Optional[ListToolsResult]:
+    """Load a cached manifest, or None if it is missing or unreadable."""
+    path = get_manifest_path(manifest_key)
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+        if manifest.get("manifest_key") != manifest_key:
+            return None
+        return ListToolsResult.model_validate(manifest["tools_response"])
+    except Exception as e:
+        logger.warning(f"Load MCP manifest {path} error: {e}")
+        return None
+
+
+def save_manifest(manifest_key: str, tools_response: ListToolsResult):
+    """Atomically write the manifest of a server."""
+    path = get_manifest_path(manifest_key)
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "manifest_key": manifest_key,
+                    "tools_response": tools_response.model_dump(
+                        mode="json", exclude_none=True
+                    ),
+                    "update_time": get_format_time(),
+                },
+                f,
+                ensure_ascii=False,
+            )
+        os.replace(tmp_path, path)
+    except Exception as e:
+        logger.warning(f"Save MCP manifest {path} error: {e}")
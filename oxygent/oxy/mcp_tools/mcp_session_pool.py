@@ -0,0 +1,287 @@
+"""Pool of warm MCP client sessions.
+
+Opening an MCP session means spawning a server process (stdio) or connecting a
+stream (SSE / Streamable-HTTP), then running the ``initialize`` handshake. The
+MCPSessionPool keeps a bounded number of initialized sessions per server and spreads
+concurrent tool calls across them:
+
+* at most ``max_size`` sessions, each serving at most ``max_concurrency``
+  calls at a time; further calls wait for a free slot;
+* ``min_size`` sessions are kept warm, other sessions idle for longer than
+  ``idle_timeout`` seconds are closed;
+* idle sessions are pinged every ``health_check_interval`` seconds, and
+  sessions failing a ping or a call with a stream error are replaced.
+
+The transport context managers of anyio must be entered and exited in the same
+task, so every session is owned by a dedicated background task.
+"""
+
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncContextManager, Callable, Optional
+
+import anyio
+
+logger = logging.getLogger(__name__)
+
+# Errors meaning the session stream is gone and the session must be replaced
+SESSION_BROKEN_ERRORS = (
+    anyio.ClosedResourceError,
+    anyio.BrokenResourceError,
+    anyio.EndOfStream,
+    ConnectionError,
+)
+
+
+class PooledSession:
+    """An initialized MCP session owned by a background task."""
+
+    def __init__(self, session_factory: Callable[[], AsyncContextManager]):
+        self._session_factory = session_factory
+        self.session: Any = None
+        self.in_flight = 0
+        self.last_used = time.monotonic()
+        self.is_broken = False
+        self._ready = asyncio.Event()
+        self._closing = asyncio.Event()
+        self._error: Optional[BaseException] = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self):
+        self._task = asyncio.create_task(self._run())
+        await self._ready.wait()
+        if self._error is not None:
+            raise self._error
+
+    async def _run(self):
+        try:
+            async with self._session_factory() as session:
+                self.session = session
+                self._ready.set()
+                await self._closing.wait()
+        except BaseException as e:
+            self._error = e
+            self.is_broken = True
+            if not isinstance(e, Exception):
+                raise
+        finally:
+            self.session = None
+            self._ready.set()
+
+    @property
+    def is_alive(self) -> bool:
+        return self.session is not None and not self.is_broken
+
+    async def close(self, timeout: float = 5):
+        self._closing.set()
+        if self._task is not None and not self._task.done():
+            done, _ = await asyncio.wait([self._task], timeout=timeout)
+            if not done:
+                self._task.cancel()
+
+
+class MCPSessionPool:
+    """Bounded pool of warm MCP sessions for one server.
+
+    Args:
+        session_factory: Returns an async context manager yielding an initialized
+            ``ClientSession``.
+        max_size (int): Maximum number of sessions.
+        min_size (int): Number of sessions kept warm.
+        max_concurrency (int): Maximum concurrent calls per session.
+        idle_timeout (float): Seconds before an idle session above ``min_size``
+            is closed.
+        health_check_interval (float): Seconds between pings of idle sessions,
+            0 to disable health checks and reaping.
+        name (str): Name used in logs.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncContextManager],
+        max_size: int = 4,
+        min_size: int = 1,
+        max_concurrency: int = 1,
+        idle_timeout: float = 300,
+        health_check_interval: float = 60,
+        name: str = "",
+    ):
+        self.session_factory = session_factory
+        self.max_size = max(1, max_size)
+        self.min_size = min(min_size, self.max_size)
+        self.max_concurrency = max(1, max_concurrency)
+        self.idle_timeout = idle_timeout
+        self.health_check_interval = health_check_interval
+        self.name = name
+        self._sessions: list[PooledSession] = []
+        self._opening = 0
+        self._condition = asyncio.Condition()
+        self._reaper_task: Optional[asyncio.Task] = None
+        self._is_closed = False
+        # Calls started and not finished, including those waiting for a session
+        self._pending_calls = 0
+
+    @property
+    def size(self) -> int:
+        return len(self._sessions)
+
+    @property
+    def in_flight(self) -> int:
+        return sum(pooled.in_flight for pooled in self._sessions)
+
+    async def start(self):
+        """Warm up ``min_size`` sessions and start the reaper."""
+        await asyncio.gather(*[self._open() for _ in range(self.min_size)])
+        if self.health_check_interval > 0 and self._reaper_task is None:
+            self._reaper_task = asyncio.create_task(self._reap())
+
+    async def _open(self, is_reserved: bool = False) -> PooledSession:
+        """Open a session; *is_reserved* means the caller already counted it."""
+        pooled = PooledSession(self.session_factory)
+        if not is_reserved:
+            self._opening += 1
+        try:
+            await pooled.start()
+        finally:
+            self._opening -= 1
+        async with self._condition:
+            self._sessions.append(pooled)
+            self._condition.notify_all()
+        return pooled
+
+    async def _discard(self, pooled: PooledSession):
+        async with self._condition:
+            if pooled in self._sessions:
+                self._sessions.remove(pooled)
+            self._condition.notify_all()
+        await pooled.close()
+
+    def _pick(self) -> Optional[PooledSession]:
+        candidates = [
+            pooled
+            for pooled in self._sessions
+            if pooled.is_alive and pooled.in_flight < self.max_concurrency
+        ]
+        return min(candidates, key=lambda p: p.in_flight) if candidates else None
+
+    @asynccontextmanager
+    async def acquire(self):
+        """Borrow the least loaded session, opening one if all are busy."""
+        if self._is_closed:
+            raise RuntimeError(f"Session pool {self.name} is closed")
+        pooled = None
+        while pooled is None:
+            is_to_open = False
+            async with self._condition:
+                if self._is_closed:
+                    raise RuntimeError(f"Session pool {self.name} is closed")
+                broken_sessions = [p for p in self._sessions if not p.is_alive]
+                for broken in broken_sessions:
+                    self._sessions.remove(broken)
+                pooled = self._pick()
+                if pooled is None:
+                    if self.size + self._opening < self.max_size:
+                        # Reserve the slot, the session is opened outside the lock
+                        self._opening += 1
+                        is_to_open = True
+                    elif not broken_sessions:
+                        await self._condition.wait()
+            for broken in broken_sessions:
+                await broken.close()
+            if is_to_open:
+                pooled = await self._open(is_reserved=True)
+        pooled.in_flight += 1
+        try:
+            yield pooled
+        finally:
+            pooled.in_flight -= 1
+            pooled.last_used = time.monotonic()
+            async with self._condition:
+                self._condition.notify_all()
+
+    async def call(self, method: str, *args, **kwargs):
+        """Call a ``ClientSession`` method on a pooled session.
+
+        A session failing with a stream error is replaced and the call is retried
+        once on another session.
+        """
+        self._pending_calls += 1
+        try:
+            for attempt in range(2):
+                async with self.acquire() as pooled:
+                    try:
+                        return await getattr(pooled.session, method)(*args, **kwargs)
+                    except SESSION_BROKEN_ERRORS as e:
+                        pooled.is_broken = True
+                        logger.warning(f"MCP session of {self.name} broken: {e!r}")
+                        if attempt == 1:
+                            raise
+                await self._discard(pooled)
+        finally:
+            self._pending_calls -= 1
+            async with self._condition:
+                self._condition.notify_all()
+
+    async def call_tool(self, tool_name: str, arguments: dict):
+        return await self.call("call_tool", tool_name, arguments)
+
+    async def list_tools(self):
+        return await self.call("list_tools")
+
+    async def _check_health(self, pooled: PooledSession):
+        try:
+            await asyncio.wait_for(pooled.session.send_ping(), timeout=10)
+        except Exception as e:
+            logger.warning(f"MCP session of {self.name} failed health check: {e!r}")
+            pooled.is_broken = True
+
+    async def _reap(self):
+        while not self._is_closed:
+            await asyncio.sleep(self.health_check_interval)
+            now = time.monotonic()
+            idle_sessions = [
+                pooled
+                for pooled in self._sessions
+                if pooled.in_flight == 0 and pooled.is_alive
+            ]
+            await asyncio.gather(*[self._check_health(p) for p in idle_sessions])
+            to_close = [p for p in self._sessions if not p.is_alive]
+            alive = [p for p in self._sessions if p.is_alive]
+            expired = [
+                p
+                for p in alive
+                if p.in_flight == 0 and now - p.last_used > self.idle_timeout
+            ]
+            to_close += expired[: max(0, len(alive) - self.min_size)]
+            for pooled in to_close:
+                await self._discard(pooled)
+            if len(self._sessions) < self.min_size:
+                try:
+                    await asyncio.gather(
+                        *[
+                            self._open()
+                            for _ in range(self.min_size - len(self._sessions))
+                        ]
+                    )
+                except Exception as e:
+                    logger.warning(f"Refill session pool {self.name} error: {e!r}")
+
+    async def close_when_idle(self):
+        """Close the pool once the calls already started on it have finished."""
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._pending_calls == 0)
+            self._is_closed = True
+        await self.close()
+
+    async def close(self):
+        """Close all sessions and stop the reaper."""
+        self._is_closed = True
+        if self._reaper_task is not None:
+            self._reaper_task.cancel()
+            self._reaper_task = None
+        sessions, self._sessions = self._sessions, []
+        await asyncio.gather(*[pooled.close() for pooled in sessions])
+        async with self._condition:
+            self._condition.notify_all()
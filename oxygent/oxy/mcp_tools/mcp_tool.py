@@ -5,11 +5,16 @@ from MCP servers. Each MCPTool acts as a proxy that delegates execution to its p
 MCP client while providing a standardized tool interface.
 """
 
+import copy
+import json
+import time
+from collections import OrderedDict
 from typing import Any
 
 from pydantic import Field
 
-from ...schemas import OxyRequest, OxyResponse
+from ...config import Config
+from ...schemas import OxyRequest, OxyResponse, OxyState
 from ..base_tool import BaseTool
 
 
@@ -20,17 +25,97 @@ class MCPTool(BaseTool):
     It acts as a lightweight proxy that delegates actual execution to the
     parent MCP client while providing the standard BaseTool interface.
 
+    Results of cached tools are kept for ``result_cache_ttl`` seconds, keyed on the
+    canonical JSON of the arguments. Tools annotated with ``destructiveHint`` are
+    never cached.
+
     Attributes:
         is_permission_required: Whether the tool requires explicit permission before execution.
         mcp_client: Reference to the parent MCP client that handles actual execution.
         server_name: Name of the MCP server that provides this tool.
+        annotations: Tool annotations declared by the MCP server.
+        is_result_cached: Whether to cache the results of the tool.
+        result_cache_ttl: Seconds a cached result stays valid.
+        result_cache_max_size: Maximum number of cached results.
     """
 
     is_permission_required: bool = Field(True, description="")
 
     mcp_client: Any = Field(None, exclude=True)
     server_name: str = Field("")
+    annotations: dict = Field(default_factory=dict)
+    is_result_cached: bool = Field(False)
+    result_cache_ttl: float = Field(
+        default_factory=Config.get_tool_mcp_result_cache_ttl
+    )
+    result_cache_max_size: int = Field(
+        default_factory=Config.get_tool_mcp_result_cache_max_size
+    )
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # canonical arguments -> (output, cached time)
+        self._result_cache: OrderedDict[str, tuple] = OrderedDict()
+        self._result_cache_hits = 0
+        self._result_cache_misses = 0
+
+    @property
+    def is_destructive(self) -> bool:
+        return bool(self.annotations.get("destructiveHint"))
+
+    def _is_cacheable(self) -> bool:
+        return (
+            self.is_result_cached
+            and not self.is_destructive
+            and self.result_cache_ttl > 0
+            and self.result_cache_max_size > 0
+        )
+
+    def _get_result_cache_key(self, oxy_request: OxyRequest) -> str:
+        key = {"arguments": oxy_request.arguments}
+        if self.mcp_client is not None and self.mcp_client.is_dynamic_headers:
+            # Results may depend on the caller identity carried by the headers
+            key["headers"] = oxy_request.shared_data.get("headers", {})
+            if self.mcp_client.is_inherit_headers:
+                key["_headers"] = oxy_request.shared_data.get("_headers", {})
+        return json.dumps(key, sort_keys=True, ensure_ascii=False, default=str)
+
+    def get_result_cache_stats(self) -> dict:
+        return {
+            "hits": self._result_cache_hits,
+            "misses": self._result_cache_misses,
+            "size": len(self._result_cache),
+        }
+
+    def clear_result_cache(self):
+        self._result_cache.clear()
 
     async def _execute(self, oxy_request: OxyRequest) -> OxyResponse:
         """Execute the MCP tool by delegating to the parent MCP client."""
-        return await self.mcp_client._execute(oxy_request)
+        if not self._is_cacheable():
+            return await self.mcp_client._execute(oxy_request)
+
+        cache_key = self._get_result_cache_key(oxy_request)
+        cached = self._result_cache.get(cache_key)
+        if cached is not None:
+            output, cached_at = cached
+            if time.monotonic() - cached_at <= self.result_cache_ttl:
+                self._result_cache_hits += 1
+                self._result_cache.move_to_end(cache_key)
+                return OxyResponse(
+                    state=OxyState.COMPLETED,
+                    output=copy.deepcopy(output),
+                    extra={"is_result_cached": True},
+                )
+            del self._result_cache[cache_key]
+        self._result_cache_misses += 1
+
+        oxy_response = await self.mcp_client._execute(oxy_request)
+        if oxy_response.state == OxyState.COMPLETED:
+            self._result_cache[cache_key] = (
+                copy.deepcopy(oxy_response.output),
+                time.monotonic(),
+            )
+            while len(self._result_cache) > self.result_cache_max_size:
+                self._result_cache.popitem(last=False)
+        return oxy_response
@@ -6,6 +6,7 @@ MCP servers to clients, ideal for streaming responses and live updates.
 """
 
 import logging
+from contextlib import asynccontextmanager
 from typing import Any, List
 
 from mcp import ClientSession
@@ -24,6 +25,9 @@ class SSEMCPClient(BaseMCPClient):
     This class extends BaseMCPClient to provide MCP communication over SSE. SSE enables
     real-time, unidirectional communication from servers to clients, making it suitable
     for streaming responses and live data updates.
+
+    When ``pool_size`` is positive, sessions are pooled per header set and reused
+    across calls instead of connecting for every call.
     """
 
     sse_url: AnyUrl = Field("")
@@ -39,7 +43,11 @@ class SSEMCPClient(BaseMCPClient):
         server.
         """
         try:
-            if not self.is_dynamic_headers and self.is_keep_alive:
+            if self.pool_size > 0:
+                session_pool = await self.get_session_pool(self.headers)
+                if is_fetch_tools:
+                    self.add_tools(await session_pool.list_tools())
+            elif not self.is_dynamic_headers and self.is_keep_alive:
                 # header
                 sse_transport = await self._exit_stack.enter_async_context(
                     sse_client(
@@ -79,6 +87,21 @@ class SSEMCPClient(BaseMCPClient):
             await self.cleanup()
             raise Exception(f"Server {self.name} error")
 
+    def _get_server_key(self) -> str:
+        return str(self.sse_url)
+
+    @asynccontextmanager
+    async def open_session(self, headers=None):
+        async with sse_client(
+            build_url(self.sse_url), headers=headers, timeout=self.timeout
+        ) as streams:
+            async with ClientSession(*streams) as session:
+                for mw in self.middlewares:
+                    if hasattr(session, "add_middleware"):
+                        session.add_middleware(mw)
+                await session.initialize()
+                yield session
+
     async def call_tool(self, tool_name, arguments, headers=None):
         async with sse_client(
             build_url(self.sse_url), headers=headers, timeout=self.timeout
@@ -9,6 +9,7 @@ through stdin/stdout pipes.
 import logging
 import os
 import shutil
+from contextlib import asynccontextmanager
 from typing import Any
 
 from mcp import ClientSession, StdioServerParameters
@@ -27,6 +28,9 @@ class StdioMCPClient(BaseMCPClient):
     It spawns and manages external processes (like Node.js scripts) that act
     as MCP servers, communicating through standard input/output streams.
 
+    When ``pool_size`` is positive, tool calls are spread across a pool of warm
+    server processes instead of one keep-alive pipe or a process per call.
+
     Attributes:
         params: Configuration parameters including command, arguments, and environment variables.
     """
@@ -64,6 +68,12 @@ class StdioMCPClient(BaseMCPClient):
         """
 
         try:
+            if self.pool_size > 0:
+                await self.get_server_params()
+                session_pool = await self.get_session_pool()
+                if is_fetch_tools:
+                    self.add_tools(await session_pool.list_tools())
+                return
             server_params = await self.get_server_params()
             stdio_transport = await self._exit_stack.enter_async_context(
                 stdio_client(server_params)
@@ -85,12 +95,20 @@ class StdioMCPClient(BaseMCPClient):
             await self.cleanup()
             raise Exception(f"Server {self.name} error")
 
-    async def call_tool(self, tool_name, arguments, headers=None):
+    @asynccontextmanager
+    async def open_session(self, headers=None):
         server_params = await self.get_server_params()
         async with stdio_client(server_params) as streams:
             async with ClientSession(*streams) as session:
                 await session.initialize()
-                return await session.call_tool(tool_name, arguments)
+                yield session
+
+    async def call_tool(self, tool_name, arguments, headers=None):
+        async with self.open_session() as session:
+            return await session.call_tool(tool_name, arguments)
+
+    def _get_server_key(self) -> str:
+        return " ".join([self.params.get("command", "")] + self.params.get("args", []))
 
     async def get_server_params(self):
         command = (
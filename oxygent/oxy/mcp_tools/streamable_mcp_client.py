@@ -1,6 +1,7 @@
 """Streamable-HTTP MCP client implementation."""
 
 import logging
+from contextlib import asynccontextmanager
 from typing import Any, List
 
 from mcp import ClientSession
@@ -14,7 +15,11 @@ logger = logging.getLogger(__name__)
 
 
 class StreamableMCPClient(BaseMCPClient):
-    """MCP client implementation using Streamable-HTTP transport."""
+    """MCP client implementation using Streamable-HTTP transport.
+
+    When ``pool_size`` is positive, sessions are pooled per header set and reused
+    across calls instead of connecting for every call.
+    """
 
     server_url: AnyUrl = Field("")
     middlewares: List[Any] = Field(
@@ -24,7 +29,11 @@ class StreamableMCPClient(BaseMCPClient):
     async def init(self, is_fetch_tools=True) -> None:
         """Initialize the HTTP streaming connection to the MCP server."""
         try:
-            if not self.is_dynamic_headers and self.is_keep_alive:
+            if self.pool_size > 0:
+                session_pool = await self.get_session_pool(self.headers)
+                if is_fetch_tools:
+                    self.add_tools(await session_pool.list_tools())
+            elif not self.is_dynamic_headers and self.is_keep_alive:
                 self._http_transport = await self._exit_stack.enter_async_context(
                     streamablehttp_client(
                         build_url(self.server_url),
@@ -62,6 +71,21 @@ class StreamableMCPClient(BaseMCPClient):
             await self.cleanup()
             raise Exception(f"Server {self.name} error") from e
 
+    def _get_server_key(self) -> str:
+        return str(self.server_url)
+
+    @asynccontextmanager
+    async def open_session(self, headers=None):
+        async with streamablehttp_client(
+            build_url(self.server_url), headers=headers, timeout=self.timeout
+        ) as (read, write, _):
+            async with ClientSession(read, write) as session:
+                for mw in self.middlewares:
+                    if hasattr(session, "add_middleware"):
+                        session.add_middleware(mw)
+                await session.initialize()
+                yield session
+
     async def call_tool(self, tool_name, arguments, headers=None):
         async with streamablehttp_client(
             build_url(self.server_url), headers=headers, timeout=self.timeout
@@ -1,65 +1,86 @@
 import os
-import PyPDF2, pytesseract
-from pdf2image import convert_from_path
+import pytesseract
 
 from PIL import Image
 
 from pydantic import Field
 
 from oxygent.oxy import FunctionHub
+from oxygent.utils.content_cache import get_content_cache, get_file_cache_key
+from oxygent.utils.document_utils import (
+    OCR_LANG,
+    PDF_EXTRACTOR_VERSION,
+    get_pdf_page_count,
+    iter_pdf_pages,
+)
 
 multimodal_tools = FunctionHub(name="multimodal_tools")
 
+# Bump when the OCR output of read_image_file changes to invalidate cached text
+IMAGE_OCR_VERSION = "1"
+
 @multimodal_tools.tool(
     description="Read the content of a pdf file. Returns an error message if the file does not exist "
 )
 def read_pdf_file(path: str = Field(description="Path to the pdf file to read")) -> str:
     if not os.path.exists(path):
         return f"Error: {path} does not exist."
-    text = ""
+    # 相同内容的文件只解析一次，结果按内容哈希缓存在磁盘上
+    content_cache = get_content_cache()
+    if content_cache is not None:
+        cache_key = get_file_cache_key(
+            path, "read_pdf_file", PDF_EXTRACTOR_VERSION, lang=OCR_LANG
+        )
+        cached_text = content_cache.get(cache_key)
+        if cached_text is not None:
+            print("✓ 从缓存读取PDF")
+            return cached_text
+    # 按页并行提取文本，无文本层的扫描页自动转为OCR，结果按页码顺序返回
     try:
-        with open(path, "rb") as file:
-            reader = PyPDF2.PdfReader(file)
-            for page in reader.pages:
-                page_text = page.extract_text()
-                if page_text:
-                    text += page_text + "\n"
-        if text.strip():
-            print("✓ 通过直接文本提取成功读取PDF")
-            return text
+        page_count = get_pdf_page_count(path)
     except Exception as e:
-        print(f"⚠️ 直接文本提取失败: {e}，将尝试OCR。")
-
-    # 步骤 2: 如果文本提取失败，则尝试OCR
-    print("未提取到文本或提取失败，正在启动OCR流程...")
+        return f"读取PDF时出错: {e}"
+    texts = []
+    ocr_page_count = 0
+    # OCR失败的页保留其文本层，已提取的文本页不会丢失
+    ocr_errors = []
     try:
-        # 将PDF页面转换为图片
-        # 注意：pdf2image需要Poppler。如果未安装，可能会报错。
-        # Windows: 下载Poppler并将其bin目录添加到系统PATH。
-        # macOS: brew install poppler
-        # Linux: sudo apt-get install poppler-utils
-        images = convert_from_path(path)
-        
-        ocr_text = ""
-        for i, image in enumerate(images):
-            print(f"  - 正在识别第 {i+1}/{len(images)} 页...")
-            # 使用Tesseract进行OCR识别
-            ocr_text += pytesseract.image_to_string(image, lang='chi_sim+eng') + "\n"
-        
-        if not ocr_text.strip():
-            return "OCR识别完成，但未能提取任何文本。"
-        
-        print("✓ 通过OCR成功读取PDF")
-        return ocr_text
+        for page_index, page_text, method in iter_pdf_pages(
+            path, ocr_errors=ocr_errors
+        ):
+            if method == "ocr":
+                ocr_page_count += 1
+                print(f"  - 已通过OCR识别第 {page_index+1}/{page_count} 页")
+            if page_text.strip():
+                texts.append(page_text + "\n")
+    except Exception as e:
+        return f"读取PDF时出错: {e}"
 
-    except ImportError as e:
+    text = "".join(texts)
+    if not text.strip():
+        if ocr_errors:
+            return _get_ocr_error_message(ocr_errors[0])
+        return "OCR识别完成，但未能提取任何文本。"
+    if ocr_errors:
+        print(f"⚠️ 部分页OCR失败，仅返回已提取的文本: {ocr_errors[0]}")
+    elif ocr_page_count:
+        print(f"✓ 通过OCR成功读取PDF（{ocr_page_count}/{page_count} 页）")
+    else:
+        print("✓ 通过直接文本提取成功读取PDF")
+    # 不缓存不完整的结果，OCR环境修复后可重新识别
+    if content_cache is not None and not ocr_errors:
+        content_cache.set(cache_key, text)
+    return text
+
+
+def _get_ocr_error_message(e: Exception) -> str:
+    if isinstance(e, ImportError):
         return f"错误：缺少必要的库。请确保已安装 'pdf2image' 和 'pytesseract'。错误: {e}"
-    except Exception as e:
-        # 捕获所有其他异常，特别是Poppler未安装的错误
-        error_message = str(e)
-        if "poppler" in error_message.lower():
-            return "错误：OCR功能需要Poppler。请安装Poppler并确保其在系统PATH中。"
-        return f"OCR处理PDF时出错: {error_message}"
+    # 特别是Poppler未安装的错误
+    error_message = str(e)
+    if "poppler" in error_message.lower():
+        return "错误：OCR功能需要Poppler。请安装Poppler并确保其在系统PATH中。"
+    return f"OCR处理PDF时出错: {error_message}"
 
 @multimodal_tools.tool(
     description="Read text content from an image file using OCR. Supports common formats like PNG, JPG, JPEG. Returns an error message if the file does not exist or processing fails."
@@ -74,6 +95,17 @@ def read_image_file(path: str = Field(description="Path to the image file to rea
     if not path.lower().endswith(valid_extensions):
         return f"Error: Unsupported image format. Supported formats: {valid_extensions}"
     
+    # 相同内容的图像只识别一次
+    content_cache = get_content_cache()
+    if content_cache is not None:
+        cache_key = get_file_cache_key(
+            path, "read_image_file", IMAGE_OCR_VERSION, lang=OCR_LANG
+        )
+        cached_text = content_cache.get(cache_key)
+        if cached_text is not None:
+            print(f"✓ 从缓存读取图像文本: {os.path.basename(path)}")
+            return cached_text
+
     try:
         # 尝试打开图像文件
         with Image.open(path) as img:
@@ -85,10 +117,12 @@ def read_image_file(path: str = Field(description="Path to the image file to rea
             
             # 使用Tesseract进行OCR识别（支持中英文）
             # 注意：需要安装Tesseract并配置环境变量，同时下载中文语言包
-            text = pytesseract.image_to_string(img, lang='chi_sim+eng')
+            text = pytesseract.image_to_string(img, lang=OCR_LANG)
             
             if text.strip():
                 print("✓ OCR识别成功，提取到文本内容")
+                if content_cache is not None:
+                    content_cache.set(cache_key, text)
                 return text
             else:
                 return "OCR识别完成，但未提取到任何文本（可能是纯图片或低质量图像）。"
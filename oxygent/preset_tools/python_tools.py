@@ -1,39 +1,91 @@
 import logging
 from typing import Optional
 
+from oxygent.config import Config
 from oxygent.oxy import FunctionHub
+from oxygent.schemas import OxyRequest, OxyResponse, OxyState
+from oxygent.utils.python_worker_pool import (
+    get_python_kernel_manager,
+    get_python_worker_pool,
+    run_code,
+)
 
 logger = logging.getLogger(__name__)
 python_tools = FunctionHub(name="python_tools")
 
 
+def get_kernel_id(oxy_request: Optional[OxyRequest]) -> Optional[str]:
+    """Kernel of the call when stateful kernels are enabled, otherwise None.
+
+    With the ``session`` scope all the turns of a conversation share a kernel,
+    with the ``trace`` scope every request gets its own kernel.
+    """
+    if oxy_request is None or not Config.get_python_sandbox_is_kernel_enabled():
+        return None
+    if Config.get_python_sandbox_kernel_scope() == "session":
+        # The first trace of a conversation identifies its session
+        trace_ids = oxy_request.root_trace_ids + [oxy_request.current_trace_id]
+        return f"session:{trace_ids[0]}"
+    return f"trace:{oxy_request.current_trace_id}"
+
+
 @python_tools.tool(
-    description="Runs Python code in the current environment."
+    description="Runs Python code in an isolated Python worker process."
 )
 def run_python_code(
     code: str,
     variable_to_return: Optional[str] = None,
     safe_globals: Optional[dict] = None,
-    safe_locals: Optional[dict] = None
+    safe_locals: Optional[dict] = None,
+    oxy_request: OxyRequest = None,
 ) -> str:
+    logger.debug(f"Running code:\n\n{code}\n\n")
+    kernel_id = get_kernel_id(oxy_request)
     try:
-        logger.debug(f"Running code:\n\n{code}\n\n")
-        if not safe_globals:
-            safe_globals = globals()
-        if not safe_locals:
-            safe_locals = locals()
-
-        exec(code, safe_globals, safe_locals)
-
-        if variable_to_return:
-            variable_value = safe_locals.get(variable_to_return)
-            if variable_value is None:
-                return f"Variable {variable_to_return} not found"
-            logger.debug(
-                f"Variable {variable_to_return} value: {variable_value}")
-            return str(variable_value)
+        if kernel_id:
+            result = get_python_kernel_manager().run(
+                kernel_id, code, variable_to_return, safe_globals, safe_locals
+            )
+        elif Config.get_python_sandbox_is_enabled():
+            result = get_python_worker_pool().run(
+                code, variable_to_return, safe_globals, safe_locals
+            )
         else:
-            return "successfully run python code"
+            result = run_code(
+                code,
+                variable_to_return,
+                safe_globals,
+                safe_locals,
+                Config.get_python_sandbox_max_output_length(),
+            )
     except Exception as e:
-        logger.error(f"Error running python code: {e}")
-        return f"Error running python code: {e}"
+        result = {"is_success": False, "error": str(e), "stdout": ""}
+
+    if not result["is_success"]:
+        logger.error(f"Error running python code: {result['error']}")
+        output = f"Error running python code: {result['error']}"
+    elif variable_to_return:
+        if result["output"] is None:
+            output = f"Variable {variable_to_return} not found"
+        else:
+            logger.debug(f"Variable {variable_to_return} value: {result['output']}")
+            output = result["output"]
+    else:
+        output = "successfully run python code"
+    if result["stdout"]:
+        output += f"\nstdout:\n{result['stdout']}"
+    if result.get("is_kernel_restarted"):
+        output += "\nThe Python kernel was restarted, previous variables are lost."
+
+    if oxy_request is None:
+        return output
+    # Called as a tool, report the timing of the call
+    return OxyResponse(
+        state=OxyState.COMPLETED,
+        output=output,
+        extra={
+            key: round(result[key], 4)
+            for key in ("elapsed", "exec_time", "cpu_time")
+            if key in result
+        },
+    )
@@ -78,6 +78,40 @@ Tools for querying time can be obtained through retrieval tools.
 ${additional_prompt}
 """
 
+PARALLEL_TOOL_CALLS_PROMPT = """
+When several tool calls are needed and some of them depend on the results of others, you can send all of them in one response with the exact JSON object format below:
+```json
+{
+    "think": "Your thinking (if analysis is needed)",
+    "tool_calls": [
+        {
+            "id": "call_1",
+            "tool_name": "Tool name",
+            "arguments": {
+                "parameter_name": "parameter_value"
+            }
+        },
+        {
+            "id": "call_2",
+            "tool_name": "Tool name",
+            "arguments": {
+                "parameter_name": {"$ref": "call_1"}
+            }
+        }
+    ]
+}
+```
+{"$ref": "call_1"} is replaced with the result of the tool call whose id is call_1. Tool calls that do not depend on each other are executed in parallel.
+"""
+
+MEMORY_SUMMARY_PROMPT = """
+You are an expert in summarizing conversations. Merge the existing summary and the new conversation turns into one updated summary of the conversation between the user and the assistant. Specific requirements are as follows:
+1. Retain the user's goals, preferences, constraints and any facts, numbers, names or conclusions that later turns may rely on;
+2. Retain the questions that are still unresolved;
+3. Drop greetings, repetitions and intermediate reasoning;
+4. Output only the summary text, in the language of the conversation, within 300 words.
+"""
+
 INTENTION_PROMPT = """
 You are an expert in intention understanding, skilled at understanding the intentions of conversations. The following is a daily chat scenario. Please describe the merchant's current question intention with clear and concise language based on the historical conversation. Specific requirements are as follows:
 1. Based on the historical conversation, think step by step about the current question, analyze the core semantics of the question, infer the core intention of the question, and then describe the thinking process with concise text;
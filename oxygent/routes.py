@@ -35,6 +35,7 @@ from .databases.db_es import JesEs, LocalEs
 from .db_factory import DBFactory
 from .oxy_factory import OxyFactory
 from .schemas import OxyRequest, WebResponse
+from .utils.blob_utils import load_blobs
 from .utils.data_utils import add_post_and_child_node_ids
 
 logger = logging.getLogger(__name__)
@@ -149,7 +150,9 @@ async def get_node_info(item_id: str):
                 node_data["next_id"] = node_ids[i + 1] if i <= len(node_ids) - 2 else ""
 
                 if "input" in node_data:
-                    node_data["input"] = json.loads(node_data["input"])
+                    node_data["input"] = await load_blobs(
+                        es_client, json.loads(node_data["input"])
+                    )
 
                 if "prompt" in node_data["input"]["class_attr"]:
                     del node_data["input"]["class_attr"]["prompt"]
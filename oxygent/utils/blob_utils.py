@@ -0,0 +1,152 @@
+"""Content-addressed storage helpers for large, repeated strings in node records.
+
+Agent prompts, tool descriptions and attachment contents are repeated verbatim in
+almost every node record. This module swaps such strings for short references
+(``oxyblob://<md5>``) and keeps the original text in a shared ``{app}_blob`` index,
+which is written once per app version.
+"""
+
+import logging
+from collections import OrderedDict
+
+from ..config import Config
+from .common_utils import get_format_time, get_md5
+
+logger = logging.getLogger(__name__)
+
+BLOB_REF_PREFIX = "oxyblob://"
+
+# Blob doc ids recently written by this process, so a blob is usually indexed once.
+# Bounded as an LRU: forgetting an id only costs an idempotent re-index.
+_saved_blob_doc_ids: OrderedDict = OrderedDict()
+_MAX_SAVED_BLOB_DOC_IDS = 10000
+
+
+def get_blob_index_name() -> str:
+    return Config.get_app_name() + "_blob"
+
+
+def is_blob_ref(value) -> bool:
+    return isinstance(value, str) and value.startswith(BLOB_REF_PREFIX)
+
+
+def split_blobs(obj, min_length: int = None):
+    """Replace strings longer than *min_length* with blob references.
+
+    Args:
+        obj: A JSON-like structure of dicts, lists and scalars.
+        min_length: Minimum string length to be stored as a blob.
+
+    Returns:
+        tuple: ``(new_obj, blobs)`` where *blobs* maps blob ids to their content.
+    """
+    if min_length is None:
+        min_length = Config.get_blob_min_length()
+    blobs = {}
+
+    def _split(value):
+        if isinstance(value, str):
+            if len(value) < min_length or is_blob_ref(value):
+                return value
+            blob_id = get_md5(value)
+            blobs[blob_id] = value
+            return BLOB_REF_PREFIX + blob_id
+        if isinstance(value, dict):
+            return {k: _split(v) for k, v in value.items()}
+        if isinstance(value, (list, tuple)):
+            return [_split(v) for v in value]
+        return value
+
+    return _split(obj), blobs
+
+
+def find_blob_ids(obj) -> set:
+    """Collect every blob id referenced inside *obj*."""
+    blob_ids = set()
+
+    def _find(value):
+        if is_blob_ref(value):
+            blob_ids.add(value[len(BLOB_REF_PREFIX) :])
+        elif isinstance(value, dict):
+            for v in value.values():
+                _find(v)
+        elif isinstance(value, list):
+            for v in value:
+                _find(v)
+
+    _find(obj)
+    return blob_ids
+
+
+def join_blobs(obj, blobs: dict):
+    """Inverse of :func:`split_blobs`; unknown references are left untouched."""
+    if is_blob_ref(obj):
+        return blobs.get(obj[len(BLOB_REF_PREFIX) :], obj)
+    if isinstance(obj, dict):
+        return {k: join_blobs(v, blobs) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [join_blobs(v, blobs) for v in obj]
+    return obj
+
+
+async def save_blobs(es_client, blobs: dict):
+    """Index the blobs not yet written for the current app version."""
+    app_version = Config.get_app_version()
+    for blob_id, content in blobs.items():
+        doc_id = f"{app_version}_{blob_id}"
+        saved_key = f"{Config.get_app_name()}:{doc_id}"
+        if saved_key in _saved_blob_doc_ids:
+            _saved_blob_doc_ids.move_to_end(saved_key)
+            continue
+        await es_client.index(
+            get_blob_index_name(),
+            doc_id=doc_id,
+            body={
+                "blob_id": blob_id,
+                "version": app_version,
+                "content": content,
+                "create_time": get_format_time(),
+            },
+        )
+        _saved_blob_doc_ids[saved_key] = None
+        if len(_saved_blob_doc_ids) > _MAX_SAVED_BLOB_DOC_IDS:
+            _saved_blob_doc_ids.popitem(last=False)
+
+
+async def load_blobs(es_client, obj):
+    """Resolve every blob reference in *obj* from the blob index.
+
+    A blob is stored once per app version, so the lookup is scoped to the current
+    version first; refs only stored under older versions are then fetched one by
+    one, as a multi-version ``terms`` query could be filled by copies of one blob.
+    """
+    blob_ids = find_blob_ids(obj)
+    if not blob_ids:
+        return obj
+    es_response = await es_client.search(
+        get_blob_index_name(),
+        {
+            "query": {
+                "bool": {
+                    "must": [
+                        {"terms": {"blob_id": list(blob_ids)}},
+                        {"term": {"version": Config.get_app_version()}},
+                    ]
+                }
+            },
+            "size": len(blob_ids),
+        },
+    )
+    blobs = {}
+    for hit in (es_response or {}).get("hits", {}).get("hits", []):
+        blobs[hit["_source"]["blob_id"]] = hit["_source"]["content"]
+    for blob_id in blob_ids - set(blobs):
+        es_response = await es_client.search(
+            get_blob_index_name(),
+            {"query": {"term": {"blob_id": blob_id}}, "size": 1},
+        )
+        for hit in (es_response or {}).get("hits", {}).get("hits", []):
+            blobs[blob_id] = hit["_source"]["content"]
+    if len(blobs) < len(blob_ids):
+        logger.warning(f"Missing blobs: {blob_ids - set(blobs)}")
+    return join_blobs(obj, blobs)
@@ -21,9 +21,14 @@ import shortuuid
 from PIL import Image
 from pydantic import AnyUrl
 
+from .content_cache import get_bytes_hash, get_cache_key, get_content_cache
+
 logger = logging.getLogger(__name__)
 Image.MAX_IMAGE_PIXELS = 400000000
 
+# Bump when the output of image_to_base64 changes to invalidate cached payloads
+IMAGE_TO_BASE64_VERSION = "1"
+
 
 def is_linux():
     return platform.system().lower() == "linux"
@@ -113,8 +118,24 @@ async def image_to_base64(source: str, max_image_pixels: int = 10000000) -> str:
             img.save(output, format=img_format)
             return output.getvalue()
 
-    image_bytes = await asyncio.to_thread(process_image, image_bytes)
-    return f"data:image;base64,{base64.b64encode(image_bytes).decode('utf-8')}"
+    def encode_image(image_bytes):
+        image_bytes = process_image(image_bytes)
+        return f"data:image;base64,{base64.b64encode(image_bytes).decode('utf-8')}"
+
+    def encode_image_cached(image_bytes):
+        # Resizing and re-encoding is repeated for every LLM call with the image
+        content_cache = get_content_cache()
+        if content_cache is None:
+            return encode_image(image_bytes)
+        cache_key = get_cache_key(
+            get_bytes_hash(image_bytes),
+            "image_to_base64",
+            IMAGE_TO_BASE64_VERSION,
+            max_image_pixels=max_image_pixels,
+        )
+        return content_cache.get_or_set(cache_key, lambda: encode_image(image_bytes))
+
+    return await asyncio.to_thread(encode_image_cached, image_bytes)
 
 
 # 512 * 1024 * 1024 bytes == 512MB
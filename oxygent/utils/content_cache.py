@@ -0,0 +1,235 @@
+"""On-disk cache of content derived from files, keyed by content hash.
+
+Parsing an attachment (PDF text, OCR, base64 payloads for LLM calls) is costly and
+the same files are parsed again on every run and by every agent. The cache keys
+derived content by the sha256 of the source bytes plus the name, version and
+parameters of the extractor, so a renamed file still hits and a changed file or
+a new extractor version misses.
+
+Entries are stored as ``{cache_dir}/content_cache/<key>.json``. The least
+recently used entries are evicted once the cache grows over
+``content_cache.max_size_mb``.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Optional
+
+from ..config import Config
+
+logger = logging.getLogger(__name__)
+
+_HASH_CHUNK_SIZE = 1024 * 1024
+_MAX_FILE_HASHES = 4096
+
+# abspath -> (size, mtime_ns, sha256), so unchanged files are hashed only once
+_file_hashes: dict = {}
+_file_hashes_lock = threading.Lock()
+
+_content_cache: Optional["ContentCache"] = None
+_content_cache_lock = threading.Lock()
+
+
+def get_bytes_hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def get_file_hash(path: str) -> str:
+    """Return the sha256 of a file, reused while its size and mtime are unchanged."""
+    abs_path = os.path.abspath(path)
+    stat = os.stat(abs_path)
+    with _file_hashes_lock:
+        file_hash = _file_hashes.get(abs_path)
+    if file_hash and file_hash[:2] == (stat.st_size, stat.st_mtime_ns):
+        return file_hash[2]
+
+    sha256 = hashlib.sha256()
+    with open(abs_path, "rb") as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b""):
+            sha256.update(chunk)
+    digest = sha256.hexdigest()
+    with _file_hashes_lock:
+        if len(_file_hashes) >= _MAX_FILE_HASHES:
+            _file_hashes.clear()
+        _file_hashes[abs_path] = (stat.st_size, stat.st_mtime_ns, digest)
+    return digest
+
+
+def get_cache_key(content_hash: str, extractor: str, version: str, **params) -> str:
+    """Build the key of content derived from *content_hash* by an extractor.
+
+    Args:
+        content_hash (str): sha256 of the source bytes.
+        extractor (str): Name of the extractor, e.g. ``read_pdf_file``.
+        version (str): Version of the extractor, bump it when its output changes.
+        **params: Extractor parameters that change its output.
+    """
+    key_info = json.dumps(
+        [content_hash, extractor, version, params], sort_keys=True, default=str
+    )
+    return hashlib.sha256(key_info.encode("utf-8")).hexdigest()
+
+
+class ContentCache:
+    """Size-bounded LRU cache of JSON values stored one file per entry.
+
+    Args:
+        cache_dir (str): Directory of the entries.
+        max_size (int): Maximum total size of the entries in bytes.
+    """
+
+    def __init__(self, cache_dir: str, max_size: int):
+        self.cache_dir = cache_dir
+        self.max_size = max_size
+        # key -> entry size, from least to most recently used
+        self._entries: Optional[OrderedDict] = None
+        self._total_size = 0
+        self._lock = threading.Lock()
+        self._hit_count = 0
+        self._miss_count = 0
+
+    def _get_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key + ".json")
+
+    def _load_entries(self):
+        """Index the entries on disk, ordered by their last access time."""
+        if self._entries is not None:
+            return
+        os.makedirs(self.cache_dir, exist_ok=True)
+        entries = []
+        with os.scandir(self.cache_dir) as it:
+            for entry in it:
+                if entry.is_file() and entry.name.endswith(".json"):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime_ns, entry.name[:-5], stat.st_size))
+        entries.sort()
+        self._entries = OrderedDict((key, size) for _, key, size in entries)
+        self._total_size = sum(self._entries.values())
+
+    def get(self, key: str, default: Any = None) -> Any:
+        path = self._get_path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                value = json.load(f)["value"]
+        except FileNotFoundError:
+            with self._lock:
+                self._miss_count += 1
+                if self._entries is not None:
+                    self._total_size -= self._entries.pop(key, 0)
+            return default
+        except Exception as e:
+            logger.warning(f"Load content cache {path} error: {e}")
+            self.delete(key)
+            with self._lock:
+                self._miss_count += 1
+            return default
+
+        with self._lock:
+            self._hit_count += 1
+            if self._entries is not None and key in self._entries:
+                self._entries.move_to_end(key)
+        try:
+            # The mtime keeps the LRU order across processes
+            os.utime(path)
+        except OSError:
+            pass
+        return value
+
+    def set(self, key: str, value: Any):
+        """Atomically store a JSON-serializable value, then evict old entries."""
+        path = self._get_path(key)
+        try:
+            data = json.dumps({"value": value}, ensure_ascii=False).encode("utf-8")
+        except (TypeError, ValueError) as e:
+            logger.warning(f"Content cache value of {key} is not serializable: {e}")
+            return
+        if len(data) > self.max_size:
+            return
+
+        with self._lock:
+            try:
+                self._load_entries()
+                tmp_path = f"{path}.{os.getpid()}.tmp"
+                with open(tmp_path, "wb") as f:
+                    f.write(data)
+                os.replace(tmp_path, path)
+            except Exception as e:
+                logger.warning(f"Save content cache {path} error: {e}")
+                return
+            self._total_size += len(data) - self._entries.pop(key, 0)
+            self._entries[key] = len(data)
+            self._evict()
+
+    def _evict(self):
+        while self._total_size > self.max_size and self._entries:
+            key, size = self._entries.popitem(last=False)
+            self._total_size -= size
+            try:
+                os.remove(self._get_path(key))
+            except OSError:
+                pass
+
+    def get_or_set(self, key: str, func: Callable[[], Any]) -> Any:
+        """Return the cached value of *key*, computing and storing it on a miss."""
+        value = self.get(key)
+        if value is None:
+            value = func()
+            if value is not None:
+                self.set(key, value)
+        return value
+
+    def delete(self, key: str):
+        with self._lock:
+            if self._entries is not None:
+                self._total_size -= self._entries.pop(key, 0)
+            try:
+                os.remove(self._get_path(key))
+            except OSError:
+                pass
+
+    def clear(self):
+        with self._lock:
+            self._load_entries()
+            for key in list(self._entries):
+                try:
+                    os.remove(self._get_path(key))
+                except OSError:
+                    pass
+            self._entries.clear()
+            self._total_size = 0
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            self._load_entries()
+            return {
+                "hit_count": self._hit_count,
+                "miss_count": self._miss_count,
+                "entry_count": len(self._entries),
+                "total_size": self._total_size,
+                "max_size": self.max_size,
+            }
+
+
+def get_content_cache() -> Optional[ContentCache]:
+    """Return the shared content cache, or None when it is disabled."""
+    global _content_cache
+    if not Config.get_content_cache_is_enabled():
+        return None
+    cache_dir = os.path.join(Config.get_cache_save_dir(), "content_cache")
+    max_size = int(Config.get_content_cache_max_size_mb() * 1024 * 1024)
+    with _content_cache_lock:
+        if (
+            _content_cache is None
+            or _content_cache.cache_dir != cache_dir
+            or _content_cache.max_size != max_size
+        ):
+            _content_cache = ContentCache(cache_dir, max_size)
+        return _content_cache
+
+
+def get_file_cache_key(path: str, extractor: str, version: str, **params) -> str:
+    return get_cache_key(get_file_hash(path), extractor, version, **params)
@@ -0,0 +1,208 @@
+"""Page-parallel text extraction and OCR of documents.
+
+The text layer of every PDF page is extracted first. Pages without text (scanned
+pages) are split into chunks rendered and recognized with Tesseract concurrently
+by a pool of worker processes. Results are yielded in page order as soon as the
+next page is ready. When OCR of a chunk fails, its pages fall back to their (empty)
+text layer so the pages already extracted are not lost.
+
+``pdf2image`` (with Poppler) and ``pytesseract`` (with Tesseract) are only needed
+for OCR and are imported by the workers when a page has to be recognized.
+"""
+
+import logging
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Iterator, Optional
+
+import PyPDF2
+
+from ..config import Config
+
+logger = logging.getLogger(__name__)
+
+OCR_LANG = "chi_sim+eng"
+
+# Bump when the extracted text changes to invalidate cached extractions
+PDF_EXTRACTOR_VERSION = "1"
+
+_executor: Optional[ProcessPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_pdf_page_count(path: str) -> int:
+    with open(path, "rb") as f:
+        return len(PyPDF2.PdfReader(f).pages)
+
+
+def extract_pdf_pages(path: str, page_indexes: list) -> list:
+    """Extract the text layer of pages, empty strings for pages without text."""
+    texts = []
+    with open(path, "rb") as f:
+        reader = PyPDF2.PdfReader(f)
+        for page_index in page_indexes:
+            try:
+                texts.append(reader.pages[page_index].extract_text() or "")
+            except Exception as e:
+                logger.warning(f"Extract page {page_index} of {path} error: {e}")
+                texts.append("")
+    return texts
+
+
+def ocr_pdf_pages(path: str, page_indexes: list, lang: str = OCR_LANG) -> list:
+    """Render pages with Poppler and recognize them with Tesseract."""
+    import pytesseract
+    from pdf2image import convert_from_path
+
+    # Render each run of consecutive pages, never the pages between two runs
+    images = {}
+    for run in _split_runs(sorted(set(page_indexes))):
+        run_images = convert_from_path(
+            path, first_page=run[0] + 1, last_page=run[-1] + 1
+        )
+        images.update(zip(run, run_images))
+    return [
+        pytesseract.image_to_string(images[page_index], lang=lang)
+        for page_index in page_indexes
+    ]
+
+
+def _split_runs(page_indexes: list) -> list:
+    """Split sorted page indexes into runs of consecutive pages."""
+    runs = []
+    for page_index in page_indexes:
+        if runs and page_index == runs[-1][-1] + 1:
+            runs[-1].append(page_index)
+        else:
+            runs.append([page_index])
+    return runs
+
+
+def _create_executor(max_workers: int) -> ProcessPoolExecutor:
+    # Forking a process running threads and an event loop is unsafe
+    start_method = (
+        "forkserver"
+        if "forkserver" in multiprocessing.get_all_start_methods()
+        else "spawn"
+    )
+    context = multiprocessing.get_context(start_method)
+    if start_method == "forkserver":
+        # Workers are forked from a server that already imported this module
+        context.set_forkserver_preload([__name__])
+    return ProcessPoolExecutor(max_workers=max_workers, mp_context=context)
+
+
+def get_document_executor() -> ProcessPoolExecutor:
+    """Return the process pool shared by document tools."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = _create_executor(Config.get_tool_document_max_workers())
+        return _executor
+
+
+def _reset_document_executor(broken_executor: Optional[ProcessPoolExecutor] = None):
+    """Drop the shared pool, only if it is still *broken_executor* when given."""
+    global _executor
+    with _executor_lock:
+        if _executor is not None and broken_executor in (None, _executor):
+            _executor.shutdown(wait=False, cancel_futures=True)
+            _executor = None
+
+
+def _chunk(page_indexes: list, size: int) -> list:
+    return [page_indexes[i : i + size] for i in range(0, len(page_indexes), size)]
+
+
+def iter_pdf_pages(
+    path: str,
+    is_ocr_fallback: bool = True,
+    lang: str = OCR_LANG,
+    max_workers: Optional[int] = None,
+    pages_per_task: Optional[int] = None,
+    ocr_errors: Optional[list] = None,
+) -> Iterator[tuple]:
+    """Yield ``(page_index, text, method)`` for every page, in page order.
+
+    Args:
+        path (str): Path of the PDF file.
+        is_ocr_fallback (bool): Whether to OCR the pages without a text layer.
+        lang (str): Tesseract languages.
+        max_workers (int, optional): OCR worker processes, 1 to run in the current
+            process. Defaults to the shared pool of ``tool.document_max_workers``.
+        pages_per_task (int, optional): Pages per OCR task. Defaults to
+            ``tool.document_pages_per_task``.
+        ocr_errors (list, optional): Receives the exception of every failed OCR
+            task.
+
+    ``method`` is ``text`` for the text layer, ``ocr`` for recognized pages,
+    ``empty`` for pages without text when OCR is disabled and ``ocr_error`` for
+    pages whose OCR failed, which keep their text layer.
+    """
+    is_shared_executor = max_workers is None
+    if max_workers is None:
+        max_workers = Config.get_tool_document_max_workers()
+    if pages_per_task is None:
+        pages_per_task = Config.get_tool_document_pages_per_task()
+    # Reading the text layer is cheap, only OCR is worth a round trip to a worker
+    texts = extract_pdf_pages(path, list(range(get_pdf_page_count(path))))
+    scanned_pages = [
+        page_index for page_index, text in enumerate(texts) if not text.strip()
+    ]
+    if not is_ocr_fallback or not scanned_pages:
+        for page_index, text in enumerate(texts):
+            yield page_index, text, "text" if text.strip() else "empty"
+        return
+
+    def on_ocr_error(page_indexes: list, e: Exception):
+        logger.warning(f"OCR of pages {page_indexes} of {path} error: {e!r}")
+        if ocr_errors is not None:
+            ocr_errors.append(e)
+
+    if max_workers <= 1:
+        for page_index, text in enumerate(texts):
+            if page_index not in scanned_pages:
+                yield page_index, text, "text"
+                continue
+            try:
+                yield page_index, ocr_pdf_pages(path, [page_index], lang)[0], "ocr"
+            except Exception as e:
+                on_ocr_error([page_index], e)
+                yield page_index, text, "ocr_error"
+        return
+
+    executor = (
+        get_document_executor() if is_shared_executor else _create_executor(max_workers)
+    )
+    # page_index -> (Future of its OCR chunk, position in the chunk)
+    ocr_futures: dict = {}
+    failed_futures = set()
+    try:
+        for chunk in _chunk(scanned_pages, max(1, pages_per_task)):
+            ocr_future = executor.submit(ocr_pdf_pages, path, chunk, lang)
+            for position, page_index in enumerate(chunk):
+                ocr_futures[page_index] = (ocr_future, position, chunk)
+        for page_index, text in enumerate(texts):
+            if page_index not in ocr_futures:
+                yield page_index, text, "text"
+                continue
+            ocr_future, position, chunk = ocr_futures[page_index]
+            try:
+                ocr_text = ocr_future.result()[position]
+            except Exception as e:
+                if ocr_future not in failed_futures:
+                    failed_futures.add(ocr_future)
+                    on_ocr_error(chunk, e)
+                    if isinstance(e, BrokenProcessPool) and is_shared_executor:
+                        _reset_document_executor(executor)
+                yield page_index, text, "ocr_error"
+            else:
+                yield page_index, ocr_text, "ocr"
+    finally:
+        # Stop pending work when the caller stops iterating
+        for ocr_future, _, _ in ocr_futures.values():
+            ocr_future.cancel()
+        if not is_shared_executor:
+            executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,581 @@
+"""Pool of warm, sandboxed worker processes running Python code.
+
+``run_python_code`` executes code written by LLMs. Running it with ``exec`` in
+the MAS process lets a crash, an infinite loop or a memory blow-up take the whole
+service down, and every call pays for importing heavy libraries again.
+
+The PythonWorkerPool keeps ``pool_size`` worker processes, forked from a fork
+server that imported the ``preload_modules`` once, which run code requests one at
+a time:
+
+* the address space of a worker is limited to ``memory_limit`` MB and each call
+  to ``cpu_time_limit`` CPU seconds (POSIX only);
+* the caller stops waiting after ``timeout`` seconds and the worker is killed;
+* stdout and stderr of the code are captured and returned;
+* dead workers are replaced, and workers are recycled after
+  ``max_tasks_per_worker`` calls.
+
+The PythonKernelManager runs opt-in stateful kernels on the same workers: one
+worker per kernel id whose namespace survives across calls.
+
+All methods are synchronous and thread-safe, run them in a thread from async code.
+"""
+
+import atexit
+import builtins
+import contextlib
+import importlib
+import io
+import logging
+import math
+import multiprocessing
+import os
+import pickle
+import signal
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+from ..config import Config
+
+logger = logging.getLogger(__name__)
+
+# Libraries such as numpy start one thread per core, keep workers single threaded
+_SINGLE_THREAD_ENVS = (
+    "OMP_NUM_THREADS",
+    "OPENBLAS_NUM_THREADS",
+    "MKL_NUM_THREADS",
+    "NUMEXPR_NUM_THREADS",
+)
+
+
+def _set_cpu_time_limit(cpu_time_limit: float):
+    if resource is None or cpu_time_limit <= 0:
+        return
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    soft_limit = math.ceil(usage.ru_utime + usage.ru_stime + cpu_time_limit)
+    _, hard_limit = resource.getrlimit(resource.RLIMIT_CPU)
+    if hard_limit != resource.RLIM_INFINITY:
+        soft_limit = min(soft_limit, hard_limit)
+    resource.setrlimit(resource.RLIMIT_CPU, (soft_limit, hard_limit))
+
+
+def _get_rss() -> float:
+    """Resident memory of the current process in MB."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 1024 / 1024
+    except (OSError, ValueError, AttributeError):
+        if resource is None:
+            return 0
+        # Peak resident memory, in KB on Linux and bytes on macOS
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return max_rss / 1024 / (1024 if os.uname().sysname == "Darwin" else 1)
+
+
+def _build_request(
+    code: str,
+    variable_to_return: Optional[str],
+    safe_globals: Optional[dict],
+    safe_locals: Optional[dict],
+    max_output_length: int,
+    cpu_time_limit: float,
+    is_kernel: bool = False,
+) -> bytes:
+    try:
+        return pickle.dumps(
+            {
+                "code": code,
+                "variable_to_return": variable_to_return,
+                "safe_globals": safe_globals,
+                "safe_locals": safe_locals,
+                "max_output_length": max_output_length,
+                "cpu_time_limit": cpu_time_limit,
+                "is_kernel": is_kernel,
+            }
+        )
+    except Exception as e:
+        raise ValueError(f"Globals and locals must be picklable: {e}") from e
+
+
+def _get_context():
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context("spawn")
+
+
+def run_code(
+    code: str,
+    variable_to_return: Optional[str],
+    safe_globals: Optional[dict],
+    safe_locals: Optional[dict],
+    max_output_length: int,
+) -> dict:
+    """Execute code and return its result, captured output and timing."""
+    if safe_globals is None:
+        safe_globals = {"__name__": "__main__", "__builtins__": builtins}
+    if safe_locals is None:
+        # Top-level names stay visible to functions defined by the code
+        safe_locals = safe_globals
+    stdout = io.StringIO()
+    start_time = time.perf_counter()
+    start_cpu_time = time.process_time()
+    result = {"is_success": True, "output": "", "error": ""}
+    try:
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stdout):
+            exec(code, safe_globals, safe_locals)
+        if variable_to_return:
+            variable_value = safe_locals.get(variable_to_return)
+            result["output"] = None if variable_value is None else str(variable_value)
+    except BaseException as e:
+        result.update(is_success=False, error=str(e) or e.__class__.__name__)
+    result["stdout"] = stdout.getvalue()[:max_output_length]
+    result["exec_time"] = time.perf_counter() - start_time
+    result["cpu_time"] = time.process_time() - start_cpu_time
+    return result
+
+
+def _worker_main(conn, preload_modules: list, memory_limit: int):
+    # Ctrl-C is handled by the parent process
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    for env in _SINGLE_THREAD_ENVS:
+        os.environ.setdefault(env, "1")
+    for module_name in preload_modules:
+        try:
+            importlib.import_module(module_name)
+        except Exception as e:
+            logger.warning(f"Preload module {module_name} error: {e}")
+    if resource is not None and memory_limit > 0:
+        memory_bytes = memory_limit * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (memory_bytes, memory_bytes))
+    conn.send("ready")
+    # Namespace kept across calls when the worker serves a kernel
+    kernel_namespace = None
+    while True:
+        try:
+            request_bytes = conn.recv_bytes()
+        except EOFError:
+            return
+        try:
+            request = pickle.loads(request_bytes)
+            _set_cpu_time_limit(request.pop("cpu_time_limit"))
+            if request.pop("is_kernel"):
+                if kernel_namespace is None:
+                    kernel_namespace = {
+                        "__name__": "__main__",
+                        "__builtins__": builtins,
+                    }
+                kernel_namespace.update(request["safe_globals"] or {})
+                request["safe_globals"] = kernel_namespace
+            result = run_code(**request)
+        except Exception as e:
+            # The globals of the request cannot be unpickled in the worker
+            result = {"is_success": False, "error": str(e), "stdout": ""}
+        result["rss"] = _get_rss()
+        conn.send(result)
+
+
+class _Worker:
+    def __init__(self, context, preload_modules: list, memory_limit: int):
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(
+            target=_worker_main,
+            args=(child_conn, preload_modules, memory_limit),
+            daemon=True,
+        )
+        self.process.start()
+        child_conn.close()
+        self.task_count = 0
+
+    @classmethod
+    def start(cls, context, preload_modules: list, memory_limit: int, timeout: float):
+        worker = cls(context, preload_modules, memory_limit)
+        if not (worker.conn.poll(timeout) and worker.conn.recv() == "ready"):
+            worker.kill()
+            raise RuntimeError("Python worker failed to start")
+        return worker
+
+    def call(self, request: bytes, timeout: float, cpu_time_limit: float) -> dict:
+        """Send a request and wait for its result.
+
+        The worker must be killed when the result has ``is_worker_dead`` set.
+        """
+        self.task_count += 1
+        try:
+            self.conn.send_bytes(request)
+            if self.conn.poll(timeout):
+                return self.conn.recv()
+            return {
+                "is_success": False,
+                "error": f"execution timed out after {timeout}s",
+                "stdout": "",
+                "is_worker_dead": True,
+            }
+        except (EOFError, OSError):
+            self.process.join(1)
+            if self.process.exitcode == -getattr(signal, "SIGXCPU", 0):
+                error = f"CPU time limit of {cpu_time_limit}s exceeded"
+            else:
+                error = f"worker exited with code {self.process.exitcode}"
+            return {
+                "is_success": False,
+                "error": error,
+                "stdout": "",
+                "is_worker_dead": True,
+            }
+
+    def kill(self):
+        if self.process.is_alive():
+            self.process.kill()
+        self.process.join(1)
+        self.conn.close()
+
+
+class PythonWorkerPool:
+    """Bounded pool of sandboxed Python worker processes.
+
+    Args:
+        pool_size (int): Number of worker processes.
+        preload_modules (list): Modules imported by every worker at start-up.
+        timeout (float): Wall clock seconds a call may take.
+        cpu_time_limit (float): CPU seconds a call may use, 0 for no limit.
+        memory_limit (int): Address space limit of a worker in MB, 0 for no limit.
+        max_tasks_per_worker (int): Calls served by a worker before it is replaced.
+        max_output_length (int): Maximum captured stdout characters per call.
+    """
+
+    def __init__(
+        self,
+        pool_size: int = 2,
+        preload_modules: Optional[list] = None,
+        timeout: float = 60,
+        cpu_time_limit: float = 30,
+        memory_limit: int = 4096,
+        max_tasks_per_worker: int = 100,
+        max_output_length: int = 10000,
+    ):
+        self.pool_size = max(1, pool_size)
+        self.preload_modules = preload_modules or []
+        self.timeout = timeout
+        self.cpu_time_limit = cpu_time_limit
+        self.memory_limit = memory_limit
+        self.max_tasks_per_worker = max_tasks_per_worker
+        self.max_output_length = max_output_length
+        self._context = _get_context()
+        if self._context.get_start_method() == "forkserver":
+            # Workers are forked from a server that already imported the modules
+            self._context.set_forkserver_preload([__name__] + self.preload_modules)
+        self._idle_workers: list[_Worker] = []
+        self._worker_count = 0
+        self._condition = threading.Condition()
+        self._is_closed = False
+
+    def _start_worker(self) -> _Worker:
+        return _Worker.start(
+            self._context,
+            self.preload_modules,
+            self.memory_limit,
+            max(self.timeout, 60),
+        )
+
+    def _acquire(self) -> _Worker:
+        with self._condition:
+            while True:
+                if self._is_closed:
+                    raise RuntimeError("Python worker pool is closed")
+                if self._idle_workers:
+                    return self._idle_workers.pop()
+                if self._worker_count < self.pool_size:
+                    self._worker_count += 1
+                    break
+                self._condition.wait()
+        try:
+            return self._start_worker()
+        except BaseException:
+            with self._condition:
+                self._worker_count -= 1
+                self._condition.notify()
+            raise
+
+    def _release(self, worker: _Worker, is_reusable: bool):
+        with self._condition:
+            is_reusable = (
+                is_reusable
+                and not self._is_closed
+                and worker.task_count < self.max_tasks_per_worker
+            )
+            if is_reusable:
+                self._idle_workers.append(worker)
+            else:
+                self._worker_count -= 1
+            self._condition.notify()
+        if not is_reusable:
+            worker.kill()
+
+    def run(
+        self,
+        code: str,
+        variable_to_return: Optional[str] = None,
+        safe_globals: Optional[dict] = None,
+        safe_locals: Optional[dict] = None,
+    ) -> dict:
+        """Run code in a worker.
+
+        Returns:
+            dict: ``is_success``, ``output`` (the string value of
+                *variable_to_return*, None if missing), ``error``, ``stdout``,
+                ``exec_time`` and ``cpu_time`` measured in the worker and
+                ``elapsed`` measured by the caller.
+        """
+        start_time = time.perf_counter()
+        request = _build_request(
+            code,
+            variable_to_return,
+            safe_globals,
+            safe_locals,
+            self.max_output_length,
+            self.cpu_time_limit,
+        )
+        worker = self._acquire()
+        is_reusable = False
+        try:
+            result = worker.call(request, self.timeout, self.cpu_time_limit)
+            is_reusable = not result.pop("is_worker_dead", False)
+        finally:
+            self._release(worker, is_reusable)
+        result["elapsed"] = time.perf_counter() - start_time
+        return result
+
+    def close(self):
+        with self._condition:
+            self._is_closed = True
+            workers, self._idle_workers = self._idle_workers, []
+            self._worker_count -= len(workers)
+            self._condition.notify_all()
+        for worker in workers:
+            worker.kill()
+
+
+class _Kernel:
+    def __init__(self, worker: _Worker):
+        self.worker = worker
+        self.lock = threading.Lock()
+        self.last_used = time.monotonic()
+
+
+class PythonKernelManager:
+    """Stateful Python kernels, one worker process per kernel id.
+
+    Variables defined by a call stay available to the next calls with the same
+    kernel id. Kernels idle for ``ttl`` seconds, or using more than
+    ``kernel_memory_limit`` MB of resident memory after a call, are shut down;
+    the least recently used kernel is shut down beyond ``max_kernels``.
+
+    Args:
+        max_kernels (int): Maximum number of live kernels.
+        ttl (float): Idle seconds before a kernel is shut down.
+        kernel_memory_limit (int): Resident memory in MB above which a kernel is
+            shut down after its call, 0 for no limit.
+        preload_modules (list): Modules imported by every kernel at start-up.
+        timeout (float): Wall clock seconds a call may take.
+        cpu_time_limit (float): CPU seconds a call may use, 0 for no limit.
+        memory_limit (int): Address space limit of a kernel in MB, 0 for no limit.
+        max_output_length (int): Maximum captured stdout characters per call.
+    """
+
+    def __init__(
+        self,
+        max_kernels: int = 8,
+        ttl: float = 600,
+        kernel_memory_limit: int = 2048,
+        preload_modules: Optional[list] = None,
+        timeout: float = 60,
+        cpu_time_limit: float = 30,
+        memory_limit: int = 4096,
+        max_output_length: int = 10000,
+    ):
+        self.max_kernels = max(1, max_kernels)
+        self.ttl = ttl
+        self.kernel_memory_limit = kernel_memory_limit
+        self.preload_modules = preload_modules or []
+        self.timeout = timeout
+        self.cpu_time_limit = cpu_time_limit
+        self.memory_limit = memory_limit
+        self.max_output_length = max_output_length
+        self._context = _get_context()
+        if self._context.get_start_method() == "forkserver":
+            self._context.set_forkserver_preload([__name__] + self.preload_modules)
+        self._kernels: OrderedDict[str, _Kernel] = OrderedDict()
+        self._lock = threading.Lock()
+        self._reaper: Optional[threading.Thread] = None
+        self._is_closed = False
+
+    @property
+    def size(self) -> int:
+        return len(self._kernels)
+
+    def _get_kernel(self, kernel_id: str) -> _Kernel:
+        evicted_kernels = []
+        with self._lock:
+            if self._is_closed:
+                raise RuntimeError("Python kernel manager is closed")
+            kernel = self._kernels.get(kernel_id)
+            if kernel is None:
+                # Reserve the id, the worker is started by the first call
+                kernel = _Kernel(None)
+                self._kernels[kernel_id] = kernel
+            self._kernels.move_to_end(kernel_id)
+            kernel.last_used = time.monotonic()
+            while len(self._kernels) > self.max_kernels:
+                evicted_kernels.append(self._kernels.popitem(last=False)[1])
+            if self._reaper is None and self.ttl > 0:
+                self._reaper = threading.Thread(target=self._reap, daemon=True)
+                self._reaper.start()
+        for evicted_kernel in evicted_kernels:
+            self._shutdown(evicted_kernel)
+        return kernel
+
+    def _shutdown(self, kernel: _Kernel):
+        with kernel.lock:
+            if kernel.worker is not None:
+                kernel.worker.kill()
+                kernel.worker = None
+
+    def _remove(self, kernel_id: str, kernel: _Kernel):
+        with self._lock:
+            if self._kernels.get(kernel_id) is kernel:
+                del self._kernels[kernel_id]
+        if kernel.worker is not None:
+            kernel.worker.kill()
+            kernel.worker = None
+
+    def run(
+        self,
+        kernel_id: str,
+        code: str,
+        variable_to_return: Optional[str] = None,
+        safe_globals: Optional[dict] = None,
+        safe_locals: Optional[dict] = None,
+    ) -> dict:
+        """Run code in the kernel of *kernel_id*, starting it if needed.
+
+        Returns:
+            dict: The result of :meth:`PythonWorkerPool.run`, with
+                ``is_kernel_restarted`` set when the state of the kernel was lost.
+        """
+        start_time = time.perf_counter()
+        request = _build_request(
+            code,
+            variable_to_return,
+            safe_globals,
+            safe_locals,
+            self.max_output_length,
+            self.cpu_time_limit,
+            is_kernel=True,
+        )
+        while True:
+            kernel = self._get_kernel(kernel_id)
+            kernel.lock.acquire()
+            if self._kernels.get(kernel_id) is kernel:
+                break
+            # Evicted before the call started
+            kernel.lock.release()
+        try:
+            if kernel.worker is None:
+                kernel.worker = _Worker.start(
+                    self._context,
+                    self.preload_modules,
+                    self.memory_limit,
+                    max(self.timeout, 60),
+                )
+            result = kernel.worker.call(request, self.timeout, self.cpu_time_limit)
+            kernel.last_used = time.monotonic()
+            is_worker_dead = result.pop("is_worker_dead", False)
+            is_over_memory = (
+                self.kernel_memory_limit > 0
+                and result.get("rss", 0) > self.kernel_memory_limit
+            )
+            if is_worker_dead or is_over_memory:
+                self._remove(kernel_id, kernel)
+                result["is_kernel_restarted"] = True
+        finally:
+            kernel.lock.release()
+        result["elapsed"] = time.perf_counter() - start_time
+        return result
+
+    def shutdown_kernel(self, kernel_id: str):
+        with self._lock:
+            kernel = self._kernels.pop(kernel_id, None)
+        if kernel is not None:
+            self._shutdown(kernel)
+
+    def _reap(self):
+        while not self._is_closed:
+            time.sleep(max(self.ttl / 4, 0.01))
+            now = time.monotonic()
+            with self._lock:
+                expired = [
+                    (kernel_id, kernel)
+                    for kernel_id, kernel in self._kernels.items()
+                    if now - kernel.last_used > self.ttl and not kernel.lock.locked()
+                ]
+                for kernel_id, _ in expired:
+                    del self._kernels[kernel_id]
+            for _, kernel in expired:
+                self._shutdown(kernel)
+
+    def close(self):
+        with self._lock:
+            self._is_closed = True
+            kernels = list(self._kernels.values())
+            self._kernels.clear()
+        for kernel in kernels:
+            self._shutdown(kernel)
+
+
+_worker_pool: Optional[PythonWorkerPool] = None
+_worker_pool_lock = threading.Lock()
+_kernel_manager: Optional[PythonKernelManager] = None
+
+
+def get_python_worker_pool() -> PythonWorkerPool:
+    """Return the process-wide worker pool configured by ``python_sandbox``."""
+    global _worker_pool
+    with _worker_pool_lock:
+        if _worker_pool is None:
+            _worker_pool = PythonWorkerPool(
+                pool_size=Config.get_python_sandbox_pool_size(),
+                preload_modules=Config.get_python_sandbox_preload_modules(),
+                timeout=Config.get_python_sandbox_timeout(),
+                cpu_time_limit=Config.get_python_sandbox_cpu_time_limit(),
+                memory_limit=Config.get_python_sandbox_memory_limit(),
+                max_tasks_per_worker=Config.get_python_sandbox_max_tasks_per_worker(),
+                max_output_length=Config.get_python_sandbox_max_output_length(),
+            )
+            atexit.register(_worker_pool.close)
+        return _worker_pool
+
+
+def get_python_kernel_manager() -> PythonKernelManager:
+    """Return the process-wide kernel manager configured by ``python_sandbox``."""
+    global _kernel_manager
+    with _worker_pool_lock:
+        if _kernel_manager is None:
+            _kernel_manager = PythonKernelManager(
+                max_kernels=Config.get_python_sandbox_max_kernels(),
+                ttl=Config.get_python_sandbox_kernel_ttl(),
+                kernel_memory_limit=Config.get_python_sandbox_kernel_memory_limit(),
+                preload_modules=Config.get_python_sandbox_preload_modules(),
+                timeout=Config.get_python_sandbox_timeout(),
+                cpu_time_limit=Config.get_python_sandbox_cpu_time_limit(),
+                memory_limit=Config.get_python_sandbox_memory_limit(),
+                max_output_length=Config.get_python_sandbox_max_output_length(),
+            )
+            atexit.register(_kernel_manager.close)
+        return _kernel_manager
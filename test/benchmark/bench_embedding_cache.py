@@ -0,0 +1,92 @@
+"""
+Benchmark of EmbeddingCache persistence: full pickle against the append-only store.
+
+A cache of ``--count`` embeddings is written once in both formats. Then opening
+the cache, reading every vector and saving ``--new`` additional embeddings are
+timed for each format.
+
+Run with: PYTHONPATH=. python test/benchmark/bench_embedding_cache.py
+"""
+
+import argparse
+import hashlib
+import os
+import pickle
+import tempfile
+import time
+
+import numpy as np
+
+from oxygent.embedding_cache import EmbeddingStore
+
+
+def make_entries(count: int, dimension: int, seed: int) -> dict:
+    rng = np.random.default_rng(seed)
+    vectors = rng.normal(size=(count, dimension)).astype(np.float32)
+    return {
+        hashlib.md5(f"{seed}-{i}".encode()).hexdigest(): vectors[i]
+        for i in range(count)
+    }
+
+
+def timed(func) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--count", type=int, default=50000)
+    parser.add_argument("--dimension", type=int, default=1024)
+    parser.add_argument("--new", type=int, default=100)
+    args = parser.parse_args()
+
+    entries = make_entries(args.count, args.dimension, seed=0)
+    new_entries = make_entries(args.new, args.dimension, seed=1)
+    with tempfile.TemporaryDirectory() as save_dir:
+        pickle_file = os.path.join(save_dir, "cache.pkl")
+        with open(pickle_file, "wb") as f:
+            pickle.dump(entries, f)
+        store = EmbeddingStore(save_dir)
+        store.update(entries)
+        store.flush()
+
+        def pickle_load():
+            with open(pickle_file, "rb") as f:
+                return pickle.load(f)
+
+        def pickle_save():
+            data = pickle_load()
+            data.update(new_entries)
+            with open(pickle_file, "wb") as f:
+                pickle.dump(data, f)
+
+        def store_save():
+            store = EmbeddingStore(save_dir)
+            store.update(new_entries)
+            store.flush()
+
+        def read_all(data):
+            return sum(float(data[md5][0]) for md5 in entries)
+
+        data = pickle_load()
+        store = EmbeddingStore(save_dir)
+        print(f"{args.count} embeddings of dimension {args.dimension}")
+        print(f"{'operation':<28}{'pickle s':>10}{'store s':>10}")
+        print(
+            f"{'open':<28}{timed(pickle_load):>10.3f}"
+            f"{timed(lambda: EmbeddingStore(save_dir)):>10.3f}"
+        )
+        print(
+            f"{'read every vector':<28}{timed(lambda: read_all(data)):>10.3f}"
+            f"{timed(lambda: read_all(store)):>10.3f}"
+        )
+        print(
+            f"{f'open + save {args.new} new':<28}{timed(pickle_save):>10.3f}"
+            f"{timed(store_save):>10.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
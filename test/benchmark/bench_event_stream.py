@@ -0,0 +1,85 @@
+"""
+Benchmark of SSE event delivery: polling with rpop against push-woken brpop.
+
+``--streams`` consumers wait on their own list of a LocalRedis, as open
+``MAS.event_stream`` connections do. The CPU time burnt while every stream is idle
+is measured first. Then one event per stream is pushed at a random time, and the
+delay between the push and its delivery is reported.
+
+Run with: PYTHONPATH=. python test/benchmark/bench_event_stream.py
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+
+from oxygent.databases.db_redis.local_redis import LocalRedis
+
+
+async def polling_consumer(redis: LocalRedis, key: str, latencies: list):
+    # The loop event_stream used before push-based delivery
+    while True:
+        message = await redis.rpop(key)
+        if message is None:
+            await asyncio.sleep(0.1)
+            continue
+        latencies.append(time.perf_counter() - message)
+        return
+
+
+async def push_consumer(redis: LocalRedis, key: str, latencies: list):
+    while True:
+        message = await redis.brpop(key, timeout=10)
+        if message is None:
+            continue
+        latencies.append(time.perf_counter() - message)
+        return
+
+
+async def run(consumer, streams: int, idle_seconds: float) -> tuple:
+    redis = LocalRedis()
+    latencies = []
+    tasks = [
+        asyncio.create_task(consumer(redis, f"stream:{i}", latencies))
+        for i in range(streams)
+    ]
+    await asyncio.sleep(0.2)
+
+    start = time.process_time()
+    await asyncio.sleep(idle_seconds)
+    idle_cpu = (time.process_time() - start) / idle_seconds
+
+    async def produce(i):
+        await asyncio.sleep(random.uniform(0, 0.5))
+        await redis.lpush(f"stream:{i}", time.perf_counter())
+
+    await asyncio.gather(*(produce(i) for i in range(streams)))
+    await asyncio.gather(*tasks)
+    return idle_cpu, latencies
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--streams", type=int, default=1000)
+    parser.add_argument("--idle-seconds", type=float, default=2.0)
+    args = parser.parse_args()
+
+    print(f"{args.streams} concurrent streams")
+    print(f"{'mode':<10}{'idle cpu %':>12}{'p50 ms':>10}{'p99 ms':>10}{'max ms':>10}")
+    for name, consumer in [("polling", polling_consumer), ("push", push_consumer)]:
+        idle_cpu, latencies = asyncio.run(
+            run(consumer, args.streams, args.idle_seconds)
+        )
+        latencies_ms = sorted(latency * 1000 for latency in latencies)
+        p99 = latencies_ms[int(len(latencies_ms) * 0.99) - 1]
+        print(
+            f"{name:<10}{idle_cpu * 100:>12.1f}"
+            f"{statistics.median(latencies_ms):>10.2f}{p99:>10.2f}"
+            f"{latencies_ms[-1]:>10.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Benchmark of event-loop responsiveness under FunctionHub execution modes.
+
+A ticker coroutine measures how late the event loop wakes it up while a mixed load
+of blocking I/O style calls and CPU-bound calls runs through a FunctionHub.
+
+Run with: PYTHONPATH=. python test/benchmark/bench_function_hub.py
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from oxygent.oxy.function_tools.function_hub import FunctionHub
+
+TICK_INTERVAL = 0.005
+
+
+def blocking_io(seconds: float):
+    time.sleep(seconds)
+    return seconds
+
+
+def cpu_bound(n: int):
+    return sum(i * i for i in range(n))
+
+
+async def measure_lag(stop_event: asyncio.Event) -> list:
+    lags = []
+    while not stop_event.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(TICK_INTERVAL)
+        lags.append(time.perf_counter() - start - TICK_INTERVAL)
+    return lags
+
+
+async def run_mode(mode: str, io_calls: int, cpu_calls: int) -> dict:
+    hub = FunctionHub(name=f"bench_{mode}", thread_pool_size=16, process_pool_size=4)
+    io_func = hub.tool("blocking io", execution_mode=mode)(blocking_io)
+    cpu_func = hub.tool("cpu bound", execution_mode=mode)(cpu_bound)
+
+    stop_event = asyncio.Event()
+    lag_task = asyncio.create_task(measure_lag(stop_event))
+    await asyncio.sleep(TICK_INTERVAL * 2)
+    start = time.perf_counter()
+    await asyncio.gather(
+        *[io_func(0.05) for _ in range(io_calls)],
+        *[cpu_func(300_000) for _ in range(cpu_calls)],
+    )
+    elapsed = time.perf_counter() - start
+    stop_event.set()
+    lags = await lag_task
+    await hub.cleanup()
+    lags.sort()
+    return {
+        "mode": mode,
+        "elapsed_s": elapsed,
+        "lag_p50_ms": statistics.median(lags) * 1000,
+        "lag_p99_ms": lags[int(len(lags) * 0.99) - 1] * 1000,
+        "lag_max_ms": lags[-1] * 1000,
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--io-calls", type=int, default=32)
+    parser.add_argument("--cpu-calls", type=int, default=8)
+    args = parser.parse_args()
+
+    print(f"{'mode':<8}{'elapsed_s':>12}{'lag_p50_ms':>12}{'lag_p99_ms':>12}{'lag_max_ms':>12}")
+    for mode in ("inline", "thread", "process"):
+        result = await run_mode(mode, args.io_calls, args.cpu_calls)
+        print(
+            f"{result['mode']:<8}{result['elapsed_s']:>12.3f}{result['lag_p50_ms']:>12.2f}"
+            f"{result['lag_p99_ms']:>12.2f}{result['lag_max_ms']:>12.2f}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
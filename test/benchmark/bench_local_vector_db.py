@@ -0,0 +1,101 @@
+"""
+Benchmark of the embedded vector store: IVF approximate search against brute force.
+
+Random unit vectors are clustered around a few hundred topics, as embeddings of
+real documents are. Every query is searched exactly and with the inverted-file
+index for several ``nprobe`` values; the latency per query and the recall@k of
+the approximate results are reported.
+
+Run with: PYTHONPATH=. python test/benchmark/bench_local_vector_db.py
+"""
+
+import argparse
+import tempfile
+import time
+
+import numpy as np
+
+from oxygent.databases.db_vector.local_vector_db import LocalSpace
+
+
+def make_vectors(count: int, dimension: int, topic_count: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    topics = rng.normal(size=(topic_count, dimension))
+    vectors = topics[rng.integers(topic_count, size=count)]
+    vectors += 0.5 * rng.normal(size=(count, dimension))
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors.astype(np.float32)
+
+
+def time_search(space: LocalSpace, queries, top_k: int, **kwargs) -> tuple:
+    results = []
+    start = time.perf_counter()
+    for query in queries:
+        rows, _ = space.search(query, top_k, **kwargs)
+        results.append(set(rows.tolist()))
+    return results, (time.perf_counter() - start) / len(queries)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--count", type=int, default=200000)
+    parser.add_argument("--dimension", type=int, default=256)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--top-k", type=int, default=10)
+    parser.add_argument("--ncentroids", type=int, default=512)
+    args = parser.parse_args()
+
+    vectors = make_vectors(args.count, args.dimension, topic_count=300)
+    queries = make_vectors(args.queries, args.dimension, topic_count=300, seed=1)
+    with tempfile.TemporaryDirectory() as space_dir:
+        space = LocalSpace(
+            space_dir,
+            {
+                "name": "bench",
+                "engine": {
+                    "index_size": 1,
+                    "retrieval_type": "IVFFLAT",
+                    "retrieval_param": {
+                        "metric_type": "InnerProduct",
+                        "ncentroids": args.ncentroids,
+                    },
+                },
+                "properties": {
+                    "vector": {"dimension": args.dimension, "type": "vector"}
+                },
+            },
+        )
+        space.save_config()
+        start = time.perf_counter()
+        space.upsert([(str(i), {"vector": v}) for i, v in enumerate(vectors)])
+        print(f"insert {args.count} vectors: {time.perf_counter() - start:.2f}s")
+        start = time.perf_counter()
+        space.save()
+        print(f"save: {time.perf_counter() - start:.2f}s")
+        start = time.perf_counter()
+        reopened = LocalSpace(space_dir)
+        print(f"open (memory-mapped): {(time.perf_counter() - start) * 1000:.1f}ms")
+        del reopened
+
+        start = time.perf_counter()
+        space.search(queries[0], args.top_k)
+        print(f"train IVF ({args.ncentroids} centroids): {time.perf_counter() - start:.2f}s")
+
+        exact, exact_latency = time_search(
+            space, queries, args.top_k, is_brute_search=True
+        )
+        print(f"{'mode':<16}{'latency ms':>12}{'speedup':>10}{'recall@k':>10}")
+        print(f"{'brute force':<16}{exact_latency * 1000:>12.2f}{1:>10.1f}{1:>10.3f}")
+        for nprobe in [4, 8, 16, 32, 64]:
+            approx, latency = time_search(space, queries, args.top_k, nprobe=nprobe)
+            recall = np.mean(
+                [len(a & e) / args.top_k for a, e in zip(approx, exact)]
+            )
+            print(
+                f"{f'ivf nprobe={nprobe}':<16}{latency * 1000:>12.2f}"
+                f"{exact_latency / latency:>10.1f}{recall:>10.3f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+Benchmark of page-parallel PDF extraction and OCR.
+
+A multi-page PDF is built by repeating the pages of the sample PDFs in
+dataset/valid, then read sequentially (1 worker) and with a process pool. The
+sample images are recognized sequentially and with the same process pool. OCR
+needs pdf2image with Poppler and pytesseract with Tesseract, without them only
+the text layer extraction is measured.
+
+Run with: PYTHONPATH=. python test/benchmark/bench_multimodal_tools.py
+"""
+
+import argparse
+import glob
+import os
+import shutil
+import tempfile
+import time
+
+from PyPDF2 import PdfReader, PdfWriter
+
+from oxygent.config import Config
+from oxygent.utils import document_utils
+
+
+def build_pdf(sample_paths: list, page_count: int, path: str):
+    sample_pages = [page for p in sample_paths for page in PdfReader(p).pages]
+    writer = PdfWriter()
+    for i in range(page_count):
+        writer.add_page(sample_pages[i % len(sample_pages)])
+    with open(path, "wb") as f:
+        writer.write(f)
+
+
+def warm_up(max_workers: int, path: str):
+    """Start the shared pool of *max_workers* processes as a running MAS has."""
+    Config.set_tool_document_max_workers(max_workers)
+    document_utils._reset_document_executor()
+    if max_workers > 1:
+        executor = document_utils.get_document_executor()
+        futures = [
+            executor.submit(document_utils.get_pdf_page_count, path)
+            for _ in range(max_workers * 2)
+        ]
+        for future in futures:
+            future.result()
+
+
+def time_pdf(path: str, max_workers: int, is_ocr_fallback: bool) -> tuple:
+    warm_up(max_workers, path)
+    start = time.perf_counter()
+    first_page_time = None
+    page_count = 0
+    for _ in document_utils.iter_pdf_pages(path, is_ocr_fallback=is_ocr_fallback):
+        if first_page_time is None:
+            first_page_time = time.perf_counter() - start
+        page_count += 1
+    return page_count, first_page_time, time.perf_counter() - start
+
+
+def ocr_image(path: str) -> str:
+    import pytesseract
+    from PIL import Image
+
+    with Image.open(path) as img:
+        return pytesseract.image_to_string(img, lang=document_utils.OCR_LANG)
+
+
+def time_images(paths: list, max_workers: int, pdf_path: str) -> float:
+    warm_up(max_workers, pdf_path)
+    start = time.perf_counter()
+    if max_workers <= 1:
+        for path in paths:
+            ocr_image(path)
+    else:
+        list(document_utils.get_document_executor().map(ocr_image, paths))
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pages", type=int, default=16)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--dataset", default="dataset/valid")
+    args = parser.parse_args()
+
+    sample_pdfs = sorted(glob.glob(os.path.join(args.dataset, "*.pdf")))
+    sample_images = sorted(
+        p
+        for ext in ("png", "jpg", "jpeg")
+        for p in glob.glob(os.path.join(args.dataset, f"*.{ext}"))
+    )
+    is_ocr_available = bool(shutil.which("tesseract") and shutil.which("pdftoppm"))
+    if not is_ocr_available:
+        print("Tesseract or Poppler not found, OCR is skipped.")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        pdf_path = os.path.join(tmp_dir, "bench.pdf")
+        build_pdf(sample_pdfs, args.pages, pdf_path)
+        print(f"PDF of {args.pages} pages from {len(sample_pdfs)} samples")
+        print(f"{'workers':<10}{'pages':>8}{'first_page_s':>14}{'total_s':>10}")
+        for max_workers in args.workers:
+            pages, first_page_time, total_time = time_pdf(
+                pdf_path, max_workers, is_ocr_available
+            )
+            print(f"{max_workers:<10}{pages:>8}{first_page_time:>14.3f}{total_time:>10.3f}")
+
+        if is_ocr_available and sample_images:
+            print(f"\nOCR of {len(sample_images)} sample images")
+            print(f"{'workers':<10}{'total_s':>10}")
+            for max_workers in args.workers:
+                total_time = time_images(sample_images, max_workers, pdf_path)
+                print(f"{max_workers:<10}{total_time:>10.3f}")
+    document_utils._reset_document_executor()
+
+
+if __name__ == "__main__":
+    main()
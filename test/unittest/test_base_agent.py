@@ -32,6 +32,7 @@ class TestBaseAgent:
         agent = DummyAgent(name="dummy_agent", desc="Dummy Agent for testing")
         agent.mas = AsyncMock()
         agent.mas.es_client = AsyncMock()
+        agent.mas.history_cache = None
         return agent
 
     async def test_initialization(self, dummy_agent):
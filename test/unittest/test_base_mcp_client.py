@@ -90,6 +90,20 @@ async def test_list_tools_registers_mcp_tools(client, mas_env):
     assert mas_env.add_oxy_calls == ["dummy_tool"]
 
 
+def test_add_tools_marks_cached_tools(client, mas_env):
+    read_tool = MockMCPToolInfo("read_tool")
+    read_tool.annotations = {"readOnlyHint": True}
+    write_tool = MockMCPToolInfo("write_tool")
+    write_tool.annotations = {"readOnlyHint": False, "destructiveHint": True}
+    client.cached_tool_name_list = ["dummy_tool"]
+    client.add_tools(
+        [("tools", [read_tool, write_tool, MockMCPToolInfo("dummy_tool")])]
+    )
+    assert mas_env.oxy_name_to_oxy["read_tool"].is_result_cached
+    assert not mas_env.oxy_name_to_oxy["write_tool"].is_result_cached
+    assert mas_env.oxy_name_to_oxy["dummy_tool"].is_result_cached
+
+
 @pytest.mark.asyncio
 async def test_execute_success(client, oxy_request):
     oxy_request.callee = "dummy_tool"
@@ -115,3 +129,42 @@ async def test_cleanup_resets_session(client):
     await client.cleanup()
     assert client._session is None
     assert client._stdio_context is None
+
+
+@pytest.mark.asyncio
+async def test_evicted_header_pool_finishes_in_flight_calls(mas_env):
+    import asyncio
+    from contextlib import asynccontextmanager
+
+    release = asyncio.Event()
+
+    class SlowSession:
+        async def call_tool(self, tool_name, arguments):
+            await release.wait()
+            return tool_name
+
+    class HeaderClient(BaseMCPClient):
+        @asynccontextmanager
+        async def open_session(self, headers=None):
+            yield SlowSession()
+
+    c = HeaderClient(
+        name="remote_server",
+        is_dynamic_headers=True,
+        pool_max_header_sets=1,
+        pool_health_check_interval=0,
+    )
+    c.set_mas(mas_env)
+    slow_call = asyncio.create_task(c._call_tool_by_pool("slow", {}, {"k": "a"}))
+    await asyncio.sleep(0.01)
+    evicted_pool = next(iter(c._session_pools.values()))
+    # A second header set evicts the pool of the first one
+    await c.get_session_pool({"k": "b"})
+    await asyncio.sleep(0.01)
+    assert evicted_pool in c._evicted_session_pools
+    assert evicted_pool.size == 1
+    release.set()
+    assert await slow_call == "slow"
+    await asyncio.sleep(0.01)
+    assert not c._evicted_session_pools
+    await c.cleanup()
@@ -0,0 +1,95 @@
+"""
+Unit tests for BatchRunner
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from oxygent.batch_runner import BatchRunner
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Tests
+# ──────────────────────────────────────────────────────────────────────────────
+@pytest.mark.asyncio
+async def test_concurrency_limit_and_order():
+    in_flight = max_in_flight = 0
+
+    async def handler(task):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01 * (5 - task["task_id"] % 5))
+        in_flight -= 1
+        return {"answer": task["task_id"] * 2}
+
+    runner = BatchRunner(handler, concurrency=3)
+    results = await runner.run([{"task_id": i} for i in range(10)])
+    assert [result["answer"] for result in results] == [i * 2 for i in range(10)]
+    assert [result["task_id"] for result in results] == list(range(10))
+    assert max_in_flight == 3
+
+    summary = runner.stats.summary()
+    assert summary["succeeded"] == 10
+    assert summary["failed"] == 0
+    assert summary["throughput"] > 0
+    assert 0 < summary["latency_p50"] <= summary["latency_p99"]
+
+
+@pytest.mark.asyncio
+async def test_checkpoint_resume_skips_completed_tasks(tmp_path):
+    checkpoint_path = str(tmp_path / "checkpoint.jsonl")
+    calls = []
+
+    async def flaky_handler(task):
+        calls.append(task["task_id"])
+        if task["task_id"] == "b":
+            raise RuntimeError("boom")
+        return {"answer": task["task_id"].upper()}
+
+    tasks = [{"task_id": task_id} for task_id in "abc"]
+    runner = BatchRunner(flaky_handler, checkpoint_path=checkpoint_path)
+    results = await runner.run(tasks)
+    assert results[1] == {"error": "boom", "task_id": "b"}
+    assert runner.stats.failed == 1
+
+    # Every result was appended as it completed; simulate a crash mid-write
+    with open(checkpoint_path, encoding="utf-8") as f:
+        assert len(f.readlines()) == 3
+    with open(checkpoint_path, "a", encoding="utf-8") as f:
+        f.write('{"task_id": "c", "answer": "中')
+
+    async def handler(task):
+        calls.append(task["task_id"])
+        return {"answer": task["task_id"].upper()}
+
+    calls.clear()
+    runner = BatchRunner(handler, checkpoint_path=checkpoint_path, is_resume=True)
+    results = await runner.run(tasks)
+    # Only the failed task runs again
+    assert calls == ["b"]
+    assert [result["answer"] for result in results] == ["A", "B", "C"]
+    assert runner.stats.skipped == 2
+
+    with open(checkpoint_path, encoding="utf-8") as f:
+        last = json.loads(f.readlines()[-1])
+    assert last == {"answer": "B", "task_id": "b"}
+
+
+@pytest.mark.asyncio
+async def test_checkpoint_is_started_over_without_resume(tmp_path):
+    checkpoint_path = str(tmp_path / "checkpoint.jsonl")
+    with open(checkpoint_path, "w", encoding="utf-8") as f:
+        f.write(json.dumps({"task_id": "a", "answer": "stale"}) + "\n")
+
+    async def handler(task):
+        return {"answer": "fresh"}
+
+    runner = BatchRunner(handler, checkpoint_path=checkpoint_path)
+    results = await runner.run([{"task_id": "a"}])
+    assert results == [{"answer": "fresh", "task_id": "a"}]
+    assert runner.stats.skipped == 0
+    with open(checkpoint_path, encoding="utf-8") as f:
+        assert [json.loads(line) for line in f] == results
@@ -0,0 +1,138 @@
+"""
+Unit tests for blob_utils.py
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from mcp.types import ListToolsResult, Tool
+
+import oxygent.utils.blob_utils as bu
+from oxygent.config import Config
+from oxygent.databases.db_es.local_es import LocalEs
+from oxygent.oxy.base_oxy import Oxy
+from oxygent.oxy.mcp_tools.stdio_mcp_client import StdioMCPClient
+from oxygent.schemas import OxyRequest, OxyResponse, OxyState
+from oxygent.utils.common_utils import get_md5
+
+LONG_TEXT = "x" * 600
+
+
+class DummyOxy(Oxy):
+    prompt: str = LONG_TEXT
+
+    async def _execute(self, oxy_request: OxyRequest) -> OxyResponse:
+        return OxyResponse(state=OxyState.COMPLETED, output="ok")
+
+
+@pytest.fixture(autouse=True)
+def clear_saved_blobs():
+    bu._saved_blob_doc_ids.clear()
+    yield
+    bu._saved_blob_doc_ids.clear()
+
+
+def test_split_and_join_round_trip():
+    obj = {"prompt": LONG_TEXT, "short": "abc", "items": [LONG_TEXT, 1]}
+    new_obj, blobs = bu.split_blobs(obj, min_length=512)
+    ref = bu.BLOB_REF_PREFIX + get_md5(LONG_TEXT)
+    assert new_obj == {"prompt": ref, "short": "abc", "items": [ref, 1]}
+    assert blobs == {get_md5(LONG_TEXT): LONG_TEXT}
+    assert bu.find_blob_ids(new_obj) == {get_md5(LONG_TEXT)}
+    assert bu.join_blobs(new_obj, blobs) == obj
+
+
+def test_join_keeps_unknown_refs():
+    ref = bu.BLOB_REF_PREFIX + "missing"
+    assert bu.join_blobs({"a": ref}, {}) == {"a": ref}
+
+
+@pytest.mark.asyncio
+async def test_save_blobs_writes_once():
+    es_client = AsyncMock()
+    blobs = {"id1": "content"}
+    await bu.save_blobs(es_client, blobs)
+    await bu.save_blobs(es_client, blobs)
+    es_client.index.assert_awaited_once()
+    args, kwargs = es_client.index.call_args
+    assert args[0] == Config.get_app_name() + "_blob"
+    assert kwargs["doc_id"] == f"{Config.get_app_version()}_id1"
+    assert kwargs["body"]["content"] == "content"
+
+
+@pytest.mark.asyncio
+async def test_saved_blob_ids_are_bounded(monkeypatch):
+    monkeypatch.setattr(bu, "_MAX_SAVED_BLOB_DOC_IDS", 2)
+    es_client = AsyncMock()
+    await bu.save_blobs(es_client, {"id1": "a", "id2": "b", "id3": "c"})
+    assert len(bu._saved_blob_doc_ids) == 2
+    # The evicted blob is written again, which is harmless
+    await bu.save_blobs(es_client, {"id1": "a"})
+    assert es_client.index.await_count == 4
+
+
+@pytest.mark.asyncio
+async def test_load_blobs_resolves_refs():
+    es_client = AsyncMock()
+    es_client.search.return_value = {
+        "hits": {"hits": [{"_source": {"blob_id": "id1", "content": "content"}}]}
+    }
+    obj = {"a": bu.BLOB_REF_PREFIX + "id1", "b": "plain"}
+    assert await bu.load_blobs(es_client, obj) == {"a": "content", "b": "plain"}
+
+
+@pytest.mark.asyncio
+async def test_load_blobs_across_app_versions(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        "oxygent.databases.db_es.local_es.Config.get_cache_save_dir",
+        lambda: str(tmp_path),
+    )
+    es_client = LocalEs()
+    old_version = Config.get_app_version()
+    try:
+        Config.set_app_version("1.0.0")
+        await bu.save_blobs(es_client, {"id_a": "content a"})
+        Config.set_app_version("1.0.1")
+        await bu.save_blobs(es_client, {"id_a": "content a", "id_b": "content b"})
+        obj = {"a": bu.BLOB_REF_PREFIX + "id_a", "b": bu.BLOB_REF_PREFIX + "id_b"}
+        assert await bu.load_blobs(es_client, obj) == {
+            "a": "content a",
+            "b": "content b",
+        }
+        # Records written by an older version still resolve their own blobs
+        Config.set_app_version("1.0.2")
+        assert await bu.load_blobs(es_client, obj) == {
+            "a": "content a",
+            "b": "content b",
+        }
+    finally:
+        Config.set_app_version(old_version)
+
+
+@pytest.mark.asyncio
+async def test_load_blobs_skips_search_without_refs():
+    es_client = AsyncMock()
+    assert await bu.load_blobs(es_client, {"a": "plain"}) == {"a": "plain"}
+    es_client.search.assert_not_called()
+
+
+def test_class_attr_snapshot_is_cached_and_invalidated():
+    oxy = DummyOxy(name="dummy")
+    class_attr, blobs = oxy._get_class_attr()
+    assert class_attr["prompt"] == bu.BLOB_REF_PREFIX + get_md5(LONG_TEXT)
+    assert oxy._get_class_attr() is oxy._get_class_attr()
+    oxy.prompt = "short prompt"
+    class_attr, blobs = oxy._get_class_attr()
+    assert class_attr["prompt"] == "short prompt"
+    assert blobs == {}
+
+
+
+def test_class_attr_snapshot_is_invalidated_by_in_place_mutators():
+    client = StdioMCPClient(name="stdio_client", params={"command": "python"})
+    client.set_mas(MagicMock(oxy_name_to_oxy={}))
+    assert client._get_class_attr()[0]["included_tool_name_list"] == []
+    client.add_tools(
+        ListToolsResult(tools=[Tool(name="tool_a", description="d", inputSchema={})])
+    )
+    assert client._get_class_attr()[0]["included_tool_name_list"] == ["tool_a"]
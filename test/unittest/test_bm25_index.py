@@ -0,0 +1,42 @@
+"""
+Unit tests for bm25_index.py
+"""
+
+from oxygent.databases.db_vector.bm25_index import (
+    BM25Index,
+    reciprocal_rank_fusion,
+    tokenize,
+)
+
+
+def test_tokenize():
+    assert tokenize("get_weather getCityName") == ["get", "weather", "get", "city", "name"]
+    assert tokenize("查询天气") == ["查", "询", "天", "气", "查询", "询天", "天气"]
+
+
+def test_search_and_coverage():
+    index = BM25Index()
+    index.add("get_weather", "get_weather Query the weather forecast of a city")
+    index.add("book_ticket", "book_ticket Book a train ticket between two cities")
+    index.add("get_time", "get_time Get the current time")
+
+    results = index.search("weather forecast")
+    assert results[0][0] == "get_weather"
+    assert [doc_id for doc_id, _ in results] == ["get_weather"]
+    assert index.get_coverage("weather forecast", "get_weather") == 1.0
+    assert index.get_coverage("weather in paris", "get_weather") < 0.5
+
+    # Re-adding a document replaces it
+    index.add("get_time", "get_time Current weather time")
+    assert "get_time" in dict(index.search("weather"))
+    index.remove("get_time")
+    assert len(index) == 2
+    assert "get_time" not in dict(index.search("time"))
+
+
+def test_reciprocal_rank_fusion():
+    fused = reciprocal_rank_fusion([["a", "b", "c"], ["c", "b", "d"]])
+    assert set(fused[:2]) == {"b", "c"}
+    assert set(fused) == {"a", "b", "c", "d"}
+    assert reciprocal_rank_fusion([["a"], ["b"]], weights=[1.0, 2.0]) == ["b", "a"]
+    assert reciprocal_rank_fusion([["a", "b", "c"]], top_k=2) == ["a", "b"]
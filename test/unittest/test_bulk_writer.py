@@ -0,0 +1,112 @@
+"""
+Unit tests for BulkWriter
+"""
+
+import asyncio
+
+import pytest
+
+from oxygent.databases.db_es.bulk_writer import BulkWriter
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Fixtures
+# ──────────────────────────────────────────────────────────────────────────────
+class FakeEs:
+    def __init__(self):
+        self.bulks = []
+        self.indexed = []
+
+    async def bulk_index(self, index_name, docs):
+        self.bulks.append((index_name, list(docs)))
+        return len(docs)
+
+    async def index(self, index_name, doc_id, body):
+        self.indexed.append((index_name, doc_id, body))
+
+
+@pytest.fixture
+def es():
+    return FakeEs()
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Tests
+# ──────────────────────────────────────────────────────────────────────────────
+@pytest.mark.asyncio
+async def test_flush_by_size_and_interval(es):
+    writer = BulkWriter(es, flush_size=3, flush_interval_ms=100)
+    for i in range(3):
+        await writer.add("idx", f"d{i}", {"i": i})
+    assert es.bulks == []
+
+    # The size trigger writes the first batch at once, the interval the next one
+    await asyncio.sleep(0.02)
+    assert [len(docs) for _, docs in es.bulks] == [3]
+    await writer.add("idx", "d3", {"i": 3})
+    await asyncio.sleep(0.02)
+    assert [len(docs) for _, docs in es.bulks] == [3]
+    await asyncio.sleep(0.2)
+    assert [len(docs) for _, docs in es.bulks] == [3, 1]
+    assert writer.written_count == 4
+    await writer.close()
+
+
+@pytest.mark.asyncio
+async def test_batches_are_grouped_by_index(es):
+    writer = BulkWriter(es, flush_size=10)
+    await writer.add("a", "1", {})
+    await writer.add("b", "2", {})
+    await writer.add("a", "3", {})
+    await writer.close()
+    assert es.bulks == [("a", [("1", {}), ("3", {})]), ("b", [("2", {})])]
+    assert writer.pending_count == 0
+
+    # After close, documents are written through
+    await writer.add("a", "4", {})
+    assert es.indexed == [("a", "4", {})]
+
+
+@pytest.mark.asyncio
+async def test_drop_policies(es):
+    writer = BulkWriter(es, flush_size=2, max_pending=2, overflow_policy="drop_newest")
+    assert await writer.add("idx", "1", {})
+    assert await writer.add("idx", "2", {})
+    assert not await writer.add("idx", "3", {})
+    await writer.close()
+    assert [doc_id for doc_id, _ in es.bulks[0][1]] == ["1", "2"]
+    assert writer.dropped_count == 1
+
+    es = FakeEs()
+    writer = BulkWriter(es, flush_size=2, max_pending=2, overflow_policy="drop_oldest")
+    for doc_id in "123":
+        await writer.add("idx", doc_id, {})
+    await writer.close()
+    assert [doc_id for doc_id, _ in es.bulks[0][1]] == ["2", "3"]
+
+    with pytest.raises(ValueError):
+        BulkWriter(es, overflow_policy="unknown")
+
+
+@pytest.mark.asyncio
+async def test_block_policy_applies_backpressure(es):
+    writer = BulkWriter(es, flush_size=2, max_pending=2, flush_interval_ms=1000)
+    for doc_id in "1234":
+        await writer.add("idx", doc_id, {})
+    # The third document waited for the first batch instead of being dropped
+    assert [doc_id for doc_id, _ in es.bulks[0][1]] == ["1", "2"]
+    await writer.close()
+    assert writer.written_count == 4
+    assert writer.dropped_count == 0
+
+
+@pytest.mark.asyncio
+async def test_failed_bulk_is_counted(es):
+    async def failing_bulk_index(index_name, docs):
+        return None
+
+    es.bulk_index = failing_bulk_index
+    writer = BulkWriter(es)
+    await writer.add("idx", "1", {})
+    await writer.close()
+    assert writer.failed_count == 1
@@ -0,0 +1,114 @@
+"""
+Unit tests for the content-hash cache of derived file content
+"""
+
+import os
+import time
+from io import BytesIO
+
+import pytest
+from PIL import Image
+
+from oxygent.config import Config
+from oxygent.utils import common_utils, content_cache
+from oxygent.utils.content_cache import ContentCache
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(Config, "get_cache_save_dir", lambda: str(tmp_path))
+    return tmp_path
+
+
+def test_file_cache_key_follows_content(tmp_path):
+    path_a = tmp_path / "a.txt"
+    path_b = tmp_path / "b.txt"
+    path_a.write_bytes(b"same content")
+    path_b.write_bytes(b"same content")
+
+    key = content_cache.get_file_cache_key(str(path_a), "extractor", "1")
+    assert content_cache.get_file_cache_key(str(path_b), "extractor", "1") == key
+    assert content_cache.get_file_cache_key(str(path_a), "extractor", "2") != key
+    assert content_cache.get_file_cache_key(str(path_a), "extractor", "1", lang="eng") != key
+
+    # A changed file is hashed again
+    time.sleep(0.01)
+    path_a.write_bytes(b"new content")
+    assert content_cache.get_file_cache_key(str(path_a), "extractor", "1") != key
+
+
+def test_set_get_and_persist(tmp_path):
+    cache = ContentCache(str(tmp_path), max_size=1024 * 1024)
+    assert cache.get("key") is None
+    cache.set("key", {"text": "hello", "pages": [1, 2]})
+    assert cache.get("key") == {"text": "hello", "pages": [1, 2]}
+
+    # Another process sees the entries on disk
+    fresh_cache = ContentCache(str(tmp_path), max_size=1024 * 1024)
+    assert fresh_cache.get("key") == {"text": "hello", "pages": [1, 2]}
+    assert fresh_cache.get_stats()["entry_count"] == 1
+
+
+def test_lru_eviction(tmp_path):
+    cache = ContentCache(str(tmp_path), max_size=250)
+    for key in ["a", "b", "c"]:
+        cache.set(key, "x" * 50)
+    # Reading "a" makes "b" the least recently used entry
+    assert cache.get("a") is not None
+    cache.set("d", "x" * 50)
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get_stats()["total_size"] <= 250
+    assert not os.path.exists(tmp_path / "b.json")
+
+    # Values larger than the whole cache are not stored
+    cache.set("big", "x" * 500)
+    assert cache.get("big") is None
+
+
+def test_corrupted_entry_is_a_miss(tmp_path):
+    cache = ContentCache(str(tmp_path), max_size=1024)
+    (tmp_path / "key.json").write_text("{not json")
+    assert cache.get("key", "default") == "default"
+    assert not os.path.exists(tmp_path / "key.json")
+
+
+def test_get_or_set_computes_once(tmp_path):
+    cache = ContentCache(str(tmp_path), max_size=1024)
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return "value"
+
+    assert cache.get_or_set("key", compute) == "value"
+    assert cache.get_or_set("key", compute) == "value"
+    assert len(calls) == 1
+    assert cache.get_stats()["hit_count"] == 1
+
+
+def test_disabled_cache(cache_dir, monkeypatch):
+    monkeypatch.setattr(Config, "get_content_cache_is_enabled", lambda: False)
+    assert content_cache.get_content_cache() is None
+
+
+@pytest.mark.asyncio
+async def test_image_to_base64_is_cached(cache_dir, tmp_path, monkeypatch):
+    path = tmp_path / "image.png"
+    Image.new("RGB", (40, 40), "red").save(path)
+    first = await common_utils.image_to_base64(str(path), 400)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("cached image should not be decoded")
+
+    monkeypatch.setattr(common_utils.Image, "open", fail)
+    assert await common_utils.image_to_base64(str(path), 400) == first
+
+    # Other size limits are cached separately
+    monkeypatch.undo()
+    monkeypatch.setattr(Config, "get_cache_save_dir", lambda: str(cache_dir))
+    second = await common_utils.image_to_base64(str(path), 100)
+    assert second != first
+    with Image.open(BytesIO(common_utils.base64.b64decode(second.split(",")[1]))) as img:
+        assert img.size == (10, 10)
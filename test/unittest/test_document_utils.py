@@ -0,0 +1,142 @@
+"""
+Unit tests for document_utils.py
+"""
+
+import importlib
+import shutil
+
+import pytest
+from PyPDF2 import PageObject, PdfWriter
+from PyPDF2.generic import DecodedStreamObject, DictionaryObject, NameObject
+
+from oxygent.config import Config
+from oxygent.utils import document_utils
+
+
+def write_pdf(path, page_texts):
+    """Write a PDF whose pages have the given text layers, None for scanned pages."""
+    writer = PdfWriter()
+    font = writer._add_object(
+        DictionaryObject(
+            {
+                NameObject("/Type"): NameObject("/Font"),
+                NameObject("/Subtype"): NameObject("/Type1"),
+                NameObject("/BaseFont"): NameObject("/Helvetica"),
+            }
+        )
+    )
+    for text in page_texts:
+        page = PageObject.create_blank_page(None, 200, 200)
+        if text is None:
+            writer.add_page(page)
+            continue
+        stream = DecodedStreamObject()
+        stream.set_data(f"BT /F1 12 Tf 20 100 Td ({text}) Tj ET".encode())
+        page[NameObject("/Contents")] = writer._add_object(stream)
+        page[NameObject("/Resources")] = DictionaryObject(
+            {NameObject("/Font"): DictionaryObject({NameObject("/F1"): font})}
+        )
+        writer.add_page(page)
+    with open(path, "wb") as f:
+        writer.write(f)
+    return str(path)
+
+
+def test_text_pages_in_order(tmp_path):
+    texts = [f"page{i}" if i % 3 else None for i in range(7)]
+    path = write_pdf(tmp_path / "doc.pdf", texts)
+    pages = list(document_utils.iter_pdf_pages(path, is_ocr_fallback=False))
+    assert [page[0] for page in pages] == list(range(7))
+    assert [page[1].strip() or None for page in pages] == texts
+    assert pages[0][2] == "empty" and pages[1][2] == "text"
+
+
+@pytest.mark.skipif(
+    not (shutil.which("tesseract") and shutil.which("pdftoppm")),
+    reason="Tesseract or Poppler not installed",
+)
+def test_parallel_ocr_in_page_order(tmp_path):
+    path = write_pdf(tmp_path / "doc.pdf", [None, "text", None, None])
+    pages = list(document_utils.iter_pdf_pages(path, max_workers=2, pages_per_task=1))
+    assert [page[0] for page in pages] == [0, 1, 2, 3]
+    assert [page[2] for page in pages] == ["ocr", "text", "ocr", "ocr"]
+
+
+def test_sequential_ocr_fallback(tmp_path, monkeypatch):
+    path = write_pdf(tmp_path / "doc.pdf", ["hello", None])
+    monkeypatch.setattr(
+        document_utils,
+        "ocr_pdf_pages",
+        lambda path, page_indexes, lang: [f"ocr{i}" for i in page_indexes],
+    )
+    pages = list(document_utils.iter_pdf_pages(path, max_workers=1))
+    assert pages == [(0, "hello", "text"), (1, "ocr1", "ocr")]
+
+
+def test_missing_file():
+    with pytest.raises(FileNotFoundError):
+        list(document_utils.iter_pdf_pages("missing.pdf"))
+
+
+@pytest.mark.asyncio
+async def test_read_pdf_file_is_cached(tmp_path, monkeypatch):
+    monkeypatch.setattr(Config, "get_cache_save_dir", lambda: str(tmp_path))
+    multimodal_tools = importlib.import_module("oxygent.preset_tools.multimodal_tools")
+    path = write_pdf(tmp_path / "doc.pdf", ["hello", "world"])
+    text = await multimodal_tools.read_pdf_file(path)
+    assert "hello" in text and "world" in text
+
+    def fail(*args, **kwargs):
+        raise AssertionError("cached PDF should not be parsed")
+
+    monkeypatch.setattr(multimodal_tools, "iter_pdf_pages", fail)
+    # The same content under another name hits the cache
+    shutil.copy(path, tmp_path / "copy.pdf")
+    assert await multimodal_tools.read_pdf_file(str(tmp_path / "copy.pdf")) == text
+
+
+@pytest.mark.asyncio
+async def test_ocr_failure_keeps_text_pages(tmp_path, monkeypatch):
+    monkeypatch.setattr(Config, "get_cache_save_dir", lambda: str(tmp_path))
+    multimodal_tools = importlib.import_module("oxygent.preset_tools.multimodal_tools")
+    path = write_pdf(tmp_path / "doc.pdf", ["hello", None, "world"])
+
+    def fail(path, page_indexes, lang):
+        raise RuntimeError("Unable to get page count. Is poppler installed?")
+
+    monkeypatch.setattr(document_utils, "ocr_pdf_pages", fail)
+    ocr_errors = []
+    pages = list(
+        document_utils.iter_pdf_pages(path, max_workers=1, ocr_errors=ocr_errors)
+    )
+    assert [page[2] for page in pages] == ["text", "ocr_error", "text"]
+    assert len(ocr_errors) == 1
+
+    monkeypatch.setattr(Config, "get_tool_document_max_workers", lambda: 1)
+    text = await multimodal_tools.read_pdf_file(path)
+    assert "hello" in text and "world" in text
+
+    path = write_pdf(tmp_path / "scanned.pdf", [None])
+    assert "Poppler" in await multimodal_tools.read_pdf_file(path)
+
+
+def test_ocr_renders_only_requested_pages(monkeypatch):
+    import sys
+    import types
+
+    rendered = []
+
+    def convert_from_path(path, first_page, last_page):
+        rendered.append((first_page, last_page))
+        return [f"image{i - 1}" for i in range(first_page, last_page + 1)]
+
+    pdf2image = types.SimpleNamespace(convert_from_path=convert_from_path)
+    monkeypatch.setitem(sys.modules, "pdf2image", pdf2image)
+    monkeypatch.setitem(
+        sys.modules,
+        "pytesseract",
+        types.SimpleNamespace(image_to_string=lambda image, lang: image),
+    )
+    texts = document_utils.ocr_pdf_pages("doc.pdf", [3, 40, 4])
+    assert texts == ["image3", "image40", "image4"]
+    assert rendered == [(4, 5), (41, 41)]
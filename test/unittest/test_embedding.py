@@ -2,8 +2,10 @@
 Unit tests for EmbeddingCache & get_embedding
 """
 
+import asyncio
 import base64
 import json
+import pickle
 from unittest.mock import AsyncMock, patch
 
 import numpy as np
@@ -97,7 +99,9 @@ async def test_get_embedding_success(monkeypatch):
     )
 
     with patch("oxygent.embedding_cache.httpx.AsyncClient") as client_cls:
-        client = client_cls.return_value.__aenter__.return_value
+        # The pooled client is used directly, not as a context manager
+        client = client_cls.return_value
+        client.is_closed = False
         client.post = AsyncMock(return_value=FakeResponse())
 
         result = await ec.get_embedding(["hello"])
@@ -110,3 +114,130 @@ async def test_get_embedding_invalid_input():
     """Passing non-list raises error (prints message and returns None)"""
     result = await ec.get_embedding("not_a_list")
     assert result is None
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Tests for EmbeddingBatcher
+# ──────────────────────────────────────────────────────────────────────────────
+def test_decode_embeddings():
+    items = [
+        base64.b64encode(json.dumps([[float(i), 1.0]]).encode()).decode()
+        for i in range(3)
+    ]
+    assert ec.decode_embeddings(items).tolist() == [[0, 1], [1, 1], [2, 1]]
+
+
+@pytest.mark.asyncio
+async def test_batcher_coalesces_concurrent_callers(monkeypatch):
+    batches = []
+
+    async def fake_embed(texts):
+        batches.append(list(texts))
+        return np.array([[float(len(t)), 0.0] for t in texts])
+
+    monkeypatch.setattr(ec, "get_embedding", fake_embed)
+    batcher = ec.EmbeddingBatcher(batch_window_ms=20, max_batch_size=3)
+
+    results = await asyncio.gather(
+        batcher.embed(["a"]), batcher.embed(["bb", "a"]), batcher.embed(["ccc"])
+    )
+    # One request for the three distinct texts of the three callers
+    assert batches == [["a", "bb", "ccc"]]
+    assert results[1].tolist() == [[2.0, 0.0], [1.0, 0.0]]
+
+    # Batches are capped at max_batch_size
+    await batcher.embed([str(i) for i in range(7)])
+    assert [len(batch) for batch in batches[1:]] == [3, 3, 1]
+    assert batcher.request_count == 4
+
+
+@pytest.mark.asyncio
+async def test_batcher_propagates_failures(monkeypatch):
+    async def failing_embed(texts):
+        return None
+
+    monkeypatch.setattr(ec, "get_embedding", failing_embed)
+    batcher = ec.EmbeddingBatcher(batch_window_ms=1)
+    with pytest.raises(ValueError):
+        await batcher.embed(["a"])
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Tests for EmbeddingStore
+# ──────────────────────────────────────────────────────────────────────────────
+def test_store_appends_only_new_entries(tmp_path):
+    store = ec.EmbeddingStore(str(tmp_path))
+    store["00" * 16] = np.array([1.0, 2.0])
+    store.flush()
+    vector_size = (tmp_path / "embedding_vectors.bin").stat().st_size
+    store["ff" * 16] = np.array([3.0, 4.0, 5.0])
+    store.flush()
+    assert (tmp_path / "embedding_vectors.bin").stat().st_size == vector_size + 12
+
+    reopened = ec.EmbeddingStore(str(tmp_path))
+    assert len(reopened) == 2
+    assert reopened["00" * 16].tolist() == [1.0, 2.0]
+    assert reopened["ff" * 16].tolist() == [3.0, 4.0, 5.0]
+
+    # Entries appended by another instance are found on a miss
+    store["ab" * 16] = np.array([6.0])
+    store.flush()
+    assert "ab" * 16 in reopened
+
+
+def test_store_ignores_torn_tail(tmp_path):
+    store = ec.EmbeddingStore(str(tmp_path))
+    store["01" * 16] = np.array([1.0, 2.0])
+    store["02" * 16] = np.array([3.0, 4.0])
+    store.flush()
+    # Simulate a crash in the middle of the last vector
+    with open(tmp_path / "embedding_vectors.bin", "r+b") as f:
+        f.truncate(12)
+    with open(tmp_path / "embedding_index.bin", "ab") as f:
+        f.write(b"\x00" * 5)
+
+    reopened = ec.EmbeddingStore(str(tmp_path))
+    assert list(reopened) == ["01" * 16]
+    assert reopened["01" * 16].tolist() == [1.0, 2.0]
+
+
+def test_store_flush_after_torn_tail(tmp_path):
+    store = ec.EmbeddingStore(str(tmp_path))
+    store["01" * 16] = np.array([1.0, 2.0])
+    store["02" * 16] = np.array([3.0, 4.0])
+    store.flush()
+    # A torn vector, then a partial index record
+    with open(tmp_path / "embedding_vectors.bin", "r+b") as f:
+        f.truncate(12)
+    with open(tmp_path / "embedding_index.bin", "ab") as f:
+        f.write(b"\x00" * 16)
+
+    reopened = ec.EmbeddingStore(str(tmp_path))
+    reopened["03" * 16] = np.array([5.0])
+    reopened.flush()
+    # The torn records were cut off, so the new one is aligned and valid
+    index_size = (tmp_path / "embedding_index.bin").stat().st_size
+    assert index_size == 2 * ec.INDEX_DTYPE.itemsize
+    reopened = ec.EmbeddingStore(str(tmp_path))
+    assert sorted(reopened) == ["01" * 16, "03" * 16]
+    assert reopened["03" * 16].tolist() == [5.0]
+
+
+def test_store_compact(tmp_path):
+    store = ec.EmbeddingStore(str(tmp_path))
+    for value in range(3):
+        store["01" * 16] = np.array([float(value)])
+        store.flush()
+    store.compact()
+    assert (tmp_path / "embedding_vectors.bin").stat().st_size == 4
+    assert ec.EmbeddingStore(str(tmp_path))["01" * 16].tolist() == [2.0]
+
+
+def test_import_legacy_pickle(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        "oxygent.embedding_cache.Config.get_cache_save_dir", lambda: str(tmp_path)
+    )
+    md5 = ec.EmbeddingCache.get_md5("legacy")
+    with open(tmp_path / "cache.pkl", "wb") as f:
+        pickle.dump({md5: np.array([1.0, 0.0])}, f)
+    assert ec.EmbeddingCache().is_in("legacy")
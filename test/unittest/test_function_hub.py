@@ -3,6 +3,9 @@ Unit tests for FunctionHub
 """
 
 import asyncio
+import os
+import threading
+import time
 
 import pytest
 
@@ -11,6 +14,10 @@ from oxygent.oxy.function_tools.function_tool import FunctionTool
 from oxygent.schemas import OxyResponse, OxyState
 
 
+def get_pid(x: int):
+    return os.getpid(), x
+
+
 # ────────────────────────────────────────────────────────────────────────────
 # Dummy MAS
 # ────────────────────────────────────────────────────────────────────────────
@@ -92,3 +99,59 @@ def test_sync_function_wrapped_async(func_hub):
 
     result = asyncio.run(async_inc(41))
     assert result == 42
+
+
+@pytest.mark.asyncio
+async def test_execution_modes(func_hub):
+    @func_hub.tool("inline", execution_mode="inline")
+    def inline_func():
+        return threading.current_thread()
+
+    @func_hub.tool("thread")
+    def thread_func():
+        return threading.current_thread()
+
+    process_func = func_hub.tool("process", execution_mode="process")(get_pid)
+
+    assert await inline_func() is threading.current_thread()
+    assert await thread_func() is not threading.current_thread()
+    pid, x = await process_func(3)
+    assert pid != os.getpid() and x == 3
+    await func_hub.cleanup()
+
+
+def test_invalid_execution_modes(func_hub):
+    async def async_func():
+        return 1
+
+    def local_func():
+        return 1
+
+    with pytest.raises(ValueError):
+        func_hub.tool("async", execution_mode="thread")(async_func)
+    with pytest.raises(ValueError):
+        func_hub.tool("local", execution_mode="process")(local_func)
+    with pytest.raises(ValueError):
+        func_hub.tool("unknown", execution_mode="fiber")(local_func)
+
+
+@pytest.mark.asyncio
+async def test_blocking_function_does_not_block_loop(func_hub):
+    @func_hub.tool("block")
+    def block():
+        time.sleep(0.2)
+        return "done"
+
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.01)
+            ticks += 1
+
+    ticker_task = asyncio.create_task(ticker())
+    assert await block() == "done"
+    ticker_task.cancel()
+    assert ticks >= 5
+    await func_hub.cleanup()
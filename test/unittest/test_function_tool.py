@@ -22,6 +22,15 @@ async def explode():
     raise ValueError("boom")
 
 
+async def scale(
+    x: float,
+    oxy_request: OxyRequest,
+    factor: int = Field(2, description="factor"),
+    tags: list = Field(default_factory=list),
+):
+    return x * factor, oxy_request.current_trace_id, tags
+
+
 # ──────────────────────────────────────────────────────────────────────────────
 # ❷ Fixtures
 # ──────────────────────────────────────────────────────────────────────────────
@@ -71,3 +80,34 @@ async def test_execute_failure(error_tool):
     resp = await error_tool._execute(req)
     assert resp.state is OxyState.FAILED
     assert "boom" in resp.output
+
+
+@pytest.mark.asyncio
+async def test_binder_coerces_and_injects_request():
+    tool = FunctionTool(name="scale_tool", desc="scale", func_process=scale)
+    assert tool.needs_oxy_request
+    assert tool.input_schema["required"] == ["x"]
+    assert "oxy_request" not in tool.input_schema["properties"]
+
+    req = OxyRequest(
+        arguments={"x": "1.5"},
+        caller="tester",
+        caller_category="agent",
+        current_trace_id="trace123",
+    )
+    resp = await tool._execute(req)
+    assert resp.state is OxyState.COMPLETED
+    assert resp.output == (3.0, "trace123", [])
+
+
+@pytest.mark.asyncio
+async def test_binder_rejects_invalid_argument(add_tool):
+    req = OxyRequest(
+        arguments={"a": "two", "b": 3},
+        caller="tester",
+        caller_category="agent",
+        current_trace_id="id3",
+    )
+    resp = await add_tool._execute(req)
+    assert resp.state is OxyState.FAILED
+    assert "argument 'a'" in resp.output
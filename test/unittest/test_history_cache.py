@@ -0,0 +1,88 @@
+"""
+Unit tests for history_cache.py
+"""
+
+import time
+
+from oxygent.history_cache import HistoryCache
+
+
+def make_record(history_id, trace_id, create_time):
+    return {
+        "history_id": history_id,
+        "trace_id": trace_id,
+        "memory": {"query": f"q{history_id}", "answer": f"a{history_id}"},
+        "create_time": create_time,
+    }
+
+
+def test_miss_without_coverage():
+    cache = HistoryCache()
+    cache.put("s", make_record("1", "t_old", "2025-01-01 00:00:01"))
+    # t_old started before this process, so older records may be missing
+    assert cache.get("s", ["t_old"], 10) is None
+    assert cache.misses == 1
+
+
+def test_local_trace_is_covered():
+    cache = HistoryCache()
+    cache.get("s", [], 10)
+    cache.fill("s", ["t1"], 10, [])
+    cache.start_trace("t2")
+    cache.put("s", make_record("1", "t2", "2025-01-01 00:00:01"))
+    records = cache.get("s", ["t1", "t2"], 10)
+    assert [r["history_id"] for r in records] == ["1"]
+    assert cache.hits == 1
+
+
+def test_fill_merges_and_dedupes():
+    cache = HistoryCache()
+    cache.put("s", make_record("2", "t1", "2025-01-01 00:00:02"))
+    cache.fill(
+        "s",
+        ["t1"],
+        10,
+        [
+            make_record("1", "t1", "2025-01-01 00:00:01"),
+            make_record("2", "t1", "2025-01-01 00:00:02"),
+        ],
+    )
+    records = cache.get("s", ["t1"], 10)
+    assert [r["history_id"] for r in records] == ["1", "2"]
+    assert cache.get("s", ["t1"], 1)[0]["history_id"] == "2"
+
+
+def test_truncated_fill_limits_reads():
+    cache = HistoryCache()
+    cache.fill(
+        "s",
+        ["t1", "t2"],
+        2,
+        [
+            make_record("1", "t1", "2025-01-01 00:00:01"),
+            make_record("2", "t2", "2025-01-01 00:00:02"),
+        ],
+    )
+    assert cache.get("s", ["t1", "t2"], 2) is not None
+    # Larger windows and subsets of a truncated query are not answerable
+    assert cache.get("s", ["t1", "t2"], 3) is None
+    assert cache.get("s", ["t1"], 2) is None
+
+
+def test_lru_and_size_eviction():
+    cache = HistoryCache(max_sessions=2, max_records_per_session=1)
+    cache.fill("a", ["t"], 10, [])
+    cache.fill("b", ["t"], 10, [])
+    cache.fill("c", ["t"], 10, [])
+    assert cache.get("a", ["t"], 10) is None
+    assert cache.get("c", ["t"], 10) == []
+    cache.put("c", make_record("1", "t", "2025-01-01 00:00:01"))
+    cache.put("c", make_record("2", "t", "2025-01-01 00:00:02"))
+    assert cache.get("c", ["t"], 10) is None
+
+
+def test_ttl_eviction():
+    cache = HistoryCache(ttl=0.01)
+    cache.fill("s", ["t"], 10, [])
+    time.sleep(0.02)
+    assert cache.get("s", ["t"], 10) is None
@@ -63,6 +63,21 @@ async def test_index_doc(jes_es, mock_client):
     )
 
 
+@pytest.mark.asyncio
+async def test_bulk_index(jes_es, mock_client):
+    mock_client.bulk.return_value = {"errors": False, "items": []}
+    res = await jes_es.bulk_index("idx", [("1", {"f": 1}), ("2", {"f": 2})])
+    assert res == 2
+    mock_client.bulk.assert_awaited_once_with(
+        body=[
+            {"index": {"_index": "idx", "_id": "1"}},
+            {"f": 1},
+            {"index": {"_index": "idx", "_id": "2"}},
+            {"f": 2},
+        ]
+    )
+
+
 @pytest.mark.asyncio
 async def test_update_doc(jes_es, mock_client):
     res = await jes_es.update("idx", "1", {"field": "new"})
@@ -141,3 +141,86 @@ async def test_full_execute_cycle(dummy_local_agent, oxy_request):
     resp = await dummy_local_agent.execute(copy.deepcopy(oxy_request))
     assert resp.state == OxyState.COMPLETED
     assert resp.output == "hello"
+
+
+@pytest.mark.asyncio
+async def test_get_history_uses_history_cache(dummy_local_agent, mas_env):
+    from oxygent.history_cache import HistoryCache
+
+    mas_env.history_cache = HistoryCache()
+    mas_env.es_client.search.return_value = {
+        "hits": {
+            "hits": [
+                {
+                    "_source": {
+                        "history_id": "h1",
+                        "trace_id": "trace_prev",
+                        "memory": '{"query": "q1", "answer": "a1"}',
+                        "create_time": "2025-01-01 00:00:01",
+                    }
+                }
+            ]
+        }
+    }
+    req = OxyRequest(
+        arguments={"query": "hello"},
+        caller="user",
+        callee="agent_tester",
+        caller_category="user",
+        current_trace_id="trace123",
+        from_trace_id="trace_prev",
+        root_trace_ids=["trace_prev"],
+    )
+    for _ in range(2):
+        memory = await dummy_local_agent._get_history(req)
+        assert [m["content"] for m in memory.to_dict_list()] == ["q1", "a1"]
+    mas_env.es_client.search.assert_awaited_once()
+    assert mas_env.history_cache.hits == 1
+
+
+@pytest.mark.asyncio
+async def test_get_history_with_summary_digest(patched_config, mas_env, oxy_request):
+    import asyncio
+
+    from oxygent.history_cache import HistoryCache
+
+    agent = LocalAgent(
+        name="agent_tester",
+        desc="Unit-Test Local Agent",
+        llm_model="mock_llm",
+        is_summarize_memory=True,
+        summary_keep_turns=1,
+    )
+    agent.set_mas(mas_env)
+    mas_env.history_cache = HistoryCache()
+
+    async def _search(index_name, body):
+        if index_name.endswith("_history"):
+            hits = [
+                {
+                    "_source": {
+                        "history_id": f"h{i}",
+                        "trace_id": "trace_prev",
+                        "memory": f'{{"query": "q{i}", "answer": "a{i}"}}',
+                        "create_time": f"2025-01-01 00:00:0{i}",
+                    }
+                }
+                for i in (3, 2, 1)
+            ]
+            return {"hits": {"hits": hits}}
+        return {"hits": {"hits": []}}
+
+    mas_env.es_client.search.side_effect = _search
+    oxy_request.callee = "agent_tester"
+    oxy_request.from_trace_id = "trace_prev"
+    oxy_request.root_trace_ids = ["trace_prev"]
+
+    memory = await agent._get_history(oxy_request)
+    assert len(memory.to_dict_list()) == 6
+    await asyncio.gather(*mas_env.background_tasks)
+    # The summary runs detached from the user request
+    assert oxy_request.latest_node_ids == []
+    assert oxy_request.parallel_dict == {}
+
+    memory = [m["content"] for m in (await agent._get_history(oxy_request)).to_dict_list()]
+    assert memory == ["Summarize our earlier conversation.", "llm-output", "q3", "a3"]
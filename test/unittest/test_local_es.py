@@ -90,3 +90,15 @@ async def test_search_term_terms_bool_sort(local_es):
 async def test_close(local_es):
     res = await local_es.close()
     assert res is True
+
+
+@pytest.mark.asyncio
+async def test_bulk_index(local_es):
+    await local_es.create_index("idx", {"mappings": {}})
+    await local_es.index("idx", "a", {"n": 0})
+    assert await local_es.bulk_index("idx", [("a", {"n": 1}), ("b", {"n": 2})]) == 2
+    res = await local_es.search("idx", {})
+    assert {hit["_id"]: hit["_source"]["n"] for hit in res["hits"]["hits"]} == {
+        "a": 1,
+        "b": 2,
+    }
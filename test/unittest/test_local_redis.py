@@ -2,6 +2,7 @@
 Unit tests for LocalRedis
 """
 
+import asyncio
 import time
 
 import pytest
@@ -65,6 +66,40 @@ async def test_rpop(redis):
     assert val3 is None
 
 
+@pytest.mark.asyncio
+async def test_brpop_is_woken_up_by_lpush(redis):
+    async def push_later():
+        await asyncio.sleep(0.05)
+        await redis.lpush("events", "e1")
+
+    producer = asyncio.create_task(push_later())
+    start = time.perf_counter()
+    assert await redis.brpop("events", timeout=5) == "e1"
+    # Delivered on the push, long before the timeout
+    assert time.perf_counter() - start < 1
+    await producer
+    assert redis._notifier._waiters == {}
+    assert redis._notifier._versions == {}
+
+
+@pytest.mark.asyncio
+async def test_notifier_forgets_unwatched_keys(redis):
+    for i in range(100):
+        await redis.lpush(f"mas_msg:app:trace{i}", "e")
+        assert await redis.brpop(f"mas_msg:app:trace{i}", timeout=1) == "e"
+    assert redis._notifier._versions == {}
+    assert redis._notifier._watchers == {}
+
+
+@pytest.mark.asyncio
+async def test_brpop_timeout(redis):
+    await redis.lpush("events", "e1")
+    assert await redis.brpop("events", timeout=0.05) == "e1"
+    start = time.perf_counter()
+    assert await redis.brpop("events", timeout=0.05) is None
+    assert time.perf_counter() - start >= 0.04
+
+
 @pytest.mark.asyncio
 async def test_expiry(redis):
     await redis.lpush("exp", "v", ex=1)
@@ -0,0 +1,247 @@
+"""
+Unit tests for LocalVectorDB
+"""
+
+import numpy as np
+import pytest
+
+from oxygent.databases.db_vector.local_vector_db import (
+    IVFIndex,
+    LocalSpace,
+    LocalVectorDB,
+)
+
+DIMENSION = 8
+
+
+def make_space_config(name, retrieval_type="FLAT", index_size=100000):
+    return {
+        "name": name,
+        "engine": {
+            "index_size": index_size,
+            "retrieval_type": retrieval_type,
+            "retrieval_param": {"metric_type": "InnerProduct", "ncentroids": 16},
+        },
+        "properties": {
+            "app_name": {"type": "string", "index": True},
+            "agent_name": {"type": "string", "index": True},
+            "tool_name": {"type": "string", "index": True},
+            "tool_desc": {"type": "string"},
+            "vector": {"dimension": DIMENSION, "type": "vector"},
+        },
+    }
+
+
+def one_hot(index):
+    vector = np.zeros(DIMENSION, dtype=np.float32)
+    vector[index] = 1.0
+    return vector
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        "oxygent.databases.db_vector.local_vector_db.Config.get_cache_save_dir",
+        lambda: str(tmp_path),
+    )
+
+    async def emb_func(texts):
+        # Each text is embedded as the one-hot vector of its last digit
+        return np.stack([one_hot(int(text[-1])) for text in texts])
+
+    return LocalVectorDB({"db_name": "test_db", "tool_space_name": "tools"}, emb_func)
+
+
+@pytest.mark.asyncio
+async def test_tool_table_and_retrieval(db):
+    tool_list = [("app", "agent", f"tool{i}", f"desc{i}") for i in range(4)]
+    await db.create_vearch_table_by_tool_list(tool_list)
+    assert await db.check_space_exist("tools")
+    assert await db.recall_by_appname("app") != []
+
+    tools = await db.tool_retrieval("query2", "app", "agent", top_k=2)
+    assert tools == ["tool2"]
+    assert await db.tool_retrieval("query2", "other_app", "agent") == []
+
+    # Recreating the table replaces the tools of the app
+    await db.create_vearch_table_by_tool_list([("app", "agent", "tool5", "desc5")])
+    assert len(await db.recall_by_appname("app")) == 1
+
+
+@pytest.mark.asyncio
+async def test_query_search_and_batch(db):
+    await db.create_space(make_space_config("docs"))
+    await db.upsert(
+        "docs",
+        [(f"id{i}", {"tool_name": f"doc{i}", "vector": one_hot(i).tolist()}) for i in range(3)],
+    )
+    res_df = await db.query_search("docs", "q1", retrieval_nums=1)
+    assert res_df["_id"].to_list() == ["id1"]
+    assert res_df["_score"].iloc[0] == pytest.approx(1.0)
+
+    batch_df = await db.query_search_batch("docs", ["q0", "q2"], retrieval_nums=1)
+    assert batch_df["tool_name"].to_list() == ["doc0", "doc2"]
+
+    # Upsert replaces a document with the same id
+    await db.upsert("docs", [("id1", {"tool_name": "new", "vector": one_hot(1).tolist()})])
+    res_df = await db.query_search("docs", "q1", retrieval_nums=1)
+    assert res_df["tool_name"].to_list() == ["new"]
+
+
+@pytest.mark.asyncio
+async def test_persistence_and_delete(db, tmp_path):
+    await db.create_space(make_space_config("docs"))
+    docs = [
+        (f"id{i}", {"app_name": f"app{i % 2}", "vector": one_hot(i).tolist()})
+        for i in range(4)
+    ]
+    await db.upsert("docs", docs)
+    await db.vearch_tools.delete_by_docid("test_db", "docs", "", "id0")
+
+    reopened = LocalVectorDB({"db_name": "test_db"}, db.emb_func)
+    res_df = await reopened.search_by_filter(
+        "docs", {"query": {"filter": [{"term": {"app_name": ["app0"]}}]}, "size": 10}
+    )
+    assert res_df["_id"].to_list() == ["id2"]
+    assert await reopened.vearch_tools.check_doc_num("", "test_db", "docs") == 3
+
+    await db.drop_space("docs")
+    assert not await db.check_space_exist("docs")
+
+
+def test_ivf_search_recall(tmp_path):
+    rng = np.random.default_rng(0)
+    vectors = rng.normal(size=(2000, DIMENSION)).astype(np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    space = LocalSpace(
+        str(tmp_path), make_space_config("docs", retrieval_type="IVFFLAT", index_size=1000)
+    )
+    space.upsert([(f"id{i}", {"vector": vector.tolist()}) for i, vector in enumerate(vectors)])
+
+    recall = 0
+    for query in vectors[:50]:
+        approx_rows, _ = space.search(query, 10, nprobe=4)
+        exact_rows, _ = space.search(query, 10, is_brute_search=True)
+        recall += len(set(approx_rows) & set(exact_rows)) / 10
+        assert approx_rows[0] == exact_rows[0]
+    assert isinstance(space.ivf_index, IVFIndex)
+    assert recall / 50 > 0.8
+
+
+@pytest.mark.asyncio
+async def test_hybrid_tool_retrieval(db):
+    tool_list = [
+        ("app", "agent", "get_weather", "Query the weather forecast 0"),
+        ("app", "agent", "book_ticket", "Book a train ticket 1"),
+        ("app", "agent", "get_time", "Get the current time 2"),
+    ]
+    await db.create_vearch_table_by_tool_list(tool_list)
+    calls = []
+    emb_func = db.emb_func
+
+    async def counting_emb_func(texts):
+        calls.append(texts)
+        return await emb_func(texts)
+
+    db.emb_func = counting_emb_func
+
+    # A named tool or a fully covered query skips the embedding call
+    assert (await db.tool_retrieval("call get_time now", "app", "agent", top_k=1)) == ["get_time"]
+    assert (await db.tool_retrieval("weather forecast", "app", "agent", top_k=1)) == ["get_weather"]
+    assert calls == []
+    assert db.tool_retrieval_stats["lexical"] == 2
+
+    # A partial lexical match is fused with the vector ranking
+    tools = await db.tool_retrieval(
+        "book a ticket for tomorrow 2", "app", "agent", top_k=2
+    )
+    assert len(calls) == 1
+    assert set(tools) == {"book_ticket", "get_time"}
+    assert db.tool_retrieval_stats["hybrid"] == 1
+
+    # Sharing only common terms with the query is not enough to be fused
+    tools = await db.tool_retrieval("get the price 2", "app", "agent", top_k=2)
+    assert tools == ["get_time"]
+
+
+@pytest.mark.asyncio
+async def test_one_word_tool_name_is_not_conclusive(db):
+    tool_list = [
+        ("app", "agent", "search", "Search the web 0"),
+        ("app", "agent", "get_weather", "Query the weather forecast 1"),
+    ]
+    await db.create_vearch_table_by_tool_list(tool_list)
+    calls = []
+    emb_func = db.emb_func
+
+    async def counting_emb_func(texts):
+        calls.append(texts)
+        return await emb_func(texts)
+
+    db.emb_func = counting_emb_func
+    tools = await db.tool_retrieval(
+        "search what the weather will be 1", "app", "agent", top_k=2
+    )
+    assert len(calls) == 1
+    assert tools[0] == "get_weather"
+
+
+@pytest.mark.asyncio
+async def test_incremental_tool_reembedding(db):
+    calls = []
+    emb_func = db.emb_func
+
+    async def counting_emb_func(texts):
+        calls.append(list(texts))
+        return await emb_func(texts)
+
+    db.emb_func = counting_emb_func
+    tool_list = [("app", "agent", f"tool{i}", f"desc{i}") for i in range(3)]
+    counts = await db.create_vearch_table_by_tool_list(tool_list)
+    assert counts == {"upserted": 3, "deleted": 0, "unchanged": 0}
+    assert len(calls) == 1
+
+    # The same tools again are neither embedded nor rewritten
+    counts = await db.create_vearch_table_by_tool_list(tool_list)
+    assert counts == {"upserted": 0, "deleted": 0, "unchanged": 3}
+    assert len(calls) == 1
+
+    # Only the changed description is embedded, and the removed tool is deleted
+    tool_list = [("app", "agent", "tool0", "desc0"), ("app", "agent", "tool1", "new4")]
+    counts = await db.create_vearch_table_by_tool_list(tool_list)
+    assert counts == {"upserted": 1, "deleted": 1, "unchanged": 1}
+    assert calls[-1] == ["new4"]
+    assert len(await db.recall_by_appname("app")) == 2
+    assert await db.tool_retrieval("query4", "app", "agent", top_k=1) == ["tool1"]
+
+
+@pytest.mark.asyncio
+async def test_failed_fingerprint_lookup_rebuilds_app_tools(db, monkeypatch):
+    tool_list = [("app", "agent", "tool1", "desc1")]
+    await db.create_vearch_table_by_tool_list(tool_list)
+    # A tool uploaded under a random ID by an older version
+    await db.upsert(
+        "tools",
+        [
+            (
+                "legacy_id",
+                {
+                    "app_name": "app",
+                    "agent_name": "agent",
+                    "tool_name": "tool1",
+                    "vector": one_hot(1).tolist(),
+                },
+            )
+        ],
+    )
+    search_by_filter = db.vearch_tools.search_by_filter
+
+    async def failing_search_by_filter(*args):
+        return {"error": {"reason": "timeout"}, "status": 500}
+
+    monkeypatch.setattr(db.vearch_tools, "search_by_filter", failing_search_by_filter)
+    counts = await db.create_vearch_table_by_tool_list(tool_list)
+    assert counts == {"upserted": 1, "deleted": 0, "unchanged": 0}
+
+    monkeypatch.setattr(db.vearch_tools, "search_by_filter", search_by_filter)
+    assert await db.recall_by_appname("app") == [db._get_tool_doc_id(*tool_list[0][:3])]
@@ -0,0 +1,98 @@
+"""
+Unit tests for the MCP tool manifest cache
+"""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from mcp.types import ListToolsResult, Tool
+
+from oxygent.config import Config
+from oxygent.oxy.mcp_tools import mcp_manifest_cache
+from oxygent.oxy.mcp_tools.mcp_tool import MCPTool
+from oxygent.oxy.mcp_tools.stdio_mcp_client import StdioMCPClient
+
+
+class DummyMAS:
+    def __init__(self):
+        self.oxy_name_to_oxy = {}
+        self.message_prefix = "msg"
+        self.name = "test_mas"
+
+    def add_oxy(self, oxy):
+        self.oxy_name_to_oxy[oxy.name] = oxy
+
+
+def make_tools_response(description="desc"):
+    return ListToolsResult(
+        tools=[Tool(name="cached_tool", description=description, inputSchema={})]
+    )
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(Config, "get_cache_save_dir", lambda: str(tmp_path))
+    return tmp_path
+
+
+@pytest.fixture
+def client():
+    client = StdioMCPClient(
+        name="stdio_client",
+        params={"command": "python", "args": ["server.py"]},
+        is_manifest_cached=True,
+        manifest_version="1",
+    )
+    client.set_mas(DummyMAS())
+    return client
+
+
+def test_save_and_load_manifest(cache_dir):
+    mcp_manifest_cache.save_manifest("key", make_tools_response())
+    tools_response = mcp_manifest_cache.load_manifest("key")
+    assert tools_response.tools[0].name == "cached_tool"
+    assert mcp_manifest_cache.load_manifest("other_key") is None
+
+
+def test_load_corrupted_manifest(cache_dir):
+    path = mcp_manifest_cache.get_manifest_path("key")
+    cache_dir.joinpath("mcp_manifest").mkdir()
+    with open(path, "w") as f:
+        f.write("{not json")
+    assert mcp_manifest_cache.load_manifest("key") is None
+
+
+def test_register_and_refresh_from_cache(cache_dir, client):
+    assert not client.register_tools_from_manifest_cache()
+
+    client.add_tools(make_tools_response())
+    fresh_client = StdioMCPClient(
+        name="stdio_client",
+        params={"command": "python", "args": ["server.py"]},
+        is_manifest_cached=True,
+        manifest_version="1",
+    )
+    fresh_client.set_mas(DummyMAS())
+    assert fresh_client.register_tools_from_manifest_cache()
+    assert fresh_client.included_tool_name_list == ["cached_tool"]
+
+    # Revalidation refreshes the registered tool instead of adding it again
+    fresh_client.add_tools(make_tools_response("new desc"))
+    assert fresh_client.included_tool_name_list == ["cached_tool"]
+    tool = fresh_client.mas.oxy_name_to_oxy["cached_tool"]
+    assert isinstance(tool, MCPTool)
+    assert tool.desc == "new desc"
+
+    # A new manifest version does not reuse the cache
+    fresh_client.manifest_version = "2"
+    assert not fresh_client.register_tools_from_manifest_cache()
+
+
+@pytest.mark.asyncio
+async def test_revalidate_keeps_cached_tools_on_error(cache_dir, client):
+    client.add_tools(make_tools_response())
+    with patch.object(
+        StdioMCPClient, "init", AsyncMock(side_effect=Exception("server down"))
+    ):
+        await client.revalidate_tools()
+    assert client.included_tool_name_list == ["cached_tool"]
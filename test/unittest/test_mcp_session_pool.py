@@ -0,0 +1,108 @@
+"""
+Unit tests for MCPSessionPool
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+
+import anyio
+import pytest
+
+from oxygent.oxy.mcp_tools.mcp_session_pool import MCPSessionPool
+
+
+class FakeSession:
+    def __init__(self, index):
+        self.index = index
+        self.is_broken = False
+        self.is_healthy = True
+        self.calls = 0
+
+    async def call_tool(self, tool_name, arguments):
+        if self.is_broken:
+            raise anyio.ClosedResourceError()
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        return f"{tool_name}:{self.index}"
+
+    async def send_ping(self):
+        if not self.is_healthy:
+            raise RuntimeError("unhealthy")
+
+
+class FakeFactory:
+    def __init__(self):
+        self.opened = []
+        self.closed = []
+
+    @asynccontextmanager
+    async def __call__(self):
+        session = FakeSession(len(self.opened))
+        self.opened.append(session)
+        try:
+            yield session
+        finally:
+            self.closed.append(session)
+
+
+@pytest.mark.asyncio
+async def test_start_warms_min_size():
+    factory = FakeFactory()
+    pool = MCPSessionPool(factory, max_size=3, min_size=2, health_check_interval=0)
+    await pool.start()
+    assert pool.size == 2
+    await pool.close()
+    assert len(factory.closed) == 2
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_are_spread_and_bounded():
+    factory = FakeFactory()
+    pool = MCPSessionPool(factory, max_size=2, min_size=0, health_check_interval=0)
+    results = await asyncio.gather(*[pool.call_tool("t", {}) for _ in range(6)])
+    assert len(results) == 6
+    assert len(factory.opened) == 2
+    assert all(session.calls == 3 for session in factory.opened)
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_broken_session_is_replaced():
+    factory = FakeFactory()
+    pool = MCPSessionPool(factory, max_size=1, min_size=1, health_check_interval=0)
+    await pool.start()
+    factory.opened[0].is_broken = True
+    assert await pool.call_tool("t", {}) == "t:1"
+    assert factory.opened[0] in factory.closed
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_reaper_closes_idle_and_unhealthy_sessions():
+    factory = FakeFactory()
+    pool = MCPSessionPool(
+        factory, max_size=3, min_size=1, idle_timeout=0, health_check_interval=0.01
+    )
+    await pool.start()
+    await asyncio.gather(*[pool.call_tool("t", {}) for _ in range(3)])
+    assert pool.size == 3
+    factory.opened[0].is_healthy = False
+    await asyncio.sleep(0.05)
+    assert pool.size == 1
+    assert factory.opened[0] in factory.closed
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_close_when_idle_waits_for_pending_calls():
+    factory = FakeFactory()
+    pool = MCPSessionPool(factory, max_size=1, min_size=1, health_check_interval=0)
+    await pool.start()
+    calls = [asyncio.create_task(pool.call_tool("t", {})) for _ in range(3)]
+    await asyncio.sleep(0)
+    await pool.close_when_idle()
+    # The running call and those waiting for the session all completed
+    assert [await call for call in calls] == ["t:0"] * 3
+    assert factory.closed == factory.opened
+    with pytest.raises(RuntimeError):
+        await pool.call_tool("t", {})
@@ -2,6 +2,7 @@
 Unit tests for MCPTool
 """
 
+import asyncio
 from unittest.mock import AsyncMock
 
 import pytest
@@ -16,6 +17,8 @@ from oxygent.schemas import OxyRequest, OxyResponse, OxyState
 class DummyMCPClient:
     def __init__(self):
         self._execute = AsyncMock()
+        self.is_dynamic_headers = False
+        self.is_inherit_headers = False
 
     async def execute_ok(self, req):
         return OxyResponse(state=OxyState.COMPLETED, output="ok", oxy_request=req)
@@ -73,3 +76,48 @@ async def test_execute_without_client_raises(oxy_request):
     bare_tool = MCPTool(name="bare", desc="no client")
     with pytest.raises(AttributeError):
         await bare_tool._execute(oxy_request)
+
+
+@pytest.mark.asyncio
+async def test_result_cache_hits_on_same_arguments(mcp_client, oxy_request):
+    tool = MCPTool(
+        name="read_tool",
+        desc="read only",
+        mcp_client=mcp_client,
+        annotations={"readOnlyHint": True},
+        is_result_cached=True,
+    )
+    await tool._execute(oxy_request)
+    resp = await tool._execute(oxy_request.model_copy(update={"arguments": {"x": 1}}))
+    assert resp.output == "ok"
+    assert resp.extra["is_result_cached"] is True
+    await tool._execute(oxy_request.model_copy(update={"arguments": {"x": 2}}))
+    assert mcp_client._execute.await_count == 2
+    assert tool.get_result_cache_stats() == {"hits": 1, "misses": 2, "size": 2}
+
+
+@pytest.mark.asyncio
+async def test_result_cache_expires_and_skips_destructive(mcp_client, oxy_request):
+    tool = MCPTool(
+        name="read_tool",
+        desc="read only",
+        mcp_client=mcp_client,
+        is_result_cached=True,
+        result_cache_ttl=0.01,
+    )
+    await tool._execute(oxy_request)
+    await asyncio.sleep(0.02)
+    await tool._execute(oxy_request)
+    assert mcp_client._execute.await_count == 2
+
+    destructive_tool = MCPTool(
+        name="delete_tool",
+        desc="destructive",
+        mcp_client=mcp_client,
+        annotations={"destructiveHint": True},
+        is_result_cached=True,
+    )
+    await destructive_tool._execute(oxy_request)
+    await destructive_tool._execute(oxy_request)
+    assert mcp_client._execute.await_count == 4
+    assert destructive_tool.get_result_cache_stats()["misses"] == 0
@@ -0,0 +1,85 @@
+"""
+Unit tests for MessageCoalescer
+"""
+
+import asyncio
+
+import pytest
+
+from oxygent.message_coalescer import MessageCoalescer, is_stream_delta
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Fixtures
+# ──────────────────────────────────────────────────────────────────────────────
+@pytest.fixture
+def sent():
+    return []
+
+
+@pytest.fixture
+def coalescer(sent):
+    async def send(message, redis_key):
+        sent.append((redis_key, message))
+
+    return MessageCoalescer(send, flush_ms=20, flush_bytes=10)
+
+
+def delta(text, **extra):
+    return {"type": "stream", "content": {"delta": text}, **extra}
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Tests
+# ──────────────────────────────────────────────────────────────────────────────
+def test_is_stream_delta():
+    assert is_stream_delta(delta("a"))
+    assert not is_stream_delta({"type": "answer", "content": "a"})
+    assert not is_stream_delta({"type": "stream", "content": {"delta": "a", "x": 1}})
+    assert not is_stream_delta("text")
+
+
+@pytest.mark.asyncio
+async def test_deltas_are_merged_within_the_window(coalescer, sent):
+    for text in ["He", "ll", "o"]:
+        await coalescer.add(delta(text), "k1")
+    await coalescer.add(delta("x"), "k2")
+    assert sent == []
+
+    await asyncio.sleep(0.05)
+    assert sorted(sent, key=lambda item: item[0]) == [
+        ("k1", delta("Hello")),
+        ("k2", delta("x")),
+    ]
+    assert coalescer.received_count == 4
+    assert coalescer.sent_count == 2
+
+
+@pytest.mark.asyncio
+async def test_byte_threshold_flushes_at_once(coalescer, sent):
+    await coalescer.add(delta("12345"), "k")
+    await coalescer.add(delta("67890"), "k")
+    assert sent == [("k", delta("1234567890"))]
+
+    # The timer of the flushed deltas does not send them again
+    await asyncio.sleep(0.05)
+    assert len(sent) == 1
+
+
+@pytest.mark.asyncio
+async def test_other_messages_keep_their_order(coalescer, sent):
+    await coalescer.add(delta("a", agent="x"), "k")
+    await coalescer.add(delta("b", agent="y"), "k")
+    await coalescer.add({"event": "close", "data": "done"}, "k")
+    assert [message for _, message in sent] == [
+        delta("a", agent="x"),
+        delta("b", agent="y"),
+        {"event": "close", "data": "done"},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_close_flushes_pending_deltas(coalescer, sent):
+    await coalescer.add(delta("a"), "k")
+    await coalescer.close()
+    assert sent == [("k", delta("a"))]
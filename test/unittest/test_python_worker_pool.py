@@ -0,0 +1,77 @@
+"""
+Unit tests for PythonWorkerPool and PythonKernelManager
+"""
+
+import os
+import time
+
+import pytest
+
+from oxygent.utils.python_worker_pool import PythonKernelManager, PythonWorkerPool
+
+
+@pytest.fixture(scope="module")
+def pool():
+    pool = PythonWorkerPool(pool_size=1, timeout=2, cpu_time_limit=1)
+    yield pool
+    pool.close()
+
+
+def test_run_captures_stdout_and_timing(pool):
+    result = pool.run(
+        "def double(x):\n    return x * factor\nfactor = 2\nprint(double(21))",
+        variable_to_return="factor",
+    )
+    assert result["is_success"]
+    assert result["output"] == "2"
+    assert result["stdout"] == "42\n"
+    assert {"elapsed", "exec_time", "cpu_time"} <= result.keys()
+
+
+def test_run_is_isolated(pool):
+    result = pool.run("import os\npid = os.getpid()", variable_to_return="pid")
+    assert result["output"] != str(os.getpid())
+    # Names do not leak between calls
+    assert pool.run("x = 1")["is_success"]
+    assert "not defined" in pool.run("y = x")["error"]
+
+
+def test_timeout_replaces_worker(pool):
+    result = pool.run("import time\ntime.sleep(10)")
+    assert not result["is_success"]
+    assert "timed out" in result["error"]
+    assert pool.run("z = 3", variable_to_return="z")["output"] == "3"
+
+
+def test_cpu_time_limit():
+    pool = PythonWorkerPool(pool_size=1, timeout=10, cpu_time_limit=1)
+    result = pool.run("while True:\n    pass")
+    assert not result["is_success"]
+    assert "CPU time limit" in result["error"]
+    assert pool.run("z = 4", variable_to_return="z")["output"] == "4"
+    pool.close()
+
+
+def test_unpicklable_globals_are_rejected(pool):
+    with pytest.raises(ValueError):
+        pool.run("x = 1", safe_globals={"f": lambda: 1})
+
+
+def test_kernel_keeps_state_and_evicts():
+    manager = PythonKernelManager(max_kernels=1, ttl=0.2, timeout=5)
+    assert manager.run("k1", "df = [1, 2, 3]")["is_success"]
+    assert manager.run("k1", "total = sum(df)", "total")["output"] == "6"
+    # Starting a second kernel evicts the least recently used one
+    assert "not defined" in manager.run("k2", "y = df")["error"]
+    assert "not defined" in manager.run("k1", "y = df")["error"]
+    time.sleep(0.5)
+    assert manager.size == 0
+    manager.close()
+
+
+def test_kernel_restarts_over_memory_limit():
+    manager = PythonKernelManager(kernel_memory_limit=1, timeout=5)
+    result = manager.run("k", "x = 1")
+    assert result["is_kernel_restarted"]
+    assert manager.size == 0
+    manager.close()
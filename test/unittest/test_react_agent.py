@@ -2,6 +2,7 @@
 Unit tests for ReActAgent
 """
 
+import asyncio
 import json
 from unittest.mock import AsyncMock
 
@@ -150,3 +151,235 @@ async def test_execute_trust_mode(react_agent, oxy_request):
 async def test_permitted_tool_list(react_agent):
     await react_agent.init()
     assert "dummy_tool" in react_agent.permitted_tool_name_list
+
+
+@pytest.mark.asyncio
+async def test_repeated_tool_calls_are_memoized_and_stop_early(
+    patched_config, mas_env, monkeypatch
+):
+    agent = ReActAgent(
+        name="react_agent",
+        desc="UT ReAct Agent",
+        tools=["dummy_tool"],
+        llm_model="mock_llm",
+        is_memoize_tool_calls=True,
+        max_no_progress_rounds=2,
+    )
+    agent.set_mas(mas_env)
+    mas_env.oxy_name_to_oxy["dummy_tool"].is_read_only = True
+    calls = {"mock_llm": 0, "dummy_tool": 0}
+
+    async def _fake_call(self, *, callee: str, arguments: dict, **kwargs):
+        calls[callee] += 1
+        if callee == "mock_llm":
+            if "Tool execution results" in str(arguments["messages"]):
+                output = "final answer"
+            else:
+                output = json.dumps({"tool_name": "dummy_tool", "arguments": {"a": 1}})
+            return OxyResponse(state=OxyState.COMPLETED, output=output)
+        return OxyResponse(state=OxyState.COMPLETED, output="tool-exec-ok")
+
+    monkeypatch.setattr("oxygent.schemas.OxyRequest.call", _fake_call, raising=True)
+    req = OxyRequest(
+        arguments={"query": "hello"},
+        caller="user",
+        caller_category="user",
+        current_trace_id="trace123",
+    )
+    result = await agent.execute(req)
+    assert result.output == "final answer"
+    assert calls["dummy_tool"] == 1
+    # 3 ReAct rounds (1 new + 2 repeats) and 1 forced final-answer round
+    assert calls["mock_llm"] == 4
+
+
+@pytest.mark.asyncio
+async def test_polling_with_new_observations_is_not_stopped(
+    patched_config, mas_env, monkeypatch
+):
+    agent = ReActAgent(
+        name="react_agent",
+        desc="UT ReAct Agent",
+        tools=["dummy_tool"],
+        llm_model="mock_llm",
+        max_no_progress_rounds=2,
+    )
+    agent.set_mas(mas_env)
+    calls = {"mock_llm": 0, "dummy_tool": 0}
+
+    async def _fake_call(self, *, callee: str, arguments: dict, **kwargs):
+        calls[callee] += 1
+        if callee == "mock_llm":
+            if "job done" in str(arguments["messages"]):
+                output = "final answer"
+            else:
+                output = json.dumps({"tool_name": "dummy_tool", "arguments": {"a": 1}})
+            return OxyResponse(state=OxyState.COMPLETED, output=output)
+        if calls["dummy_tool"] == 4:
+            return OxyResponse(state=OxyState.COMPLETED, output="job done")
+        queue_depth = 4 - calls["dummy_tool"]
+        return OxyResponse(state=OxyState.COMPLETED, output=f"queue {queue_depth}")
+
+    monkeypatch.setattr("oxygent.schemas.OxyRequest.call", _fake_call, raising=True)
+    req = OxyRequest(
+        arguments={"query": "hello"},
+        caller="user",
+        caller_category="user",
+        current_trace_id="trace123",
+    )
+    result = await agent.execute(req)
+    # The tool calls repeat, but every poll observes new data
+    assert result.output == "final answer"
+    assert calls["dummy_tool"] == 4
+
+
+@pytest.mark.asyncio
+async def test_memoization_is_limited_to_read_only_tools(react_agent, monkeypatch):
+    calls = []
+
+    async def _fake_call(self, *, callee: str, arguments: dict, **kwargs):
+        calls.append(callee)
+        return OxyResponse(state=OxyState.COMPLETED, output=f"{callee}-{len(calls)}")
+
+    monkeypatch.setattr("oxygent.schemas.OxyRequest.call", _fake_call, raising=True)
+    req = OxyRequest(arguments={"query": "hello"}, caller="user")
+    tool_call_dict = {"tool_name": "dummy_tool", "arguments": {}}
+    ledger = react_agent._get_tool_call_ledger("trace123")
+
+    # Off by default
+    await react_agent._call_tool(req, tool_call_dict, "p", ledger)
+    await react_agent._call_tool(req, tool_call_dict, "p", ledger)
+    assert len(calls) == 2
+
+    # Tools with side effects are always called again
+    react_agent.is_memoize_tool_calls = True
+    await react_agent._call_tool(req, tool_call_dict, "p", ledger)
+    assert len(calls) == 3
+
+    react_agent.mas.oxy_name_to_oxy["dummy_tool"].is_read_only = True
+    first = await react_agent._call_tool(req, tool_call_dict, "p", ledger)
+    # The ledger is shared by every execution within the trace
+    same_trace_ledger = react_agent._get_tool_call_ledger("trace123")
+    second = await react_agent._call_tool(req, tool_call_dict, "p", same_trace_ledger)
+    assert second is first
+    assert len(calls) == 4
+    assert react_agent._get_tool_call_ledger("other_trace") == {}
+
+
+def test_tool_call_key_is_canonical(react_agent):
+    key_a = react_agent._get_tool_call_key(
+        {"tool_name": "t", "arguments": {"a": 1, "b": 2}}
+    )
+    key_b = react_agent._get_tool_call_key(
+        {"tool_name": "t", "arguments": {"b": 2, "a": 1}}
+    )
+    assert key_a == key_b
+
+
+def test_parse_tool_call_dag(react_agent):
+    resp = react_agent._parse_llm_response(
+        json.dumps(
+            {
+                "tool_calls": [
+                    {"id": "a", "tool_name": "dummy_tool", "arguments": {}},
+                    {
+                        "id": "b",
+                        "tool_name": "dummy_tool",
+                        "arguments": {"x": {"$ref": "a"}},
+                    },
+                ]
+            }
+        )
+    )
+    assert resp.state is LLMState.TOOL_CALL
+    assert [call["id"] for call in resp.output] == ["a", "b"]
+
+
+@pytest.mark.parametrize(
+    "tool_calls",
+    [
+        [{"id": "a", "tool_name": "t", "arguments": {"x": {"$ref": "b"}}}],
+        [
+            {"id": "a", "tool_name": "t", "arguments": {"x": {"$ref": "b"}}},
+            {"id": "b", "tool_name": "t", "arguments": {"x": {"$ref": "a"}}},
+        ],
+        [{"id": "a", "tool_name": "t"}, {"id": "a", "tool_name": "t"}],
+    ],
+)
+def test_check_tool_call_dag_rejects_invalid(react_agent, tool_calls):
+    assert react_agent._check_tool_call_dag(tool_calls) is not None
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "tool_calls",
+    [
+        [{"id": "a", "tool_name": "t", "arguments": {"x": {"$ref": "a"}}}],
+        [
+            {"id": "a", "tool_name": "t", "arguments": {"x": {"$ref": "b"}}},
+            {"id": "b", "tool_name": "t", "arguments": {"x": {"$ref": "a"}}},
+        ],
+    ],
+)
+async def test_call_tool_dag_rejects_cycles(react_agent, monkeypatch, tool_calls):
+    call = AsyncMock()
+    monkeypatch.setattr("oxygent.schemas.OxyRequest.call", call, raising=True)
+    req = OxyRequest(arguments={"query": "hello"}, caller="user")
+    responses = await asyncio.wait_for(
+        react_agent._call_tool_dag(req, tool_calls, "p", dict()), timeout=1
+    )
+    assert [r.state for r in responses] == [OxyState.FAILED] * len(tool_calls)
+    assert "circular references" in responses[0].output
+    call.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_call_tool_dag_resolves_refs(react_agent, monkeypatch):
+    received = {}
+
+    async def _fake_call(self, *, callee: str, arguments: dict, **kwargs):
+        received[callee] = arguments
+        if callee == "read":
+            return OxyResponse(state=OxyState.COMPLETED, output="file content")
+        if callee == "broken":
+            return OxyResponse(state=OxyState.FAILED, output="error")
+        return OxyResponse(state=OxyState.COMPLETED, output="done")
+
+    monkeypatch.setattr("oxygent.schemas.OxyRequest.call", _fake_call, raising=True)
+    req = OxyRequest(arguments={"query": "hello"}, caller="user")
+    responses = await react_agent._call_tool_dag(
+        req,
+        [
+            {"id": "r", "tool_name": "read", "arguments": {}},
+            {"id": "c", "tool_name": "compute", "arguments": {"text": {"$ref": "r"}}},
+            {"id": "x", "tool_name": "broken", "arguments": {}},
+            {"tool_name": "after_broken", "arguments": {"v": [{"$ref": "x"}]}},
+        ],
+        "parallel_id",
+        dict(),
+    )
+    assert received["compute"] == {"text": "file content"}
+    assert "after_broken" not in received
+    assert [r.state for r in responses] == [
+        OxyState.COMPLETED,
+        OxyState.COMPLETED,
+        OxyState.FAILED,
+        OxyState.SKIPPED,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_call_tool_dag_without_arguments(react_agent, monkeypatch):
+    received = {}
+
+    async def _fake_call(self, *, callee: str, arguments: dict, **kwargs):
+        received[callee] = arguments
+        return OxyResponse(state=OxyState.COMPLETED, output="done")
+
+    monkeypatch.setattr("oxygent.schemas.OxyRequest.call", _fake_call, raising=True)
+    tool_calls = [{"id": "a", "tool_name": "no_args"}]
+    assert react_agent._check_tool_call_dag(tool_calls) is None
+    req = OxyRequest(arguments={"query": "hello"}, caller="user")
+    responses = await react_agent._call_tool_dag(req, tool_calls, "p", dict())
+    assert responses[0].state is OxyState.COMPLETED
+    assert received == {"no_args": {}}
@@ -117,3 +117,23 @@ async def test_init_failure_cleanup(mas_env, sse_client_patch):
     with pytest.raises(Exception):
         await bad.init()
     assert bad._session is None
+
+
+@pytest.mark.asyncio
+async def test_execute_reuses_pool_per_header_set(
+    client, oxy_request, session_patch, sse_client_patch
+):
+    client.pool_size = 2
+    client.is_dynamic_headers = True
+    oxy_request.callee = "tool_x"
+
+    for user in ["a", "a", "b"]:
+        oxy_request.shared_data["headers"] = {"user": user}
+        resp: OxyResponse = await client._execute(oxy_request)
+        assert resp.state is OxyState.COMPLETED
+
+    assert len(client._session_pools) == 2
+    # One connection per header set, reused by the second call of user "a"
+    assert sse_client_patch.call_count == 2
+    await client.cleanup()
+    assert len(client._session_pools) == 0
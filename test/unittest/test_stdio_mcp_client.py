@@ -158,3 +158,22 @@ async def test_init_missing_file_raises(which_patch, mas_env):
     ):
         with pytest.raises(FileNotFoundError):
             await bad.init()
+
+
+@pytest.mark.asyncio
+async def test_execute_with_session_pool(stdio_client, session_patch, oxy_request):
+    stdio_client.pool_size = 2
+    with patch(
+        "oxygent.oxy.mcp_tools.stdio_mcp_client.os.path.exists", return_value=True
+    ):
+        await stdio_client.init()
+
+    assert stdio_client._session is None
+    assert stdio_client._session_pool.size == 1
+    assert "stdio_tool" in stdio_client.included_tool_name_list
+
+    oxy_request.callee = "stdio_tool"
+    resp: OxyResponse = await stdio_client._execute(oxy_request)
+    assert resp.output == "pong"
+    await stdio_client.cleanup()
+    assert stdio_client._session_pool is None
@@ -43,3 +43,20 @@ async def test_with_others():
     code = "flag = True"
     output = await run_python_code(code, variable_to_return="flag")
     assert output == "True"
+
+
+@pytest.mark.asyncio
+async def test_kernel_keeps_variables(monkeypatch):
+    from oxygent.config import Config
+    from oxygent.schemas import OxyRequest
+
+    monkeypatch.setattr(Config, "get_python_sandbox_is_kernel_enabled", lambda: True)
+    oxy_request = OxyRequest(
+        caller="tester", caller_category="agent", current_trace_id="kernel_trace"
+    )
+    await run_python_code("rows = [1, 2, 3]", oxy_request=oxy_request)
+    response = await run_python_code(
+        "total = sum(rows)", variable_to_return="total", oxy_request=oxy_request
+    )
+    assert response.output == "6"
+    assert "elapsed" in response.extra
@@ -0,0 +1,143 @@
+"""
+Unit tests for VearchDB against a local HTTP stub of the Vearch router
+"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+import pytest
+
+from oxygent.databases.db_vector.vearch_db import VearchDB, close_http_client
+
+DIMENSION = 4
+
+
+class StubVearchHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def _read_body(self):
+        if self.headers.get("Transfer-Encoding") == "chunked":
+            self.server.chunked_requests += 1
+            body = b""
+            while True:
+                size = int(self.rfile.readline().strip(), 16)
+                if size == 0:
+                    self.rfile.readline()
+                    return body
+                body += self.rfile.read(size)
+                self.rfile.readline()
+        return self.rfile.read(int(self.headers.get("Content-Length", 0)))
+
+    def _reply(self, payload):
+        data = json.dumps(payload).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_POST(self):
+        server = self.server
+        body = self._read_body()
+        server.client_ports.add(self.client_address[1])
+        if self.path.endswith("/_search"):
+            with server.lock:
+                server.in_flight += 1
+                server.max_in_flight = max(server.max_in_flight, server.in_flight)
+            time.sleep(0.05)
+            with server.lock:
+                server.in_flight -= 1
+            feature = json.loads(body)["query"]["sum"][0]["feature"]
+            hit = {"_id": f"id{int(np.argmax(feature))}", "_score": 1.0, "_source": {}}
+            self._reply({"hits": {"total": 1, "hits": [hit]}})
+        elif self.path.endswith("/_bulk"):
+            server.bulk_bodies.append(body.decode("utf-8"))
+            self._reply({"code": 0})
+        elif self.path.endswith("/_delete_by_query"):
+            server.delete_queries.append(json.loads(body))
+            self._reply({"code": 0})
+        else:
+            self.send_error(404)
+
+
+@pytest.fixture
+def router_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubVearchHandler)
+    server.lock = threading.Lock()
+    server.in_flight = server.max_in_flight = server.chunked_requests = 0
+    server.client_ports = set()
+    server.bulk_bodies = []
+    server.delete_queries = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}", server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def db(router_url):
+    url, _ = router_url
+
+    async def emb_func(texts):
+        # Each text is embedded as the one-hot vector of its last digit
+        return np.stack([np.eye(DIMENSION)[int(text[-1])] for text in texts])
+
+    db = VearchDB(
+        {
+            "db_name": "test_db",
+            "tool_space_name": "tools",
+            "master_url": url,
+            "router_url": url,
+        }
+    )
+    db.emb_func = emb_func
+    return db
+
+
+@pytest.mark.asyncio
+async def test_query_search_batch_is_concurrent_and_ordered(db, router_url):
+    _, server = router_url
+    queries = [f"q{i % DIMENSION}" for i in range(8)]
+    res_df = await db.query_search_batch("docs", queries, 1, max_concurrency=4)
+    await close_http_client()
+
+    assert res_df["_id"].to_list() == [f"id{i % DIMENSION}" for i in range(8)]
+    assert 1 < server.max_in_flight <= 4
+    # The pooled client reuses its connections
+    assert len(server.client_ports) <= 4
+    assert db.latency_stats["query_search"]["count"] == 8
+    assert db.latency_stats["query_search_batch"]["count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_upsert_streams_chunks(db, router_url):
+    _, server = router_url
+    docs = ((f"id{i}", {"vector": np.ones(DIMENSION) * i}) for i in range(5))
+    assert await db.upsert("docs", docs, chunk_size=2) == 5
+    await close_http_client()
+
+    assert server.chunked_requests == 3
+    lines = [json.loads(line) for body in server.bulk_bodies for line in body.splitlines()]
+    actions = sorted(line["index"]["_id"] for line in lines[0::2])
+    assert actions == [f"id{i}" for i in range(5)]
+    assert all(len(line["vector"]["feature"]) == DIMENSION for line in lines[1::2])
+    assert db.latency_stats["bulk_upsert_chunk"]["count"] == 3
+
+
+@pytest.mark.asyncio
+async def test_delete_by_appname_uses_one_filter_request(db, router_url):
+    _, server = router_url
+    await db.delete_by_appname("app")
+    await db.close()
+
+    assert server.delete_queries == [
+        {"query": {"filter": [{"term": {"app_name": ["app"]}}]}}
+    ]
+    assert db.latency_stats["delete_by_filter"]["max_ms"] > 0